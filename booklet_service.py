@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Local HTTP service that builds signatures with booklet_signatures_enhanced.py.
+
+Examples:
+    python booklet_signatures.py serve --port 8765 --workers 2 --queue-depth 4
+
+    or, the same, python booklet_service.py --port 8765 --workers 2. POST
+    PDFs to /impose (multipart form, options as form fields or query
+    parameters such as layout_mode=imposed) to get a zip of signatures back,
+    and GET /metrics for queue and latency figures.
+
+    BookletServiceClient("http://127.0.0.1:8765").impose([...])
+
+    talks to it from Python, using only the standard library.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import multiprocessing
+import secrets
+import signal
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+from typing import IO, Any, Sequence
+
+from booklet_signatures_enhanced import (
+    PLAN_FORMATS,
+    BookletEngine,
+    BookletError,
+    OutputOptimization,
+    parse_args,
+    parse_byte_size,
+    run_cli,
+)
+
+# Options a /impose request may set, as form fields or query parameters.
+SERVICE_OPTIONS = (
+    "base_name",
+    "sheets_per_signature",
+    "auto_signature",
+    "min_sheets_per_signature",
+    "max_sheets_per_signature",
+    "output_mode",
+    "tail_mode",
+    "final_blank_placement",
+    "layout_mode",
+    "pages_per_side",
+    "imposition_method",
+    "copies",
+    "gang",
+    "optimize_output",
+    "compress_level",
+    "plan_format",
+)
+
+
+def parse_serve_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="booklet_signatures.py serve",
+        description="Run a local HTTP service that turns uploaded PDFs into a zip of signature PDFs.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (0 picks a free port).")
+    parser.add_argument("--workers", type=int, default=2, help="Worker processes that build books.")
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=8,
+        help="Requests allowed to wait for a free worker. Further requests get 429 Too Many Requests.",
+    )
+    parser.add_argument(
+        "--max-request-size",
+        type=parse_byte_size,
+        default=parse_byte_size("512M"),
+        metavar="SIZE",
+        help="Largest accepted request body, e.g. 512M or 2G.",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.queue_depth < 0:
+        parser.error("--queue-depth must not be negative")
+    return args
+
+
+def service_build_options(options: dict[str, str]) -> dict[str, Any]:
+    unknown = sorted(set(options) - set(SERVICE_OPTIONS))
+    if unknown:
+        raise BookletError(f"Unknown options: {', '.join(unknown)}")
+    argv = ["--inputs", "upload.pdf", "--output-folder", "."]
+    for key, value in options.items():
+        flag = "--" + key.replace("_", "-")
+        if key in ("auto_signature", "gang", "optimize_output"):
+            if value.lower() not in ("", "0", "false", "no", "off"):
+                argv.append(flag)
+        else:
+            argv.extend([flag, value])
+    try:
+        args = parse_args(argv)
+    except SystemExit:
+        raise BookletError(f"Invalid options: {options}") from None
+    return {
+        "base_name": args.base_name,
+        "output_mode": args.output_mode,
+        "layout_mode": args.layout_mode,
+        "pages_per_side": args.pages_per_side,
+        "sheets_per_signature": args.sheets_per_signature,
+        "tail_mode": args.tail_mode,
+        "final_blank_placement": args.final_blank_placement,
+        "auto_signature": args.auto_signature,
+        "min_sheets_per_signature": args.min_sheets_per_signature,
+        "max_sheets_per_signature": args.max_sheets_per_signature,
+        "imposition_method": args.imposition_method,
+        "copies": args.copies,
+        "gang": args.gang,
+        "optimization": OutputOptimization(optimize=args.optimize_output, compress_level=args.compress_level),
+        "plan_format": args.plan_format,
+    }
+
+
+# Per-process engine for serve workers, so inputs shared between requests
+# are parsed once per worker.
+_service_engine: BookletEngine | None = None
+
+
+def _run_service_job(uploads: list[tuple[str, bytes]], build_options: dict[str, Any]) -> tuple[bytes, int]:
+    global _service_engine
+    if _service_engine is None:
+        _service_engine = BookletEngine()
+    inputs: list[IO[bytes]] = []
+    for name, data in uploads:
+        stream = BytesIO(data)
+        stream.name = name  # type: ignore[attr-defined]
+        inputs.append(stream)
+    build = _service_engine.build(inputs, **build_options)
+    plan_suffix, _ = PLAN_FORMATS[build_options["plan_format"]]
+    archive = BytesIO()
+    # The PDFs are compressed already, so they are stored as they are.
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as bundle:
+        for name, pdf in build.outputs.items():
+            bundle.writestr(name, pdf.getvalue())
+        bundle.writestr(f"{build_options['base_name']}_signature_plan{plan_suffix}", build.plan)
+    return archive.getvalue(), sum(table.plan.real_pages for table in build.tables)
+
+
+class ServiceMetrics:
+    """
+    Counters and recent latencies for /metrics.
+
+    Throughput and percentiles cover the last ``window`` completed jobs;
+    pages_per_second counts pages finished in the last minute.
+    """
+
+    def __init__(self, workers: int, window: int = 1000) -> None:
+        self.workers = workers
+        self.started = time.monotonic()
+        self.in_flight = 0
+        self.counts = {"accepted": 0, "rejected": 0, "completed": 0, "failed": 0}
+        self.recent: deque[tuple[float, float, int]] = deque(maxlen=window)  # finished, seconds, pages
+        self._lock = threading.Lock()
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counts[name] += 1
+
+    def begin(self) -> None:
+        with self._lock:
+            self.counts["accepted"] += 1
+            self.in_flight += 1
+
+    def end(self, seconds: float, pages: int | None) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if pages is None:
+                self.counts["failed"] += 1
+            else:
+                self.counts["completed"] += 1
+                self.recent.append((time.monotonic(), seconds, pages))
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            latencies = sorted(seconds for _, seconds, _ in self.recent)
+            last_minute = sum(pages for finished, _, pages in self.recent if now - finished <= 60)
+            uptime = now - self.started
+            return {
+                "uptime_seconds": round(uptime, 3),
+                "workers": self.workers,
+                "running": min(self.in_flight, self.workers),
+                "queue_length": max(0, self.in_flight - self.workers),
+                **{f"requests_{name}": value for name, value in self.counts.items()},
+                "pages_per_second": round(last_minute / min(60.0, max(uptime, 1e-9)), 2),
+                "latency_seconds": {
+                    f"p{percentile}": percentile_of(latencies, percentile) for percentile in (50, 90, 99)
+                },
+            }
+
+
+def percentile_of(values: Sequence[float], percentile: int) -> float | None:
+    # Nearest-rank percentile of already sorted values.
+    if not values:
+        return None
+    rank = max(1, math.ceil(percentile / 100 * len(values)))
+    return round(values[rank - 1], 4)
+
+
+class BookletService:
+    """
+    The work behind the HTTP handler: a bounded process pool plus admission
+    control. At most workers + queue_depth requests are admitted; the rest
+    are turned away so a burst never piles up unbounded uploads in memory.
+    """
+
+    def __init__(self, workers: int, queue_depth: int, max_request_size: int) -> None:
+        self.max_request_size = max_request_size
+        self.metrics = ServiceMetrics(workers)
+        # Spawned rather than forked workers, so they never inherit the
+        # listening socket and keep the port open after the server stops.
+        self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+
+    def try_admit(self) -> bool:
+        if self._slots.acquire(blocking=False):
+            self.metrics.begin()
+            return True
+        self.metrics.count("rejected")
+        return False
+
+    def withdraw(self) -> None:
+        # An admitted request that never reached the pool.
+        self.metrics.end(0.0, None)
+        self._slots.release()
+
+    def run(self, uploads: list[tuple[str, bytes]], build_options: dict[str, Any]) -> bytes:
+        # Only called after try_admit() succeeded.
+        started = time.perf_counter()
+        pages: int | None = None
+        try:
+            archive, pages = self.pool.submit(_run_service_job, uploads, build_options).result()
+            return archive
+        finally:
+            self.metrics.end(time.perf_counter() - started, pages)
+            self._slots.release()
+
+    def close(self) -> None:
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+
+class BookletHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: BookletService) -> None:
+        super().__init__(address, BookletRequestHandler)
+        self.service = service
+
+
+class BookletRequestHandler(BaseHTTPRequestHandler):
+    server: BookletHTTPServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        path = urllib.parse.urlsplit(self.path).path
+        if path == "/metrics":
+            self.send_body(200, json.dumps(self.server.service.metrics.snapshot(), indent=2).encode("utf-8"))
+        else:
+            self.send_body(404, b"Not found\n", "text/plain")
+
+    def do_POST(self) -> None:
+        url = urllib.parse.urlsplit(self.path)
+        if url.path != "/impose":
+            self.send_body(404, b"Not found\n", "text/plain")
+            return
+        service = self.server.service
+        length = self.headers.get("Content-Length")
+        if length is None or not length.isdigit():
+            self.send_error_text(411, "Content-Length is required.")
+            return
+        if int(length) > service.max_request_size:
+            self.send_error_text(413, f"Request body is larger than {service.max_request_size} bytes.")
+            return
+        # Admission happens before the body is read, so a saturated server
+        # does not buffer uploads it is going to refuse.
+        if not service.try_admit():
+            self.send_error_text(429, "All workers are busy and the queue is full; retry later.", retry_after=1)
+            return
+        try:
+            body = self.rfile.read(int(length))
+            options = dict(urllib.parse.parse_qsl(url.query))
+            uploads = parse_uploads(self.headers.get("Content-Type", ""), body, options)
+            build_options = service_build_options(options)
+        except (BookletError, UnicodeDecodeError) as exc:
+            service.withdraw()
+            self.send_error_text(400, str(exc))
+            return
+        try:
+            archive = service.run(uploads, build_options)
+        except BookletError as exc:
+            self.send_error_text(422, str(exc))
+            return
+        except Exception as exc:
+            self.send_error_text(500, f"{type(exc).__name__}: {exc}")
+            return
+        filename = f"{build_options['base_name']}_signatures.zip"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Disposition", f'attachment; filename="{filename}"')
+        self.send_header("Content-Length", str(len(archive)))
+        self.end_headers()
+        view = memoryview(archive)
+        for start in range(0, len(view), 1 << 16):
+            self.wfile.write(view[start : start + (1 << 16)])
+
+    def send_body(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_text(self, status: int, message: str, retry_after: int | None = None) -> None:
+        body = (message + "\n").encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if retry_after is not None:
+            self.send_header("Retry-After", str(retry_after))
+        # The body may not have been read, so the connection cannot be reused.
+        self.send_header("Connection", "close")
+        self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def parse_uploads(content_type: str, body: bytes, options: dict[str, str]) -> list[tuple[str, bytes]]:
+    # Form fields without a file name are options and are added to `options`.
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type == "application/pdf":
+        return [(options.pop("name", "upload.pdf"), body)]
+    if media_type != "multipart/form-data":
+        raise BookletError("Send the PDFs as multipart/form-data, or one PDF as application/pdf.")
+    message = BytesParser(policy=HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + body)
+    uploads: list[tuple[str, bytes]] = []
+    for part in message.iter_parts():
+        filename = part.get_filename()
+        payload = part.get_payload(decode=True) or b""
+        if filename:
+            uploads.append((Path(filename).name, payload))
+        elif part.get_param("name", header="content-disposition"):
+            options[str(part.get_param("name", header="content-disposition"))] = payload.decode("utf-8")
+    if not uploads:
+        raise BookletError("The request contains no PDF files.")
+    return uploads
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    service = BookletService(args.workers, args.queue_depth, args.max_request_size)
+    server = BookletHTTPServer((args.host, args.port), service)
+    host, port = server.server_address[:2]
+    print(f"Serving on http://{host}:{port} with {args.workers} workers (Ctrl+C to stop).")
+    sys.stdout.flush()
+
+    def stop(signum: int, frame: object) -> None:
+        # shutdown() waits for serve_forever() to return, which runs in this
+        # (the signal handling) thread, so it is called from another one.
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    previous_handler = None
+    if threading.current_thread() is threading.main_thread():
+        previous_handler = signal.signal(signal.SIGTERM, stop)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print("Stopping.")
+        server.server_close()
+        service.close()
+        if previous_handler is not None:
+            signal.signal(signal.SIGTERM, previous_handler)
+    return 0
+
+
+class BookletServiceClient:
+    """
+    Minimal client for the serve subcommand, using only the standard library.
+    """
+
+    def __init__(self, base_url: str = "http://127.0.0.1:8765", timeout: float = 600.0) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def impose(self, inputs: Sequence[str | Path], **options: Any) -> bytes:
+        boundary = secrets.token_hex(16)
+        body = BytesIO()
+        for key, value in options.items():
+            value = ("1" if value else "0") if isinstance(value, bool) else str(value)
+            body.write(f'--{boundary}\r\nContent-Disposition: form-data; name="{key}"\r\n\r\n{value}\r\n'.encode())
+        for item in inputs:
+            path = Path(item)
+            body.write(
+                f'--{boundary}\r\nContent-Disposition: form-data; name="inputs"; filename="{path.name}"\r\n'
+                "Content-Type: application/pdf\r\n\r\n".encode()
+            )
+            body.write(path.read_bytes())
+            body.write(b"\r\n")
+        body.write(f"--{boundary}--\r\n".encode())
+        request = urllib.request.Request(
+            f"{self.base_url}/impose",
+            data=body.getvalue(),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+            method="POST",
+        )
+        return self._send(request)
+
+    def metrics(self) -> dict[str, Any]:
+        return json.loads(self._send(urllib.request.Request(f"{self.base_url}/metrics")))
+
+    def _send(self, request: urllib.request.Request) -> bytes:
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.read()
+        except urllib.error.HTTPError as exc:
+            raise BookletError(f"Service answered {exc.code}: {exc.read().decode('utf-8', 'replace').strip()}") from exc
+        except urllib.error.URLError as exc:
+            raise BookletError(f"Could not reach {self.base_url}: {exc.reason}") from exc
+
+
+def main(argv: Sequence[str]) -> int:
+    return run_cli(lambda: run_serve(parse_serve_args(argv)))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+"""
+Benchmark booklet_signatures_enhanced.py against a synthetic PDF corpus.
+
+The corpus is generated locally with pypdf, so no sample books are needed:
+
+- text         : pages of plain Helvetica text
+- vector       : pages of dense line art (thousands of path segments)
+- images       : one large embedded RGB image per page
+- mixed-sizes  : text pages cycling through A5, A4, US Letter and landscape A5
+
+Every corpus file is run through every combination of --layout-mode,
+--output-mode and --tail-mode, once per option variant that applies to it:
+
+- plain        : no further options
+- xobject      : --imposition-method xobject (imposed layouts)
+- optimized    : --optimize-output
+- max-memory   : --max-memory 64M (--output-mode single)
+- copies       : --copies 2 (imposed layouts)
+- gang         : --gang (imposed layouts, --output-mode single)
+
+Each run happens in a fresh child process, and its wall time, peak RSS and
+total output bytes are recorded in a JSON file. Corpus files are reused between
+runs, so two result files can be compared with --compare.
+
+Examples:
+    python booklet_signatures_benchmark.py \
+        --corpus-folder ./bench/corpus \
+        --work-folder ./bench/work \
+        --results ./bench/before.json
+
+    python booklet_signatures_benchmark.py \
+        --corpus-folder ./bench/corpus \
+        --work-folder ./bench/work \
+        --results ./bench/after.json \
+        --layout-modes imposed imposed-nup \
+        --variants plain xobject \
+        --compare ./bench/before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import platform
+import random
+import shlex
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Sequence
+
+import pypdf
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject, NumberObject, StreamObject
+
+SCRIPT_PATH = Path(__file__).resolve().with_name("booklet_signatures_enhanced.py")
+
+# Bump when the generated corpus changes, so results are never compared
+# across different inputs by accident.
+CORPUS_VERSION = 1
+
+CORPUS_KINDS = ("text", "vector", "images", "mixed-sizes")
+DEFAULT_PAGE_COUNTS = (100, 1000, 10000)
+
+A5 = (419.53, 595.28)
+MIXED_PAGE_SIZES = (A5, (595.28, 841.89), (612.0, 792.0), (595.28, 419.53))
+
+# Byte translation tables that add a gradient shade to quarter-strength noise.
+SHADE_TABLES = [bytes(((value >> 2) + shade) & 0xFF for value in range(256)) for shade in range(256)]
+
+LAYOUT_MODES = ("reading-order", "imposed", "imposed-nup")
+OUTPUT_MODES = ("per-signature", "single")
+TAIL_MODES = ("short", "pad")
+
+
+@dataclass(frozen=True)
+class Variant:
+    name: str
+    args: tuple[str, ...]
+    imposed_only: bool = False
+    single_only: bool = False
+
+    def applies_to(self, layout_mode: str, output_mode: str) -> bool:
+        if self.imposed_only and layout_mode == "reading-order":
+            return False
+        return not (self.single_only and output_mode != "single")
+
+
+VARIANTS = {
+    variant.name: variant
+    for variant in (
+        Variant("plain", ()),
+        Variant("xobject", ("--imposition-method", "xobject"), imposed_only=True),
+        Variant("optimized", ("--optimize-output",)),
+        Variant("max-memory", ("--max-memory", "64M"), single_only=True),
+        Variant("copies", ("--copies", "2"), imposed_only=True),
+        Variant("gang", ("--gang",), imposed_only=True, single_only=True),
+    )
+}
+
+
+@dataclass
+class BenchmarkResult:
+    corpus: str
+    kind: str
+    pages: int
+    layout_mode: str
+    output_mode: str
+    tail_mode: str
+    returncode: int
+    wall_seconds: float
+    peak_rss_bytes: int | None
+    output_bytes: int
+    variant: str = "plain"
+
+    @property
+    def key(self) -> str:
+        return result_key(self.kind, self.pages, self.layout_mode, self.output_mode, self.tail_mode, self.variant)
+
+
+def result_key(kind: str, pages: int, layout_mode: str, output_mode: str, tail_mode: str, variant: str) -> str:
+    return f"{kind}/{pages}/{layout_mode}/{output_mode}/{tail_mode}/{variant}"
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time booklet_signatures_enhanced.py over a synthetic PDF corpus.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--corpus-folder",
+        required=True,
+        help="Folder holding the generated corpus PDFs. Existing files are reused.",
+    )
+    parser.add_argument(
+        "--work-folder",
+        required=True,
+        help="Scratch folder for benchmark outputs. Each run's outputs are deleted after measuring.",
+    )
+    parser.add_argument(
+        "--results",
+        required=True,
+        help="JSON file the results are written to.",
+    )
+    parser.add_argument(
+        "--kinds",
+        nargs="+",
+        choices=CORPUS_KINDS,
+        default=list(CORPUS_KINDS),
+        help="Corpus kinds to benchmark.",
+    )
+    parser.add_argument(
+        "--pages",
+        nargs="+",
+        type=int,
+        default=list(DEFAULT_PAGE_COUNTS),
+        help="Page counts to generate for every corpus kind.",
+    )
+    parser.add_argument(
+        "--layout-modes",
+        nargs="+",
+        choices=LAYOUT_MODES,
+        default=list(LAYOUT_MODES),
+        help="Layout modes to benchmark.",
+    )
+    parser.add_argument(
+        "--variants",
+        nargs="+",
+        choices=list(VARIANTS),
+        default=list(VARIANTS),
+        help="Option variants to benchmark. Each one only runs with the layout and output modes it applies to.",
+    )
+    parser.add_argument(
+        "--image-pixels",
+        type=int,
+        default=400,
+        help="Width and height in pixels of the embedded image on each page of the 'images' corpus.",
+    )
+    parser.add_argument(
+        "--sheets-per-signature",
+        type=int,
+        default=4,
+        help="Passed through to every benchmark run.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Run each combination this many times and keep the median wall time.",
+    )
+    parser.add_argument(
+        "--extra-args",
+        default="",
+        help="Extra command-line options appended to every run, e.g. \"--imposition-method xobject\".",
+    )
+    parser.add_argument(
+        "--compare",
+        help="Earlier results JSON to compare against once this run is finished.",
+    )
+    return parser.parse_args(argv)
+
+
+def image_bytes(rng: random.Random, pixels: int, noise: bytes) -> bytes:
+    # A vertical gradient with low-amplitude noise: every page gets distinct,
+    # realistically compressible pixel data without generating a fresh random
+    # buffer per page.
+    row_length = pixels * 3
+    offset = rng.randrange(len(noise) - row_length)
+    rows = []
+    for y in range(pixels):
+        shade = (y * 255) // max(pixels - 1, 1)
+        start = (offset + y * 7) % (len(noise) - row_length)
+        rows.append(noise[start:start + row_length].translate(SHADE_TABLES[shade]))
+    return b"".join(rows)
+
+
+def text_content(rng: random.Random, width: float, height: float, label: str) -> bytes:
+    words = ("signature", "folio", "quire", "gathering", "binding", "spine", "leaf", "recto", "verso", "sheet")
+    lines = [f"BT /F1 10 Tf 36 {height - 48:.2f} Td 12 TL ({label}) Tj"]
+    for _ in range(int((height - 96) // 12)):
+        line = " ".join(rng.choice(words) for _ in range(int((width - 72) // 55)))
+        lines.append(f"T* ({line}) Tj")
+    lines.append("ET")
+    return "\n".join(lines).encode("ascii")
+
+
+def vector_content(rng: random.Random, width: float, height: float, label: str) -> bytes:
+    operations = ["0.2 w"]
+    for _ in range(400):
+        x, y = rng.uniform(0, width), rng.uniform(0, height)
+        operations.append(f"{rng.random():.3f} {rng.random():.3f} {rng.random():.3f} RG {x:.2f} {y:.2f} m")
+        for _ in range(6):
+            operations.append(
+                f"{rng.uniform(0, width):.2f} {rng.uniform(0, height):.2f} "
+                f"{rng.uniform(0, width):.2f} {rng.uniform(0, height):.2f} "
+                f"{rng.uniform(0, width):.2f} {rng.uniform(0, height):.2f} c"
+            )
+        operations.append("S")
+    operations.append(f"BT /F1 18 Tf 36 36 Td ({label}) Tj ET")
+    return "\n".join(operations).encode("ascii")
+
+
+def add_compressed_contents(writer: PdfWriter, page: DictionaryObject, data: bytes) -> None:
+    content = DecodedStreamObject()
+    content.set_data(data)
+    page[NameObject("/Contents")] = writer._add_object(content.flate_encode())
+
+
+def generate_corpus_file(path: Path, kind: str, pages: int, image_pixels: int) -> None:
+    rng = random.Random(f"{CORPUS_VERSION}-{kind}-{pages}")
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    noise = bytes(rng.getrandbits(8) for _ in range(max(image_pixels * 3 * 4, 4096)))
+
+    for page_number in range(1, pages + 1):
+        width, height = MIXED_PAGE_SIZES[page_number % len(MIXED_PAGE_SIZES)] if kind == "mixed-sizes" else A5
+        page = writer.add_blank_page(width=width, height=height)
+        resources = DictionaryObject({NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})})
+        label = f"{kind} page {page_number}"
+
+        if kind == "vector":
+            data = vector_content(rng, width, height, label)
+        elif kind == "images":
+            image = StreamObject()
+            image[NameObject("/Type")] = NameObject("/XObject")
+            image[NameObject("/Subtype")] = NameObject("/Image")
+            image[NameObject("/Width")] = NumberObject(image_pixels)
+            image[NameObject("/Height")] = NumberObject(image_pixels)
+            image[NameObject("/ColorSpace")] = NameObject("/DeviceRGB")
+            image[NameObject("/BitsPerComponent")] = NumberObject(8)
+            image[NameObject("/Filter")] = NameObject("/FlateDecode")
+            image._data = zlib.compress(image_bytes(rng, image_pixels, noise), 1)
+            resources[NameObject("/XObject")] = DictionaryObject({NameObject("/Im1"): writer._add_object(image)})
+            data = (
+                f"q {width - 72:.2f} 0 0 {height - 108:.2f} 36 72 cm /Im1 Do Q "
+                f"BT /F1 18 Tf 36 36 Td ({label}) Tj ET"
+            ).encode("ascii")
+        else:
+            data = text_content(rng, width, height, label)
+
+        page[NameObject("/Resources")] = resources
+        add_compressed_contents(writer, page, data)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = path.with_suffix(".partial")
+    with partial_path.open("wb") as handle:
+        writer.write(handle)
+    partial_path.replace(path)
+
+
+def ensure_corpus(folder: Path, kinds: Sequence[str], page_counts: Sequence[int], image_pixels: int) -> list[Path]:
+    paths: list[Path] = []
+    for kind, pages in itertools.product(kinds, page_counts):
+        suffix = f"_{image_pixels}px" if kind == "images" else ""
+        path = folder / f"v{CORPUS_VERSION}_{kind}_{pages}{suffix}.pdf"
+        if not path.exists():
+            print(f"Generating {path.name} ...", flush=True)
+            generate_corpus_file(path, kind, pages, image_pixels)
+        paths.append(path)
+    return paths
+
+
+def run_child(argv: Sequence[str]) -> int:
+    # Runs one benchmark job inside this child process and reports its own
+    # peak RSS, which keeps the figures independent of earlier runs.
+    sys.path.insert(0, str(SCRIPT_PATH.parent))
+    import booklet_signatures_enhanced
+
+    returncode = booklet_signatures_enhanced.main(list(argv))
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak_rss_bytes = peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:  # pragma: no cover - not available on Windows
+        peak_rss_bytes = None
+    print(json.dumps({"returncode": returncode, "peak_rss_bytes": peak_rss_bytes}))
+    return 0
+
+
+def folder_pdf_bytes(folder: Path) -> int:
+    return sum(path.stat().st_size for path in folder.glob("*.pdf"))
+
+
+def run_benchmark(
+    corpus_path: Path,
+    kind: str,
+    pages: int,
+    work_folder: Path,
+    layout_mode: str,
+    output_mode: str,
+    tail_mode: str,
+    variant: Variant,
+    sheets_per_signature: int,
+    extra_args: Sequence[str],
+    repeat: int,
+) -> BenchmarkResult:
+    output_folder = work_folder / f"{corpus_path.stem}_{layout_mode}_{output_mode}_{tail_mode}_{variant.name}"
+    argv = [
+        "--inputs", str(corpus_path),
+        "--output-folder", str(output_folder),
+        "--sheets-per-signature", str(sheets_per_signature),
+        "--layout-mode", layout_mode,
+        "--output-mode", output_mode,
+        "--tail-mode", tail_mode,
+        "--overwrite",
+        *variant.args,
+        *extra_args,
+    ]
+    wall_times: list[float] = []
+    peak_rss_bytes: int | None = None
+    output_bytes = 0
+    returncode = 0
+    for _ in range(max(repeat, 1)):
+        shutil.rmtree(output_folder, ignore_errors=True)
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "_child", *argv],
+            capture_output=True,
+            text=True,
+        )
+        wall_times.append(time.perf_counter() - started)
+        try:
+            report = json.loads(completed.stdout.strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            report = {"returncode": completed.returncode or 1, "peak_rss_bytes": None}
+        returncode = report["returncode"] or completed.returncode
+        if returncode:
+            print(completed.stderr, file=sys.stderr)
+            break
+        if report["peak_rss_bytes"] is not None:
+            peak_rss_bytes = max(peak_rss_bytes or 0, report["peak_rss_bytes"])
+        output_bytes = folder_pdf_bytes(output_folder)
+    shutil.rmtree(output_folder, ignore_errors=True)
+
+    return BenchmarkResult(
+        corpus=corpus_path.name,
+        kind=kind,
+        pages=pages,
+        layout_mode=layout_mode,
+        output_mode=output_mode,
+        tail_mode=tail_mode,
+        returncode=returncode,
+        wall_seconds=round(statistics.median(wall_times), 4),
+        peak_rss_bytes=peak_rss_bytes,
+        output_bytes=output_bytes,
+        variant=variant.name,
+    )
+
+
+def load_results(path: Path) -> dict[str, dict]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise BenchmarkError(f"Could not read results file '{path}': {exc}") from exc
+    if data.get("corpus_version") != CORPUS_VERSION:
+        raise BenchmarkError(
+            f"Results file '{path}' was produced from corpus version {data.get('corpus_version')}, "
+            f"this corpus is version {CORPUS_VERSION}."
+        )
+    results = {}
+    for entry in data.get("results", []):
+        # Results written before option variants existed are all "plain" runs.
+        key = result_key(
+            entry["kind"],
+            entry["pages"],
+            entry["layout_mode"],
+            entry["output_mode"],
+            entry["tail_mode"],
+            entry.get("variant", "plain"),
+        )
+        results[key] = entry
+    return results
+
+
+def ratio_text(new: float | None, old: float | None) -> str:
+    if not new or not old:
+        return "   n/a"
+    return f"{new / old:6.2f}x"
+
+
+def print_comparison(results: Sequence[BenchmarkResult], baseline_path: Path) -> None:
+    baseline = load_results(baseline_path)
+    print()
+    print(f"Comparison against {baseline_path} (new / old; below 1.00x is better)")
+    print(f"{'combination':<72} {'wall':>7} {'rss':>7} {'bytes':>7}")
+    for result in results:
+        old = baseline.get(result.key)
+        if old is None:
+            print(f"{result.key:<72} (not in baseline)")
+            continue
+        print(
+            f"{result.key:<72} "
+            f"{ratio_text(result.wall_seconds, old['wall_seconds'])} "
+            f"{ratio_text(result.peak_rss_bytes, old['peak_rss_bytes'])} "
+            f"{ratio_text(result.output_bytes, old['output_bytes'])}"
+        )
+
+
+def main(argv: Sequence[str]) -> int:
+    if argv and argv[0] == "_child":
+        return run_child(argv[1:])
+    try:
+        args = parse_args(argv)
+        corpus_folder = Path(args.corpus_folder).expanduser().resolve()
+        work_folder = Path(args.work_folder).expanduser().resolve()
+        results_path = Path(args.results).expanduser().resolve()
+        extra_args = shlex.split(args.extra_args)
+
+        corpus_paths = ensure_corpus(corpus_folder, args.kinds, args.pages, args.image_pixels)
+        corpus_entries = list(zip(itertools.product(args.kinds, args.pages), corpus_paths))
+
+        results: list[BenchmarkResult] = []
+        for ((kind, pages), corpus_path), layout_mode, output_mode, tail_mode, variant_name in itertools.product(
+            corpus_entries, args.layout_modes, OUTPUT_MODES, TAIL_MODES, args.variants
+        ):
+            variant = VARIANTS[variant_name]
+            if not variant.applies_to(layout_mode, output_mode):
+                continue
+            result = run_benchmark(
+                corpus_path,
+                kind,
+                pages,
+                work_folder,
+                layout_mode=layout_mode,
+                output_mode=output_mode,
+                tail_mode=tail_mode,
+                variant=variant,
+                sheets_per_signature=args.sheets_per_signature,
+                extra_args=extra_args,
+                repeat=args.repeat,
+            )
+            results.append(result)
+            rss_text = f"{result.peak_rss_bytes / 2**20:8.1f} MiB" if result.peak_rss_bytes else "     n/a"
+            status = "" if result.returncode == 0 else f"  FAILED ({result.returncode})"
+            print(
+                f"{result.key:<72} {result.wall_seconds:8.3f} s {rss_text} "
+                f"{result.output_bytes / 2**20:9.1f} MiB out{status}",
+                flush=True,
+            )
+
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        results_path.write_text(
+            json.dumps(
+                {
+                    "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "corpus_version": CORPUS_VERSION,
+                    "python": platform.python_version(),
+                    "pypdf": pypdf.__version__,
+                    "platform": platform.platform(),
+                    "sheets_per_signature": args.sheets_per_signature,
+                    "extra_args": extra_args,
+                    "repeat": args.repeat,
+                    "results": [asdict(result) for result in results],
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        print(f"\nResults written to: {results_path}")
+
+        if args.compare:
+            print_comparison(results, Path(args.compare).expanduser().resolve())
+        return 0 if all(result.returncode == 0 for result in results) else 1
+
+    except BenchmarkError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        print("Interrupted.", file=sys.stderr)
+        return 130
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
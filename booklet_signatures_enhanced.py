@@ -48,6 +48,41 @@ Examples:
         --layout-mode reading-order \
         --final-blank-placement infront
 
+    python booklet_signatures.py --manifest books.json --jobs 4
+
+    where books.json lists one entry per book, using the option names above:
+
+    {
+      "defaults": {"output_folder": "out", "layout_mode": "imposed"},
+      "jobs": [
+        {"inputs": ["vol1.pdf"], "base_name": "vol1"},
+        {"inputs": ["vol2.pdf", "appendix.pdf"], "base_name": "vol2", "tail_mode": "pad"}
+      ]
+    }
+
+    python booklet_signatures.py --manifest ./hot-folder --watch
+
+    rebuilds a book whenever one of its inputs or manifests changes. The
+    watcher lives in booklet_watch.py next to this script.
+
+    python booklet_signatures.py serve --port 8765 --workers 2 --queue-depth 4
+
+    runs a local HTTP service: POST PDFs to /impose (multipart form, options
+    as form fields or query parameters such as layout_mode=imposed) to get a
+    zip of signatures back, and GET /metrics for queue and latency figures.
+    The service and its client, BookletServiceClient, live in
+    booklet_service.py next to this script.
+
+    Services can build books in-process instead of running the script:
+
+    engine = BookletEngine()
+    build = engine.build([Path("chapter1.pdf"), uploaded_bytes], layout_mode="imposed")
+    for name, pdf in build.outputs.items():
+        ...  # pdf is a BytesIO
+
+Requires pypdf 6 (tested with 6.20). The few pypdf internals used, for want
+of a public API, are all reached through the helpers by add_indirect_object().
+
 Notes about imposed mode:
     - It assumes each source PDF page is one finished book page.
     - It creates landscape sheet-side pages sized at 2 x page width by 1 x page
@@ -59,14 +94,77 @@ Notes about imposed mode:
 from __future__ import annotations
 
 import argparse
+import csv
+import gc
+import hashlib
+import json
 import math
+import mmap
+import os
+import re
+import secrets
 import sys
-from dataclasses import dataclass
+import threading
+import time
+import tracemalloc
+import weakref
+import zlib
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from datetime import datetime, timezone
+from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Sequence
+from typing import IO, Any, Callable, ContextManager, Iterable, Iterator, Sequence
 
 from pypdf import PageObject, PdfReader, PdfWriter, Transformation
+from pypdf.errors import FileNotDecryptedError
+from pypdf.generic import (
+    ArrayObject,
+    ContentStream,
+    DictionaryObject,
+    FloatObject,
+    IndirectObject,
+    NameObject,
+    NullObject,
+    PdfObject,
+    StreamObject,
+)
+
+# Page attributes a /Page may inherit from its /Pages ancestors.
+INHERITABLE_PAGE_ATTRIBUTES = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+
+# Reads a page's /MediaBox straight from the file bytes (scan_media_sizes).
+MEDIA_BOX_PATTERN = re.compile(rb"/MediaBox\s*\[" + rb"\s*(-?\d*\.?\d+)" * 4 + rb"\s*\]")
+
+# Bump when a change to the writers alters output for unchanged inputs, so
+# --incremental does not reuse signature files built by older code.
+SIGNATURE_CACHE_VERSION = 1
+
+# Press sheet grid (rows, columns) and fold sequence for each
+# --pages-per-side. "V" folds the left half under the right and "H" the top
+# half under the bottom. The last fold forms the spine; every other crease
+# ends up at the head, foot or fore-edge and is trimmed off.
+NUP_FOLDS = {2: (1, 2, "V"), 4: (2, 2, "HV"), 8: (2, 4, "VHV"), 16: (4, 4, "HVHV")}
+
+# Non-stream objects packed into each object stream by --optimize-output.
+OBJECT_STREAM_SIZE = 100
+
+# Matrices turning page content the way a viewer shows each /Rotate value
+# (clockwise quarter turns), exact so no rounding noise reaches the output.
+UPRIGHT_MATRICES = {
+    0: (1, 0, 0, 1, 0, 0),
+    90: (0, -1, 1, 0, 0, 0),
+    180: (-1, 0, 0, -1, 0, 0),
+    270: (0, 1, -1, 0, 0, 0),
+}
+
+# Threads that parse and check input PDFs side by side in load_sources().
+SOURCE_LOAD_THREADS = 8
 
 
 @dataclass
@@ -74,6 +172,8 @@ class SourceDocument:
     path: Path
     reader: PdfReader
     page_count: int
+    # Width and height of every page's /MediaBox, in page order.
+    media_sizes: array = field(default_factory=lambda: array("d"))
 
 
 @dataclass
@@ -92,16 +192,322 @@ class SignaturePlan:
     blank_pages: int
     start_book_page: int
     end_book_page: int
+    pages_per_sheet: int = 4
 
     @property
     def sheets(self) -> int:
-        return self.total_pages // 4
+        return self.total_pages // self.pages_per_sheet
+
+
+@dataclass(frozen=True)
+class OutputOptimization:
+    optimize: bool = False
+    compress_level: int | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.optimize or self.compress_level is not None
+
+
+@dataclass
+class SignatureJob:
+    plan: SignaturePlan
+    plan_count: int
+    out_path: Path
+    blank_width: float
+    blank_height: float
+    base_name: str
+    layout_mode: str
+    final_blank_placement: str
+    imposition_method: str = "merge"
+    optimization: OutputOptimization = OutputOptimization()
+    pages_per_side: int = 2
+    mod_date: str | None = None
+    copies: int = 1
+    gang: bool = False
+
+
+@dataclass
+class BookletRunResult:
+    base_name: str
+    total_input_pages: int
+    signatures: int
+    generated: list[Path]
+    seconds: float
+
+
+@dataclass
+class JobOutcome:
+    number: int
+    options: argparse.Namespace
+    result: BookletRunResult | None
+    status: str
 
 
 class BookletError(Exception):
     pass
 
 
+@dataclass
+class _ProfileFrame:
+    child_peak: int = 0
+
+
+@dataclass
+class RunProfiler:
+    """
+    Wall time, CPU time and tracemalloc peak for each stage of a run (--profile).
+
+    Stages may nest (a signature inside generate_outputs, imposition inside a
+    signature); each record's peak covers everything that ran inside it.
+    Writer threads keep their own stage stacks, but tracemalloc is process
+    wide, so their peaks also include whatever ran alongside them.
+    """
+
+    records: list[dict[str, Any]] = field(default_factory=list)
+    _local: threading.local = field(default_factory=threading.local, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _started_tracing: bool = field(default=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @property
+    def _stack(self) -> list[_ProfileFrame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def stage(self, name: str, **details: Any) -> Iterator[None]:
+        _, peak_so_far = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1].child_peak = max(self._stack[-1].child_peak, peak_so_far)
+        tracemalloc.reset_peak()
+        frame = _ProfileFrame()
+        self._stack.append(frame)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall_seconds = time.perf_counter() - wall_start
+            cpu_seconds = time.process_time() - cpu_start
+            _, peak = tracemalloc.get_traced_memory()
+            self._stack.pop()
+            peak = max(peak, frame.child_peak)
+            if self._stack:
+                self._stack[-1].child_peak = max(self._stack[-1].child_peak, peak)
+            with self._lock:
+                self.records.append(
+                    {
+                        "stage": name,
+                        **details,
+                        "wall_seconds": round(wall_seconds, 6),
+                        "cpu_seconds": round(cpu_seconds, 6),
+                        "peak_traced_bytes": peak,
+                    }
+                )
+
+    def stage_wall_seconds(self, name: str) -> float:
+        return sum(record["wall_seconds"] for record in self.records if record["stage"] == name)
+
+    def write_report(self, path: Path, *, options: dict[str, Any], total_input_pages: int) -> None:
+        generate_seconds = self.stage_wall_seconds("generate_outputs")
+        report = {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "options": options,
+            "total_input_pages": total_input_pages,
+            "pages_per_second": pages_per_second(total_input_pages, generate_seconds),
+            "stages": [record for record in self.records if "signature" not in record],
+            "signatures": [record for record in self.records if "signature" in record],
+        }
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        # Tracing slows every allocation down, so it ends with the report
+        # unless someone else (python -X tracemalloc) had it on already.
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+def profile_stage(profiler: RunProfiler | None, name: str, **details: Any) -> ContextManager[None]:
+    if profiler is None:
+        return nullcontext()
+    return profiler.stage(name, **details)
+
+
+def pages_per_second(pages: int, seconds: float) -> float | None:
+    if seconds <= 0:
+        return None
+    return round(pages / seconds, 2)
+
+
+class PageTreeError(Exception):
+    pass
+
+
+class PageGeometry:
+    """
+    MediaBox, CropBox, TrimBox and /Rotate of a run of pages, read in one
+    pass into flat arrays (four coordinates per page and box).
+
+    Pages with the same boxes share one fit-to-cell transformation, so a
+    signature of mixed sizes costs one calculation per distinct size.
+    """
+
+    def __init__(self, pages: Sequence[PageObject]) -> None:
+        self.media = array("d")
+        self.crop = array("d")
+        self.trim = array("d")
+        self.rotate = array("i")
+        for page in pages:
+            media = page.mediabox
+            self.media.extend((float(media.left), float(media.bottom), float(media.right), float(media.top)))
+            # PageObject.cropbox and .trimbox write their defaults into the
+            # page, which would then be copied into the output, so the
+            # fallbacks are resolved here instead.
+            crop = page_box(page, "/CropBox") or self.media[-4:]
+            self.crop.extend(crop)
+            self.trim.extend(page_box(page, "/TrimBox") or crop)
+            self.rotate.append(int(page.get("/Rotate", 0) or 0) % 360)
+
+    def __len__(self) -> int:
+        return len(self.rotate)
+
+    def size_groups(self) -> dict[tuple[tuple[float, ...], int], list[int]]:
+        groups: dict[tuple[tuple[float, ...], int], list[int]] = {}
+        trim = self.trim
+        for index, rotate in enumerate(self.rotate):
+            groups.setdefault((tuple(trim[4 * index : 4 * index + 4]), rotate), []).append(index)
+        return groups
+
+    def fit_transformations(self, cell_width: float, cell_height: float) -> list[Transformation | None]:
+        # None marks pages that already fill the cell as they are.
+        fits: list[Transformation | None] = [None] * len(self)
+        for (box, rotate), indexes in self.size_groups().items():
+            fit = fit_transformation(box, rotate, cell_width, cell_height)
+            for index in indexes:
+                fits[index] = fit
+        return fits
+
+
+def page_box(page: PageObject, name: str) -> tuple[float, ...] | None:
+    box = page.get(name)
+    if box is None:
+        return None
+    try:
+        x1, y1, x2, y2 = (float(value) for value in box.get_object())
+    except (TypeError, ValueError):
+        return None
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+
+@lru_cache(maxsize=256)
+def fit_transformation(
+    box: tuple[float, ...],
+    rotate: int,
+    cell_width: float,
+    cell_height: float,
+    tolerance: float = 0.5,
+) -> Transformation | None:
+    left, bottom, right, top = box
+    if (
+        rotate == 0
+        and abs(left) <= tolerance
+        and abs(bottom) <= tolerance
+        and abs(right - left - cell_width) <= tolerance
+        and abs(top - bottom - cell_height) <= tolerance
+    ):
+        return None
+    # Turn the content the way a viewer shows it (/Rotate is clockwise),
+    # shrink it to fit the cell if needed and centre it there.
+    upright = Transformation(UPRIGHT_MATRICES.get(rotate, (1, 0, 0, 1, 0, 0)))
+    corners = [upright.apply_on((x, y)) for x in (left, right) for y in (bottom, top)]
+    min_x = min(x for x, _ in corners)
+    min_y = min(y for _, y in corners)
+    width = max(x for x, _ in corners) - min_x
+    height = max(y for _, y in corners) - min_y
+    if width <= 0 or height <= 0:
+        return None
+    scale = min(1.0, cell_width / width, cell_height / height)
+    return (
+        upright.translate(tx=-min_x, ty=-min_y)
+        .scale(scale, scale)
+        .translate(tx=(cell_width - width * scale) / 2, ty=(cell_height - height * scale) / 2)
+    )
+
+
+class LazyBookPages(Sequence[BookPage]):
+    """
+    The combined book as a sequence of BookPage entries resolved on demand.
+
+    Only the page counts from each source's page tree are known up front.
+    PageObjects are read when a signature slices its pages out, and release()
+    drops the parsed objects again once that signature has been written.
+    """
+
+    def __init__(self, sources: Sequence[SourceDocument]) -> None:
+        self.sources = list(sources)
+        self._source_starts: list[int] = []
+        total = 0
+        for source in self.sources:
+            self._source_starts.append(total)
+            total += source.page_count
+        self._total = total
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._total)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self._resolve_range(start, stop)
+        if index < 0:
+            index += self._total
+        if not 0 <= index < self._total:
+            raise IndexError("book page index out of range")
+        return self._resolve_range(index, index + 1)[0]
+
+    def _resolve_range(self, start: int, stop: int) -> list[BookPage]:
+        resolved: list[BookPage] = []
+        for source, source_start in zip(self.sources, self._source_starts):
+            first = max(start, source_start) - source_start
+            last = min(stop, source_start + source.page_count) - source_start
+            if first >= last:
+                continue
+            pages = read_source_pages(source.reader, first, last)
+            for offset, page in enumerate(pages):
+                page_index = first + offset + 1
+                resolved.append(
+                    BookPage(
+                        page=page,
+                        source_path=source.path,
+                        source_page_number=page_index,
+                        book_page_number=source_start + page_index,
+                    )
+                )
+        return resolved
+
+    def release(self) -> None:
+        # Output writers hold their own clones of everything they use, so the
+        # readers' object caches can be emptied between signatures.
+        for source in self.sources:
+            release_reader_cache(source.reader)
+
+
+def release_reader_cache(reader: PdfReader) -> None:
+    # /Pages nodes are kept because every later lookup walks through them again.
+    cache = reader.resolved_objects
+    for key, obj in list(cache.items()):
+        if not (isinstance(obj, DictionaryObject) and is_page_tree_node(obj)):
+            del cache[key]
+
+
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Append PDFs and split them into signature-sized PDFs for bookbinding.",
@@ -110,13 +516,21 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
     parser.add_argument(
         "--inputs",
         nargs="+",
-        required=True,
-        help="Input PDF files, in the order they should appear in the final book.",
+        help="Input PDF files, in the order they should appear in the final book. Required unless --manifest is given.",
     )
     parser.add_argument(
         "--output-folder",
-        required=True,
-        help="Folder where the output PDF(s) and plan file will be written.",
+        help="Folder where the output PDF(s) and plan file will be written. Required unless --manifest is given.",
+    )
+    parser.add_argument(
+        "--manifest",
+        default=None,
+        help=(
+            "JSON or TOML file (or a folder of them) describing several books to build in one run. Each entry in "
+            "its 'jobs' list takes the same settings as the command line (inputs, output_folder, base_name, "
+            "layout_mode, ...), with optional shared 'defaults'. Relative paths are resolved against the "
+            "manifest's folder. All jobs share one --jobs worker pool and inputs used by several jobs are parsed once."
+        ),
     )
     parser.add_argument(
         "--sheets-per-signature",
@@ -124,6 +538,27 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
         default=4,
         help="Physical sheets in a full signature. Each sheet holds 4 book pages total.",
     )
+    parser.add_argument(
+        "--auto-signature",
+        action="store_true",
+        help=(
+            "Choose signature sizes automatically: mix signatures of --min-sheets-per-signature to "
+            "--max-sheets-per-signature sheets so the book needs the fewest blank pages, then the fewest sheets "
+            "and signatures. Replaces --sheets-per-signature and --tail-mode."
+        ),
+    )
+    parser.add_argument(
+        "--min-sheets-per-signature",
+        type=int,
+        default=1,
+        help="Smallest signature --auto-signature may use, in sheets.",
+    )
+    parser.add_argument(
+        "--max-sheets-per-signature",
+        type=int,
+        default=None,
+        help="Largest signature --auto-signature may use, in sheets (default: --sheets-per-signature).",
+    )
     parser.add_argument(
         "--output-mode",
         choices=("per-signature", "single"),
@@ -152,11 +587,70 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
     )
     parser.add_argument(
         "--layout-mode",
-        choices=("reading-order", "imposed"),
+        choices=("reading-order", "imposed", "imposed-nup"),
         default="reading-order",
         help=(
             "'reading-order' keeps pages in normal order for printer/viewer booklet mode; "
-            "'imposed' rearranges pages onto landscape sheet sides for plain duplex printing without booklet mode."
+            "'imposed' rearranges pages onto landscape sheet sides for plain duplex printing without booklet mode; "
+            "'imposed-nup' places --pages-per-side pages on each press sheet side for folding into larger sections."
+        ),
+    )
+    parser.add_argument(
+        "--pages-per-side",
+        type=int,
+        choices=sorted(NUP_FOLDS),
+        default=4,
+        help=(
+            "Book pages per press sheet side in --layout-mode imposed-nup: 2 (folio), 4 (quarto), 8 (octavo) or "
+            "16. Each sheet then holds twice this many pages."
+        ),
+    )
+    parser.add_argument(
+        "--imposition-method",
+        choices=("merge", "xobject"),
+        default="merge",
+        help=(
+            "How imposed mode places book pages on a sheet side: 'merge' copies each page's content into the "
+            "sheet, 'xobject' wraps each page once as a Form XObject and draws it by reference. 'xobject' keeps "
+            "the source content streams unchanged but does not carry over page annotations."
+        ),
+    )
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=1,
+        help=(
+            "Print every imposed signature this many times. Each sheet side is stored once and every copy "
+            "draws it by reference, so the output hardly grows with the number of copies."
+        ),
+    )
+    parser.add_argument(
+        "--gang",
+        action="store_true",
+        help=(
+            "Put two imposed signatures (or two copies of one, with --copies) on every press sheet: one above "
+            "the other on wide sheets, side by side on tall ones. Cutting the printed stack in half gives the "
+            "two signatures. Needs --output-mode single or --copies 2 or more, since a per-signature file "
+            "holds one signature. Like --copies, this drops page annotations."
+        ),
+    )
+    parser.add_argument(
+        "--optimize-output",
+        action="store_true",
+        help=(
+            "Store identical objects (fonts, ICC profiles, images repeated across inputs) once, and pack the "
+            "remaining small objects into compressed object streams with a cross-reference stream (PDF 1.5)."
+        ),
+    )
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        choices=range(10),
+        default=None,
+        metavar="{0..9}",
+        help=(
+            "Recompress unfiltered and Flate-encoded streams at this zlib level, using --jobs threads in "
+            "single output mode. Streams are only replaced when they get smaller."
         ),
     )
     parser.add_argument(
@@ -169,12 +663,157 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
         action="store_true",
         help="Allow existing output files to be overwritten.",
     )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help=(
+            "With --overwrite, leave an existing output untouched when the new file has the same SHA-256 digest. "
+            "Output dates then come from SOURCE_DATE_EPOCH or the newest input's modification time, so reruns "
+            "on the same inputs produce identical bytes."
+        ),
+    )
+    parser.add_argument(
+        "--plan-format",
+        choices=("text", "json", "csv"),
+        default="text",
+        help=(
+            "Format of the {base-name}_signature_plan file: 'text' for people, 'json' with the inputs, settings, "
+            "every signature and its sheet sides, or 'csv' with one row per page slot of every sheet side."
+        ),
+    )
+    parser.add_argument(
+        "--export-imposition",
+        action="store_true",
+        help=(
+            "Also write {base-name}_imposition.json for use by other tools: the settings and signature records "
+            "of --plan-format json, each signature with its slot order added (null for blanks)."
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Do not write PDFs; only print the signature plan and write the plan text file.",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Keep a cache manifest of signature input hashes in the output folder and only rebuild "
+            "per-signature PDFs whose source pages or layout settings changed since the last run."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Record every finished signature with its input hashes in {base-name}_checkpoint.json as the run "
+            "goes, and skip signatures that a previous, interrupted run already wrote and that are unchanged "
+            "on disk. Per-signature output only. When the checkpoint is from a run over the same inputs, its "
+            "files and the plan file are replaced without --overwrite; anything else still needs --overwrite."
+        ),
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=parse_byte_size,
+        default=None,
+        help=(
+            "Memory budget such as 512M or 2G for --output-mode single. When set, finished signatures are "
+            "flushed to the output file in batches instead of being collected in one writer until the end. "
+            "Fonts and images shared between batches are stored once per batch. Batches are only cut between "
+            "signatures, so a warning is printed when the peak memory use of the run went over the budget."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Record wall time, CPU time and tracemalloc peak for every stage and signature, and write them to "
+            "{base-name}_profile.json next to the plan file. Memory tracing slows the run down noticeably."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Worker processes used to build signature PDFs in per-signature output mode. "
+            "Each worker opens its own copy of the inputs."
+        ),
+    )
+    parser.add_argument(
+        "--write-threads",
+        type=int,
+        default=2,
+        help=(
+            "Threads that write finished signature PDFs to disk while the next signatures are imposed, in "
+            "per-signature output mode without --jobs. At most this many signatures wait in memory. 0 writes each "
+            "signature before imposing the next."
+        ),
+    )
+    parser.add_argument(
+        "--mmap-inputs",
+        action="store_true",
+        help=(
+            "Memory-map input PDFs instead of reading each one into memory, so large scans stay in the OS page "
+            "cache. Inputs must not be truncated or rewritten in place while a run is reading them."
+        ),
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Keep running and rebuild whenever an input PDF (or, with --manifest, a manifest or any input it "
+            "lists) changes. Readers for unchanged inputs stay open between rebuilds, and per-signature jobs "
+            "use --incremental so only the affected signatures are imposed again."
+        ),
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between checks for changed files in --watch mode.",
+    )
+    parser.add_argument(
+        "--watch-debounce",
+        type=float,
+        default=2.0,
+        help="Seconds a changed file must stay unchanged before --watch rebuilds, so partly copied files are skipped.",
+    )
+    args = parser.parse_args(argv)
+    if args.manifest is None:
+        if not args.inputs:
+            parser.error("the following arguments are required: --inputs")
+        if not args.output_folder:
+            parser.error("the following arguments are required: --output-folder")
+    # Flag combinations are checked before anything is written, so a
+    # rejected run leaves no plan file behind.
+    try:
+        check_output_options(
+            output_mode=args.output_mode,
+            layout_mode=args.layout_mode,
+            jobs=args.jobs,
+            write_threads=args.write_threads,
+            max_memory=args.max_memory,
+            optimization=OutputOptimization(optimize=args.optimize_output, compress_level=args.compress_level),
+            cached=args.incremental or args.resume,
+            copies=args.copies,
+            gang=args.gang,
+        )
+    except BookletError as exc:
+        parser.error(str(exc))
+    return args
+
+
+def parse_byte_size(text: str) -> int:
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*", text, flags=re.IGNORECASE)
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r} (expected e.g. 512M or 2G)")
+    unit = match.group(2).upper()
+    multiplier = 1024 ** ("KMGT".index(unit) + 1) if unit else 1
+    size = int(float(match.group(1)) * multiplier)
+    if size <= 0:
+        raise argparse.ArgumentTypeError("size must be greater than zero")
+    return size
 
 
 def ensure_pdf_path(path_text: str) -> Path:
@@ -186,65 +825,406 @@ def ensure_pdf_path(path_text: str) -> Path:
     return path
 
 
-def load_sources(input_paths: Sequence[str]) -> list[SourceDocument]:
-    sources: list[SourceDocument] = []
+def open_source(path: Path, *, use_mmap: bool = False, data: bytes | None = None) -> SourceDocument:
+    try:
+        if data is not None:
+            # In-memory input (BookletEngine); path is only used as its name.
+            reader = PdfReader(BytesIO(data))
+        elif use_mmap:
+            # PdfReader(path) reads the whole file into a BytesIO. A read-only
+            # mapping leaves the bytes in the OS page cache instead, and only
+            # the objects pypdf actually parses are copied into the process.
+            with path.open("rb") as handle:
+                stream = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            reader = PdfReader(stream)
+        else:
+            reader = PdfReader(str(path))
+    except Exception as exc:  # pragma: no cover - defensive
+        raise BookletError(f"Could not read PDF '{path}': {exc}") from exc
+    try:
+        page_count = page_tree_count(reader)
+        media_sizes = scan_media_sizes(reader, page_count) if page_count else array("d")
+    except FileNotDecryptedError as exc:
+        raise BookletError(f"Input PDF is encrypted and needs a password: {path}") from exc
+    except Exception as exc:
+        raise BookletError(f"Could not read the page tree of '{path}': {exc}") from exc
+    if page_count == 0:
+        raise BookletError(f"Input PDF has no pages: {path}")
+    return SourceDocument(path=path, reader=reader, page_count=page_count, media_sizes=media_sizes)
+
+
+def check_page_boxes(source: SourceDocument) -> list[str]:
+    sizes = source.media_sizes
+    empty = [index for index in range(0, len(sizes), 2) if abs(sizes[index]) < 1 or abs(sizes[index + 1]) < 1]
+    if not empty:
+        return []
+    width, height = sizes[empty[0]], sizes[empty[0] + 1]
+    problem = f"{source.path.name} page {empty[0] // 2 + 1} has an empty /MediaBox ({width:g} x {height:g} pt)"
+    if len(empty) > 1:
+        problem += f", and so do {len(empty) - 1} more of its pages"
+    return [problem + "."]
+
+
+def page_size_warnings(sources: Sequence[SourceDocument], base_width: float, base_height: float) -> list[str]:
+    warnings: list[str] = []
+    for source in sources:
+        sizes = source.media_sizes
+        for index in range(0, len(sizes), 2):
+            width, height = sizes[index], sizes[index + 1]
+            if abs(width - base_width) > 0.5 or abs(height - base_height) > 0.5:
+                warnings.append(
+                    "Page size mismatch detected: "
+                    f"{source.path.name} page {index // 2 + 1} is {width:.2f} x {height:.2f} pt, "
+                    f"but the first page ({sources[0].path.name} page 1) is {base_width:.2f} x {base_height:.2f} pt. "
+                    "The script will continue: inserted blank pages use the first page size, and imposed "
+                    "layouts scale this page down to fit its cell if needed and centre it there."
+                )
+    return warnings
+
+
+def load_sources(
+    input_paths: Sequence[str],
+    cache: SourceCache | None = None,
+    *,
+    use_mmap: bool = False,
+) -> list[SourceDocument]:
+    # Every input is opened and checked, side by side, before anything fails,
+    # so one run reports all the files that need fixing.
+    entries: list[Path | str] = []
     for raw_path in input_paths:
-        path = ensure_pdf_path(raw_path)
         try:
-            reader = PdfReader(str(path))
-        except Exception as exc:  # pragma: no cover - defensive
-            raise BookletError(f"Could not read PDF '{path}': {exc}") from exc
-        page_count = len(reader.pages)
-        if page_count == 0:
-            raise BookletError(f"Input PDF has no pages: {path}")
-        sources.append(SourceDocument(path=path, reader=reader, page_count=page_count))
+            entries.append(ensure_pdf_path(raw_path))
+        except BookletError as exc:
+            entries.append(str(exc))
+
+    def inspect(path: Path) -> tuple[SourceDocument | None, list[str]]:
+        if cache is not None:
+            return inspect_source(lambda: cache.load(path, use_mmap=use_mmap))
+        return inspect_source(lambda: open_source(path, use_mmap=use_mmap))
+
+    # An input listed twice shares one reader, so no reader is used by two
+    # threads at once.
+    unique_paths = list(dict.fromkeys(entry for entry in entries if isinstance(entry, Path)))
+    with ThreadPoolExecutor(max_workers=max(1, min(SOURCE_LOAD_THREADS, len(unique_paths)))) as pool:
+        inspected = dict(zip(unique_paths, pool.map(inspect, unique_paths)))
+
+    problems: list[str] = []
+    sources: list[SourceDocument] = []
+    for entry in entries:
+        if isinstance(entry, str):
+            problems.append(entry)
+            continue
+        source, source_problems = inspected[entry]
+        if source is None or source not in sources:
+            problems.extend(source_problems)
+        if source is not None:
+            sources.append(source)
+    raise_input_problems(problems)
     return sources
 
 
-def build_book_pages(sources: Sequence[SourceDocument]) -> tuple[list[BookPage], float, float, list[str]]:
-    book_pages: list[BookPage] = []
-    warnings: list[str] = []
-    base_width: float | None = None
-    base_height: float | None = None
-    first_size_source: str | None = None
+def inspect_source(open_document: Callable[[], SourceDocument]) -> tuple[SourceDocument | None, list[str]]:
+    try:
+        source = open_document()
+    except BookletError as exc:
+        return None, [str(exc)]
+    return source, check_page_boxes(source)
+
+
+def raise_input_problems(problems: Sequence[str]) -> None:
+    if len(problems) == 1:
+        raise BookletError(problems[0])
+    if problems:
+        raise BookletError(f"{len(problems)} problems found in the inputs:\n" + "\n".join(f"- {p}" for p in problems))
+
+
+class SourceCache:
+    """
+    Parsed input PDFs kept open between books built in the same process.
+
+    Entries are keyed by resolved path and checked against the file's
+    modification time and size, so an input that changed on disk is parsed
+    again. In-memory inputs are keyed by a digest of their bytes. The least
+    recently used readers are dropped once more than max_entries are open.
+    A dropped reader's memory map (--mmap-inputs) is closed as soon as no
+    SourceDocument handed out for it is left.
+    """
+
+    def __init__(self, max_entries: int = 16) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Path | str, tuple[tuple[int, int], SourceDocument]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._handed_out: weakref.WeakValueDictionary[int, SourceDocument] = weakref.WeakValueDictionary()
+        self._dropped: list[SourceDocument] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self, path: Path, *, use_mmap: bool = False) -> SourceDocument:
+        resolved = path.resolve()
+        stat = resolved.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(resolved)
+        if entry is None or entry[0] != stamp:
+            # Parsed outside the lock so load_sources() threads open
+            # different inputs at the same time.
+            entry = (stamp, open_source(path, use_mmap=use_mmap))
+        return self._remember(resolved, entry, path)
+
+    def load_bytes(self, data: bytes, name: str) -> SourceDocument:
+        key = "sha256:" + hashlib.sha256(data).hexdigest()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            entry = ((0, len(data)), open_source(Path(name), data=data))
+        return self._remember(key, entry, Path(name))
+
+    def _remember(
+        self,
+        key: Path | str,
+        entry: tuple[tuple[int, int], SourceDocument],
+        path: Path,
+    ) -> SourceDocument:
+        source = entry[1]
+        # Callers get their own SourceDocument so the path they passed in is
+        # the one reported in plans and metadata.
+        handed_out = SourceDocument(
+            path=path, reader=source.reader, page_count=source.page_count, media_sizes=source.media_sizes
+        )
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None and previous[1] is not source:
+                self._dropped.append(previous[1])  # changed on disk
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._dropped.append(self._entries.popitem(last=False)[1][1])
+            self._handed_out[id(handed_out)] = handed_out
+            self._close_dropped()
+        return handed_out
+
+    def _close_dropped(self) -> None:
+        # A book may still be reading from a dropped source, so its map is
+        # only closed once every copy handed out for it is gone.
+        in_use = {id(source.reader) for source in self._handed_out.values()}
+        still_open = []
+        for source in self._dropped:
+            if id(source.reader) in in_use:
+                still_open.append(source)
+            elif isinstance(source.reader.stream, mmap.mmap):
+                source.reader.stream.close()
+        self._dropped = still_open
+
+
+def page_tree_count(reader: PdfReader) -> int:
+    try:
+        count = int(reader.trailer["/Root"]["/Pages"]["/Count"])
+    except Exception:
+        count = -1
+    if count < 0:
+        return len(reader.pages)
+    return count
 
-    book_page_number = 1
-    for source in sources:
-        for page_index, page in enumerate(source.reader.pages, start=1):
-            width = float(page.mediabox.width)
-            height = float(page.mediabox.height)
-            if base_width is None or base_height is None:
-                base_width = width
-                base_height = height
-                first_size_source = f"{source.path.name} page {page_index}"
-            else:
-                if abs(width - base_width) > 0.5 or abs(height - base_height) > 0.5:
-                    warnings.append(
-                        "Page size mismatch detected: "
-                        f"{source.path.name} page {page_index} is {width:.2f} x {height:.2f} pt, "
-                        f"but the first page ({first_size_source}) is {base_width:.2f} x {base_height:.2f} pt. "
-                        "The script will continue, but inserted blank pages will use the first page size, "
-                        "and imposed mode will use the first page size as the sheet layout basis."
-                    )
-            book_pages.append(
-                BookPage(
-                    page=page,
-                    source_path=source.path,
-                    source_page_number=page_index,
-                    book_page_number=book_page_number,
-                )
-            )
-            book_page_number += 1
 
-    assert base_width is not None and base_height is not None
-    return book_pages, base_width, base_height, warnings
+def is_page_tree_node(node: DictionaryObject) -> bool:
+    node_type = node.get("/Type")
+    if node_type is not None:
+        return node_type == "/Pages"
+    return "/Kids" in node
+
+
+def page_from_tree_leaf(reader: PdfReader, leaf: object, inherited: dict[str, object]) -> PageObject:
+    if isinstance(leaf, IndirectObject):
+        page = PageObject(reader, leaf)
+    else:
+        page = PageObject(reader)
+        page.update(leaf)
+    if is_page_tree_node(page):
+        raise PageTreeError("Expected a /Page leaf in the page tree.")
+    for key, value in inherited.items():
+        if key not in page:
+            page[NameObject(key)] = value
+    return page
+
+
+# /Pages nodes whose kids are all /Page leaves, per reader and node number.
+_leaf_only_page_nodes: weakref.WeakKeyDictionary[PdfReader, dict[int, bool]] = weakref.WeakKeyDictionary()
+
+
+def kids_are_leaves(reader: PdfReader, node: DictionaryObject, kids: Sequence[object]) -> bool:
+    # Resolving every kid is paid once per node, not once per page range:
+    # the reader cache that would keep them is emptied between signatures.
+    reference = node.indirect_reference
+    known = _leaf_only_page_nodes.setdefault(reader, {})
+    if reference is not None and reference.idnum in known:
+        return known[reference.idnum]
+    leaves = not any(is_page_tree_node(kid.get_object()) for kid in kids)
+    if reference is not None:
+        known[reference.idnum] = leaves
+    return leaves
+
+
+def walk_page_range(
+    reader: PdfReader,
+    node: DictionaryObject,
+    inherited: dict[str, object],
+    first: int,
+    last: int,
+) -> Iterator[PageObject]:
+    # `first` and `last` are 0-based leaf positions relative to this node.
+    inherited = dict(inherited)
+    for key in INHERITABLE_PAGE_ATTRIBUTES:
+        if key in node:
+            inherited[key] = node[key]
+    kids = node.get("/Kids", [])
+
+    if int(node.get("/Count", -1)) == len(kids) and kids_are_leaves(reader, node, kids):
+        # Every kid is a leaf, so the wanted pages can be indexed directly.
+        # An empty /Pages kid next to one holding several pages also gives
+        # /Count == len(/Kids), hence the check.
+        for kid_index in range(max(first, 0), min(last, len(kids))):
+            yield page_from_tree_leaf(reader, kids[kid_index], inherited)
+        return
+
+    position = 0
+    for kid_ref in kids:
+        if position >= last:
+            return
+        kid = kid_ref.get_object()
+        if is_page_tree_node(kid):
+            count = int(kid.get("/Count", 0))
+            if position + count > first:
+                yield from walk_page_range(reader, kid, inherited, first - position, last - position)
+            position += count
+        else:
+            if position >= first:
+                yield page_from_tree_leaf(reader, kid_ref, inherited)
+            position += 1
 
 
-def build_signature_plan(total_book_pages: int, sheets_per_signature: int, tail_mode: str) -> list[SignaturePlan]:
+def read_source_pages(reader: PdfReader, first: int, last: int) -> list[PageObject]:
+    try:
+        root_pages = reader.trailer["/Root"]["/Pages"].get_object()
+        pages = list(walk_page_range(reader, root_pages, {}, first, last))
+    except (PageTreeError, KeyError, TypeError, ValueError, RecursionError):
+        pages = []
+    if len(pages) != last - first:
+        # Inconsistent /Count entries: let pypdf flatten the whole tree instead.
+        pages = [reader.pages[index] for index in range(first, min(last, len(reader.pages)))]
+    return pages
+
+
+def open_reader_for_planning(path: Path) -> PdfReader:
+    # strict=True skips pypdf's scan of every xref entry. Files that need
+    # repairing are read again the forgiving way.
+    try:
+        return PdfReader(str(path), strict=True)
+    except Exception:
+        pass
+    try:
+        return PdfReader(str(path))
+    except Exception as exc:  # pragma: no cover - defensive
+        raise BookletError(f"Could not read PDF '{path}': {exc}") from exc
+
+
+def read_raw_object(reader: PdfReader, reference: object) -> bytes | None:
+    if not isinstance(reference, IndirectObject):
+        return None
+    offset = reader.xref.get(reference.generation, {}).get(reference.idnum)
+    if offset is None:
+        return None  # stored in an object stream
+    stream = reader.stream
+    stream.seek(offset)
+    raw = b""
+    while b"endobj" not in raw and b"stream" not in raw:
+        chunk = stream.read(4096)
+        if not chunk:
+            break
+        raw += chunk
+    if not raw.lstrip().startswith(b"%d %d obj" % (reference.idnum, reference.generation)):
+        return None  # stale /XRef offset; leave it to pypdf's repair
+    return raw.split(b"endobj", 1)[0]
+
+
+def scan_media_sizes(reader: PdfReader, page_count: int) -> array:
+    # Page dictionaries are small, so their /MediaBox is usually read with a
+    # regex straight from the file bytes. Nodes that need a real parse (page
+    # tree nodes, compressed objects, indirect or inherited boxes) fall back
+    # to pypdf. Content streams are never touched.
+    sizes = array("d")
+    stack: list[tuple[object, object]] = [(reader.trailer["/Root"].raw_get("/Pages"), None)]
+    visited: set[int] = set()
+    while stack and len(sizes) <= 2 * page_count:
+        reference, inherited_box = stack.pop()
+        raw = read_raw_object(reader, reference)
+        if raw is not None and b"/Kids" not in raw:
+            box_match = MEDIA_BOX_PATTERN.search(raw)
+            if box_match:
+                left, bottom, right, top = (float(value) for value in box_match.groups())
+                sizes.extend((right - left, top - bottom))
+                continue
+        node = reference.get_object()
+        box = node.get("/MediaBox", inherited_box)
+        if is_page_tree_node(node):
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            stack.extend((kid, box) for kid in reversed(node.get("/Kids", [])))
+        else:
+            left, bottom, right, top = (float(value) for value in box) if box is not None else (0, 0, 0, 0)
+            sizes.extend((right - left, top - bottom))
+    if len(sizes) != 2 * page_count:
+        # Inconsistent /Count entries: use the pages as pypdf flattens them,
+        # like read_source_pages() does.
+        sizes = array("d")
+        for page in reader.pages:
+            sizes.extend((float(page.mediabox.width), float(page.mediabox.height)))
+    return sizes
+
+
+def load_plan_sources(input_paths: Sequence[str]) -> tuple[list[SourceDocument], float, float, list[str]]:
+    sources: list[SourceDocument] = []
+    problems: list[str] = []
+    for raw_path in input_paths:
+        try:
+            path = ensure_pdf_path(raw_path)
+            reader = open_reader_for_planning(path)
+            try:
+                page_count = page_tree_count(reader)
+                media_sizes = scan_media_sizes(reader, page_count) if page_count else array("d")
+            except FileNotDecryptedError as exc:
+                raise BookletError(f"Input PDF is encrypted and needs a password: {path}") from exc
+            except Exception as exc:
+                raise BookletError(f"Could not read the page tree of '{path}': {exc}") from exc
+            if page_count == 0:
+                raise BookletError(f"Input PDF has no pages: {path}")
+        except BookletError as exc:
+            problems.append(str(exc))
+            continue
+        source = SourceDocument(path=path, reader=reader, page_count=page_count, media_sizes=media_sizes)
+        problems.extend(check_page_boxes(source))
+        sources.append(source)
+    raise_input_problems(problems)
+    base_width, base_height = sources[0].media_sizes[0:2]
+    return sources, base_width, base_height, page_size_warnings(sources, base_width, base_height)
+
+
+def build_book_pages(sources: Sequence[SourceDocument]) -> tuple[LazyBookPages, float, float, list[str]]:
+    base_width, base_height = sources[0].media_sizes[0:2]
+    return LazyBookPages(sources), base_width, base_height, page_size_warnings(sources, base_width, base_height)
+
+
+def build_signature_plan(
+    total_book_pages: int,
+    sheets_per_signature: int,
+    tail_mode: str,
+    pages_per_sheet: int = 4,
+) -> list[SignaturePlan]:
     if sheets_per_signature <= 0:
         raise BookletError("--sheets-per-signature must be greater than zero.")
 
-    full_signature_pages = sheets_per_signature * 4
+    full_signature_pages = sheets_per_signature * pages_per_sheet
     if total_book_pages <= 0:
         raise BookletError("There are no book pages to process.")
 
@@ -262,7 +1242,7 @@ def build_signature_plan(total_book_pages: int, sheets_per_signature: int, tail_
             if tail_mode == "pad":
                 total_pages = full_signature_pages
             elif tail_mode == "short":
-                total_pages = math.ceil(real_pages / 4) * 4
+                total_pages = math.ceil(real_pages / pages_per_sheet) * pages_per_sheet
             else:  # pragma: no cover - argparse should prevent this
                 raise BookletError(f"Unsupported tail mode: {tail_mode}")
 
@@ -274,6 +1254,7 @@ def build_signature_plan(total_book_pages: int, sheets_per_signature: int, tail_
                 blank_pages=total_pages - real_pages,
                 start_book_page=cursor,
                 end_book_page=cursor + real_pages - 1,
+                pages_per_sheet=pages_per_sheet,
             )
         )
         cursor += real_pages
@@ -283,7 +1264,73 @@ def build_signature_plan(total_book_pages: int, sheets_per_signature: int, tail_
     return plans
 
 
-def signature_book_pages(book_pages: Sequence[BookPage], plan: SignaturePlan) -> list[BookPage]:
+def solve_signature_sizes(
+    total_book_pages: int,
+    min_sheets: int,
+    max_sheets: int,
+    pages_per_sheet: int = 4,
+) -> list[int]:
+    if min_sheets <= 0:
+        raise BookletError("--min-sheets-per-signature must be greater than zero.")
+    if max_sheets < min_sheets:
+        raise BookletError("--max-sheets-per-signature must not be smaller than --min-sheets-per-signature.")
+    if total_book_pages <= 0:
+        raise BookletError("There are no book pages to process.")
+
+    # Every sheet holds the same number of pages, so fewest blanks and fewest
+    # sheets are the same goal: the smallest sheet total that n signatures of
+    # min..max sheets can add up to. n signatures reach exactly the totals
+    # n*min..n*max, so only the few totals above the minimum need checking.
+    total_sheets = math.ceil(total_book_pages / pages_per_sheet)
+    while True:
+        count = math.ceil(total_sheets / max_sheets)
+        if count * min_sheets <= total_sheets:
+            break
+        total_sheets += 1
+
+    # Fewest signatures, split as evenly as possible with the larger ones first.
+    size, larger = divmod(total_sheets, count)
+    return [size + 1] * larger + [size] * (count - larger)
+
+
+def build_signature_plan_from_sizes(
+    total_book_pages: int,
+    sheet_counts: Sequence[int],
+    pages_per_sheet: int = 4,
+) -> list[SignaturePlan]:
+    plans: list[SignaturePlan] = []
+    remaining = total_book_pages
+    cursor = 1
+    for index, sheets in enumerate(sheet_counts, start=1):
+        total_pages = sheets * pages_per_sheet
+        real_pages = min(remaining, total_pages)
+        plans.append(
+            SignaturePlan(
+                index=index,
+                real_pages=real_pages,
+                total_pages=total_pages,
+                blank_pages=total_pages - real_pages,
+                start_book_page=cursor,
+                end_book_page=cursor + real_pages - 1,
+                pages_per_sheet=pages_per_sheet,
+            )
+        )
+        cursor += real_pages
+        remaining -= real_pages
+    return plans
+
+
+def describe_signature_sizes(plans: Sequence[SignaturePlan]) -> str:
+    groups: list[list[int]] = []
+    for plan in plans:
+        if groups and groups[-1][1] == plan.sheets:
+            groups[-1][0] += 1
+        else:
+            groups.append([1, plan.sheets])
+    return " + ".join(f"{count} x {sheets}" for count, sheets in groups)
+
+
+def signature_book_pages(book_pages: LazyBookPages, plan: SignaturePlan) -> list[BookPage]:
     start_index = plan.start_book_page - 1
     end_index = plan.end_book_page
     return list(book_pages[start_index:end_index])
@@ -294,6 +1341,7 @@ def make_writer_with_metadata(
     sources: Sequence[SourceDocument],
     plan_label: str,
     layout_mode: str,
+    mod_date: str | None = None,
 ) -> PdfWriter:
     writer = PdfWriter()
     source_names = ", ".join(source.path.name for source in sources)
@@ -306,12 +1354,30 @@ def make_writer_with_metadata(
             "/Creator": "booklet_signatures.py",
             "/Producer": "pypdf",
             "/Source": source_names,
-            "/ModDate": datetime.now(timezone.utc).strftime("D:%Y%m%d%H%M%SZ"),
+            "/ModDate": mod_date or pdf_date(datetime.now(timezone.utc)),
         }
     )
     return writer
 
 
+def pdf_date(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime("D:%Y%m%d%H%M%SZ")
+
+
+def source_date(sources: Sequence[SourceDocument]) -> datetime:
+    # A date that only changes with the inputs, for reproducible output bytes.
+    epoch = os.environ.get("SOURCE_DATE_EPOCH", "")
+    if epoch.isdigit():
+        return datetime.fromtimestamp(int(epoch), timezone.utc)
+    mtimes = []
+    for source in sources:
+        try:
+            mtimes.append(source.path.stat().st_mtime)
+        except OSError:
+            pass  # in-memory inputs have no file
+    return datetime.fromtimestamp(int(max(mtimes, default=0)), timezone.utc)
+
+
 def get_blank_placement_for_plan(
     plan: SignaturePlan,
     total_plan_count: int,
@@ -322,120 +1388,521 @@ def get_blank_placement_for_plan(
     return "back"
 
 
+@dataclass(frozen=True)
+class FoldScheme:
+    """
+    Where each page of one folded press sheet is printed.
 
-def add_reading_order_signature_to_writer(
-    writer: PdfWriter,
-    signature_pages: Sequence[BookPage],
-    blanks_to_add: int,
-    blank_width: float,
-    blank_height: float,
-    blank_placement: str,
-) -> None:
-    if blank_placement == "front":
-        for _ in range(blanks_to_add):
-            writer.add_blank_page(width=blank_width, height=blank_height)
-        for book_page in signature_pages:
-            writer.add_page(book_page.page)
-    elif blank_placement == "back":
-        for book_page in signature_pages:
-            writer.add_page(book_page.page)
-        for _ in range(blanks_to_add):
-            writer.add_blank_page(width=blank_width, height=blank_height)
-    elif blank_placement == "infront":
-        if signature_pages:
-            for book_page in signature_pages[:-1]:
-                writer.add_page(book_page.page)
-            for _ in range(blanks_to_add):
-                writer.add_blank_page(width=blank_width, height=blank_height)
-            writer.add_page(signature_pages[-1].page)
-        else:
-            for _ in range(blanks_to_add):
-                writer.add_blank_page(width=blank_width, height=blank_height)
-    else:  # pragma: no cover - defensive
-        raise BookletError(f"Unsupported blank placement: {blank_placement}")
-
+    pages holds the section page number (1-based) printed in every cell,
+    front side first, each side in row-major order as seen when printing
+    that side. rotations holds 180 for cells printed head-to-head and 0
+    otherwise.
+    """
 
+    pages_per_side: int
+    rows: int
+    columns: int
+    pages: array
+    rotations: array
 
-def build_signature_slots(
-    signature_pages: Sequence[BookPage],
-    blanks_to_add: int,
-    blank_placement: str,
-) -> list[BookPage | None]:
-    content_slots: list[BookPage | None] = list(signature_pages)
-    blank_slots: list[BookPage | None] = [None] * blanks_to_add
+    @property
+    def pages_per_sheet(self) -> int:
+        return 2 * self.pages_per_side
+
+
+@lru_cache(maxsize=None)
+def fold_scheme(pages_per_side: int) -> FoldScheme:
+    if pages_per_side not in NUP_FOLDS:
+        raise BookletError(f"Unsupported pages per side: {pages_per_side}")
+    rows, columns, folds = NUP_FOLDS[pages_per_side]
+    # Fold a sheet of rows x columns cells and follow every cell to its layer
+    # in the folded section. Each cell is [x, y, layer, x_sign, y_sign]; the
+    # signs record whether the cell has been mirrored left-right or top-bottom.
+    cells = [[column, row, 0, 1, 1] for row in range(rows) for column in range(columns)]
+    width, height, layers = columns, rows, 1
+    for fold in folds:
+        for cell in cells:
+            x, y, layer, x_sign, y_sign = cell
+            if fold == "V":
+                if x < width // 2:
+                    cell[:] = [width // 2 - 1 - x, y, 2 * layers - 1 - layer, -x_sign, y_sign]
+                else:
+                    cell[0] = x - width // 2
+            elif y < height // 2:
+                cell[:] = [x, height // 2 - 1 - y, 2 * layers - 1 - layer, x_sign, -y_sign]
+            else:
+                cell[1] = y - height // 2
+        if fold == "V":
+            width //= 2
+        else:
+            height //= 2
+        layers *= 2
+
+    # Leaves are read top to bottom: layer n carries pages 2n + 1 (upper face)
+    # and 2n + 2. The back side is printed mirrored left-right, so the sheet
+    # turns over side to side, and a cell that an odd number of "H" folds
+    # turned upside down is printed head-to-head on both sides.
+    pages = array("i", [0]) * (2 * pages_per_side)
+    rotations = array("i", [0]) * (2 * pages_per_side)
+    for index, (_, _, layer, x_sign, y_sign) in enumerate(cells):
+        row, column = divmod(index, columns)
+        back_index = pages_per_side + row * columns + (columns - 1 - column)
+        front_up = x_sign == y_sign
+        pages[index] = 2 * layer + (1 if front_up else 2)
+        pages[back_index] = 2 * layer + (2 if front_up else 1)
+        rotations[index] = rotations[back_index] = 0 if y_sign == 1 else 180
+    return FoldScheme(pages_per_side, rows, columns, pages, rotations)
+
+
+class ImpositionTable:
+    """
+    Where each book page of one signature goes, computed once per plan.
+
+    slots holds the book page number for every slot of the folded signature,
+    in reading order, with 0 for a blank. sides holds, for every sheet, the
+    slot index printed in each cell of its fold scheme: the front cells, then
+    the back cells. The sheets of a signature are folded separately and
+    nested, so the outermost sheet carries the first and last pages. The
+    writers, the plan file, the console summary and --export-imposition all
+    read these arrays.
+    """
+
+    def __init__(self, plan: SignaturePlan, blank_placement: str, scheme: FoldScheme | None = None) -> None:
+        self.plan = plan
+        self.blank_placement = blank_placement
+        self.scheme = scheme or fold_scheme(2)
+        content = array("i", range(plan.start_book_page, plan.end_book_page + 1))
+        blanks = array("i", [0]) * plan.blank_pages
+        if blank_placement == "front":
+            self.slots = blanks + content
+        elif blank_placement == "back":
+            self.slots = content + blanks
+        elif blank_placement == "infront":
+            self.slots = content[:-1] + blanks + content[-1:]
+        else:
+            raise BookletError(f"Unsupported blank placement: {blank_placement}")
+
+        total = len(self.slots)
+        half = self.scheme.pages_per_side
+        self.sides = array("i")
+        for sheet_index in range(total // self.scheme.pages_per_sheet):
+            self.sides.extend(
+                sheet_index * half + page - 1 if page <= half else total - (sheet_index + 1) * half + page - half - 1
+                for page in self.scheme.pages
+            )
 
-    if blank_placement == "front":
-        return blank_slots + content_slots
-    if blank_placement == "back":
-        return content_slots + blank_slots
-    if blank_placement == "infront":
-        if content_slots:
-            return content_slots[:-1] + blank_slots + [content_slots[-1]]
-        return blank_slots
-    raise BookletError(f"Unsupported blank placement: {blank_placement}")
+    @property
+    def sheets(self) -> int:
+        return len(self.sides) // self.scheme.pages_per_sheet
 
+    def output_pages(self, layout_mode: str) -> int:
+        if layout_mode == "reading-order":
+            return len(self.slots)
+        return len(self.sides) // self.scheme.pages_per_side
 
+    def sheet_sides(self) -> Iterator[tuple[int, ...]]:
+        # Book page numbers (0 for blank) of each sheet side, in output order.
+        slots, sides, step = self.slots, self.sides, self.scheme.pages_per_side
+        for index in range(0, len(sides), step):
+            yield tuple(slots[slot] for slot in sides[index : index + step])
 
-def add_two_up_sheet_side(
-    writer: PdfWriter,
-    left_page: BookPage | None,
-    right_page: BookPage | None,
-    page_width: float,
-    page_height: float,
-) -> None:
-    sheet_width = page_width * 2
-    sheet_height = page_height
-    sheet = PageObject.create_blank_page(width=sheet_width, height=sheet_height)
 
-    if left_page is not None:
-        sheet.merge_transformed_page(
-            left_page.page,
-            Transformation().translate(tx=0, ty=0),
-        )
-    if right_page is not None:
-        sheet.merge_transformed_page(
-            right_page.page,
-            Transformation().translate(tx=page_width, ty=0),
-        )
+def build_imposition_tables(
+    plans: Sequence[SignaturePlan],
+    final_blank_placement: str,
+    scheme: FoldScheme | None = None,
+) -> list[ImpositionTable]:
+    return [
+        ImpositionTable(plan, get_blank_placement_for_plan(plan, len(plans), final_blank_placement), scheme)
+        for plan in plans
+    ]
 
-    writer.add_page(sheet)
+
+def plan_book(
+    total_book_pages: int,
+    *,
+    layout_mode: str,
+    sheets_per_signature: int,
+    tail_mode: str,
+    final_blank_placement: str,
+    pages_per_side: int = 4,
+    auto_signature: bool = False,
+    min_sheets_per_signature: int = 1,
+    max_sheets_per_signature: int | None = None,
+) -> list[ImpositionTable]:
+    scheme = fold_scheme(pages_per_side if layout_mode == "imposed-nup" else 2)
+    pages_per_sheet = 4 if layout_mode == "reading-order" else scheme.pages_per_sheet
+    if auto_signature:
+        sheet_counts = solve_signature_sizes(
+            total_book_pages=total_book_pages,
+            min_sheets=min_sheets_per_signature,
+            max_sheets=max_sheets_per_signature or sheets_per_signature,
+            pages_per_sheet=pages_per_sheet,
+        )
+        plans = build_signature_plan_from_sizes(total_book_pages, sheet_counts, pages_per_sheet)
+    else:
+        plans = build_signature_plan(
+            total_book_pages=total_book_pages,
+            sheets_per_signature=sheets_per_signature,
+            tail_mode=tail_mode,
+            pages_per_sheet=pages_per_sheet,
+        )
+    return build_imposition_tables(plans, final_blank_placement, scheme)
+
+
+def page_label(book_page_number: int) -> str:
+    return str(book_page_number) if book_page_number else "blank"
+
+
+def add_reading_order_signature_to_writer(
+    writer: PdfWriter,
+    table: ImpositionTable,
+    signature_pages: Sequence[BookPage],
+    blank_width: float,
+    blank_height: float,
+) -> None:
+    first_page = table.plan.start_book_page
+    for book_page_number in table.slots:
+        if book_page_number:
+            writer.add_page(signature_pages[book_page_number - first_page].page)
+        else:
+            writer.add_blank_page(width=blank_width, height=blank_height)
+
+
+def cell_transformations(scheme: FoldScheme, page_width: float, page_height: float) -> list[Transformation]:
+    # One transformation per cell of the scheme (front cells, then back
+    # cells) placing a page_width x page_height page in that cell.
+    transformations: list[Transformation] = []
+    for index, rotation in enumerate(scheme.rotations):
+        row, column = divmod(index % scheme.pages_per_side, scheme.columns)
+        tx = column * page_width
+        ty = (scheme.rows - 1 - row) * page_height
+        if rotation == 180:
+            transformations.append(Transformation((-1, 0, 0, -1, tx + page_width, ty + page_height)))
+        else:
+            transformations.append(Transformation().translate(tx=tx, ty=ty))
+    return transformations
+
+
+def add_sheet_side(
+    writer: PdfWriter,
+    placements: Sequence[tuple[BookPage | None, Transformation]],
+    sheet_width: float,
+    sheet_height: float,
+    form_xobjects: dict[tuple[Path, int], IndirectObject] | None = None,
+) -> None:
+    if form_xobjects is not None:
+        add_sheet_side_as_xobjects(writer, placements, sheet_width, sheet_height, form_xobjects)
+        return
+
+    if all(book_page is None for book_page, _ in placements):
+        writer.add_blank_page(width=sheet_width, height=sheet_height)
+        return
+    sheet = PageObject.create_blank_page(width=sheet_width, height=sheet_height)
+    for book_page, transformation in placements:
+        if book_page is not None:
+            sheet.merge_transformed_page(book_page.page, transformation)
+    writer.add_page(sheet)
+
+
+
+def format_pdf_number(value: float) -> str:
+    text = f"{value:.4f}".rstrip("0").rstrip(".")
+    return "0" if text in ("", "-0") else text
+
+
+# pypdf has no public API for the few writer and stream internals below
+# (checked against pypdf 6.20). Keep every such access in these helpers.
+
+
+def add_indirect_object(writer: PdfWriter, obj: PdfObject) -> IndirectObject:
+    return writer._add_object(obj)
+
+
+def writer_objects(writer: PdfWriter) -> list[PdfObject | None]:
+    return writer._objects
+
+
+def writer_info(writer: PdfWriter) -> DictionaryObject | None:
+    # Unlike writer.metadata, this is the /Info dictionary itself, with its
+    # indirect reference.
+    return writer._info
+
+
+def stream_data(stream: StreamObject) -> bytes:
+    # The stored bytes, still encoded; get_data() would decode them. A content
+    # stream that has been parsed into operations keeps no bytes until
+    # get_data() rebuilds them.
+    return stream.get_data() if isinstance(stream, ContentStream) else stream._data
+
+
+def set_stream_data(stream: StreamObject, data: bytes) -> None:
+    # Stores already encoded bytes; set_data() would encode them again.
+    stream._data = data
+
+
+def page_as_form_xobject(writer: PdfWriter, page: PageObject) -> IndirectObject:
+    contents = page.get(NameObject("/Contents"))
+    if isinstance(contents, IndirectObject) and isinstance(contents.get_object(), StreamObject):
+        # A single content stream is reused as-is, keeping its original filter.
+        form_ref = contents.clone(writer, force_duplicate=True)
+        form = form_ref.get_object()
+    else:
+        form = StreamObject()
+        page_content = page.get_contents()
+        form.set_data(page_content.get_data() if page_content is not None else b"")
+        form = form.flate_encode()
+        form_ref = add_indirect_object(writer, form)
+
+    crop = page.cropbox
+    form[NameObject("/Type")] = NameObject("/XObject")
+    form[NameObject("/Subtype")] = NameObject("/Form")
+    form[NameObject("/BBox")] = ArrayObject(
+        FloatObject(value) for value in (crop.left, crop.bottom, crop.right, crop.top)
+    )
+    if "/Resources" in page:
+        form[NameObject("/Resources")] = page[NameObject("/Resources")].clone(writer)
+    else:
+        form[NameObject("/Resources")] = DictionaryObject()
+    return form_ref
+
+
+def place_form_xobjects(
+    writer: PdfWriter,
+    placements: Sequence[tuple[BookPage | None, Transformation]],
+    form_xobjects: dict[tuple[Path, int], IndirectObject],
+) -> tuple[DictionaryObject, list[str]]:
+    # The /XObject resources and drawing operators for one sheet side.
+    xobject_names = DictionaryObject()
+    operators: list[str] = []
+    for index, (book_page, transformation) in enumerate(placements):
+        if book_page is None:
+            continue
+        name = f"/P{index}"
+        key = (book_page.source_path, book_page.source_page_number)
+        if key not in form_xobjects:
+            form_xobjects[key] = page_as_form_xobject(writer, book_page.page)
+        xobject_names[NameObject(name)] = form_xobjects[key]
+        matrix = " ".join(format_pdf_number(value) for value in transformation.ctm)
+        operators.append(f"q {matrix} cm {name} Do Q")
+    return xobject_names, operators
+
+
+def sheet_side_form(
+    writer: PdfWriter,
+    placements: Sequence[tuple[BookPage | None, Transformation]],
+    sheet_width: float,
+    sheet_height: float,
+    form_xobjects: dict[tuple[Path, int], IndirectObject] | None = None,
+) -> IndirectObject | None:
+    # One imposed sheet side as a Form XObject (None when it is blank), for
+    # placing on press sheets.
+    if all(book_page is None for book_page, _ in placements):
+        return None
+    if form_xobjects is None:
+        sheet = PageObject.create_blank_page(width=sheet_width, height=sheet_height)
+        for book_page, transformation in placements:
+            if book_page is not None:
+                sheet.merge_transformed_page(book_page.page, transformation)
+        return page_as_form_xobject(writer, sheet)
+
+    xobject_names, operators = place_form_xobjects(writer, placements, form_xobjects)
+    form = StreamObject()
+    form.set_data("\n".join(operators).encode("ascii"))
+    form[NameObject("/Type")] = NameObject("/XObject")
+    form[NameObject("/Subtype")] = NameObject("/Form")
+    form[NameObject("/BBox")] = ArrayObject(FloatObject(value) for value in (0, 0, sheet_width, sheet_height))
+    form[NameObject("/Resources")] = DictionaryObject({NameObject("/XObject"): xobject_names})
+    return add_indirect_object(writer, form)
+
+
+class PressSheets:
+    """
+    Lays imposed sheet sides out on press sheets for --copies and --gang.
+
+    Every sheet side arrives as one Form XObject. Each copy and both halves
+    of a ganged press sheet draw that form by reference, and identical press
+    sheet sides share one content stream, so output size and build time
+    barely grow with the number of copies. With gang, consecutive signature
+    copies are paired on one press sheet, stacked across its shorter side.
+    """
+
+    def __init__(
+        self,
+        writer: PdfWriter,
+        *,
+        sheet_width: float,
+        sheet_height: float,
+        copies: int = 1,
+        gang: bool = False,
+    ) -> None:
+        self.writer = writer
+        self.sheet_width = sheet_width
+        self.sheet_height = sheet_height
+        self.copies = copies
+        self.gang = gang
+        self.stacked = sheet_width >= sheet_height
+        self.pending: list[IndirectObject | None] | None = None
+        self._press_sides: dict[tuple[bool, tuple[int, ...]], tuple[IndirectObject, IndirectObject]] = {}
+
+    def add_signature(self, forms: Sequence[IndirectObject | None]) -> None:
+        for _ in range(self.copies):
+            if not self.gang:
+                for side_index, form in enumerate(forms):
+                    self._add_press_side([form], back=side_index % 2 == 1)
+            elif self.pending is None:
+                self.pending = list(forms)
+            else:
+                self._add_gang(self.pending, forms)
+                self.pending = None
+
+    def close(self) -> None:
+        # An odd signature copy out gets a press sheet with a blank half.
+        if self.pending is not None:
+            self._add_gang(self.pending, [])
+            self.pending = None
+
+    def _add_gang(self, first: Sequence[IndirectObject | None], second: Sequence[IndirectObject | None]) -> None:
+        for side_index in range(max(len(first), len(second))):
+            self._add_press_side(
+                [
+                    first[side_index] if side_index < len(first) else None,
+                    second[side_index] if side_index < len(second) else None,
+                ],
+                back=side_index % 2 == 1,
+            )
+
+    def _add_press_side(self, halves: Sequence[IndirectObject | None], back: bool) -> None:
+        width, height = self.sheet_width, self.sheet_height
+        if len(halves) == 1:
+            offsets = [(0.0, 0.0)]
+        elif self.stacked:
+            # Turning the sheet over side to side keeps the upper half on top.
+            offsets = [(0.0, height), (0.0, 0.0)]
+            height *= 2
+        else:
+            # ... but moves the left half to the right.
+            offsets = [(width, 0.0), (0.0, 0.0)] if back else [(0.0, 0.0), (width, 0.0)]
+            width *= 2
+        if all(form is None for form in halves):
+            self.writer.add_blank_page(width=width, height=height)
+            return
+
+        key = (back, tuple(form.idnum if form is not None else 0 for form in halves))
+        if key not in self._press_sides:
+            xobject_names = DictionaryObject()
+            operators: list[str] = []
+            for index, (form, (tx, ty)) in enumerate(zip(halves, offsets)):
+                if form is not None:
+                    xobject_names[NameObject(f"/S{index}")] = form
+                    operators.append(f"q 1 0 0 1 {format_pdf_number(tx)} {format_pdf_number(ty)} cm /S{index} Do Q")
+            content = StreamObject()
+            content.set_data("\n".join(operators).encode("ascii"))
+            resources = DictionaryObject({NameObject("/XObject"): xobject_names})
+            self._press_sides[key] = (
+                add_indirect_object(self.writer, content),
+                add_indirect_object(self.writer, resources),
+            )
+        content_ref, resources_ref = self._press_sides[key]
+        page = PageObject.create_blank_page(width=width, height=height)
+        page[NameObject("/Contents")] = content_ref
+        page[NameObject("/Resources")] = resources_ref
+        self.writer.add_page(page)
+
+
+def check_press_options(layout_mode: str, output_mode: str, copies: int, gang: bool) -> None:
+    if copies < 1:
+        raise BookletError("--copies must be at least 1.")
+    if (copies > 1 or gang) and layout_mode == "reading-order":
+        raise BookletError("--copies and --gang need --layout-mode imposed or imposed-nup.")
+    # A lone signature copy has nothing to share its press sheets with.
+    if gang and copies == 1 and output_mode != "single":
+        raise BookletError("--gang needs --output-mode single or --copies 2 or more.")
+
+
+def press_sheets_for(
+    writer: PdfWriter,
+    scheme: FoldScheme,
+    *,
+    blank_width: float,
+    blank_height: float,
+    copies: int,
+    gang: bool,
+) -> PressSheets | None:
+    if copies == 1 and not gang:
+        return None
+    return PressSheets(
+        writer,
+        sheet_width=blank_width * scheme.columns,
+        sheet_height=blank_height * scheme.rows,
+        copies=copies,
+        gang=gang,
+    )
+
+
+def add_sheet_side_as_xobjects(
+    writer: PdfWriter,
+    placements: Sequence[tuple[BookPage | None, Transformation]],
+    sheet_width: float,
+    sheet_height: float,
+    form_xobjects: dict[tuple[Path, int], IndirectObject],
+) -> None:
+    sheet = writer.add_blank_page(width=sheet_width, height=sheet_height)
+    xobject_names, operators = place_form_xobjects(writer, placements, form_xobjects)
+    if not operators:
+        return
+    sheet[NameObject("/Resources")] = DictionaryObject({NameObject("/XObject"): xobject_names})
+    content = StreamObject()
+    content.set_data("\n".join(operators).encode("ascii"))
+    sheet.replace_contents(content)
 
 
 
 def add_imposed_signature_to_writer(
     writer: PdfWriter,
+    table: ImpositionTable,
     signature_pages: Sequence[BookPage],
-    blanks_to_add: int,
     blank_width: float,
     blank_height: float,
-    blank_placement: str,
+    imposition_method: str = "merge",
+    press: PressSheets | None = None,
 ) -> None:
-    slots = build_signature_slots(signature_pages, blanks_to_add, blank_placement)
-    total_pages = len(slots)
-    if total_pages % 4 != 0:
-        raise BookletError("Imposed layout requires signatures whose total page count is a multiple of 4.")
-
-    for sheet_index in range(total_pages // 4):
-        left_front = total_pages - (2 * sheet_index)
-        right_front = 1 + (2 * sheet_index)
-        left_back = 2 + (2 * sheet_index)
-        right_back = total_pages - (2 * sheet_index + 1)
-
-        add_two_up_sheet_side(
-            writer,
-            left_page=slots[left_front - 1],
-            right_page=slots[right_front - 1],
-            page_width=blank_width,
-            page_height=blank_height,
-        )
-        add_two_up_sheet_side(
-            writer,
-            left_page=slots[left_back - 1],
-            right_page=slots[right_back - 1],
-            page_width=blank_width,
-            page_height=blank_height,
+    if imposition_method not in ("merge", "xobject"):  # pragma: no cover - argparse should prevent this
+        raise BookletError(f"Unsupported imposition method: {imposition_method}")
+    form_xobjects: dict[tuple[Path, int], IndirectObject] | None = {} if imposition_method == "xobject" else None
+    scheme = table.scheme
+    if len(table.slots) % scheme.pages_per_sheet != 0:
+        raise BookletError(
+            f"Imposed layout requires signatures whose total page count is a multiple of {scheme.pages_per_sheet}."
         )
 
+    transformations = cell_transformations(scheme, blank_width, blank_height)
+    # Pages of another size than the first page are scaled down to fit
+    # their cell and centred in it.
+    fits = PageGeometry([book_page.page for book_page in signature_pages]).fit_transformations(blank_width, blank_height)
+    first_page = table.plan.start_book_page
+
+    def placement(number: int, cell_transformation: Transformation) -> tuple[BookPage | None, Transformation]:
+        if not number:
+            return None, cell_transformation
+        fit = fits[number - first_page]
+        if fit is None:
+            return signature_pages[number - first_page], cell_transformation
+        return signature_pages[number - first_page], fit.transform(cell_transformation)
+
+    sheet_width = blank_width * scheme.columns
+    sheet_height = blank_height * scheme.rows
+    forms: list[IndirectObject | None] = []
+    for side_index, side in enumerate(table.sheet_sides()):
+        offset = (side_index % 2) * scheme.pages_per_side
+        placements = [placement(number, transformations[offset + cell]) for cell, number in enumerate(side)]
+        if press is not None:
+            forms.append(sheet_side_form(writer, placements, sheet_width, sheet_height, form_xobjects))
+        else:
+            add_sheet_side(writer, placements, sheet_width, sheet_height, form_xobjects=form_xobjects)
+    if press is not None:
+        press.add_signature(forms)
+
 
 
 def check_output_path(path: Path, overwrite: bool) -> None:
@@ -447,188 +1914,813 @@ def check_output_path(path: Path, overwrite: bool) -> None:
 
 
 
-def write_pdf(path: Path, writer: PdfWriter) -> None:
-    with path.open("wb") as handle:
+class AtomicFile:
+    """
+    Output written to a temporary file next to ``path`` and renamed over it
+    once complete, so a crash or a reader never sees a truncated file.
+
+    With ``skip_unchanged`` an existing file with the same digest is left in
+    place, timestamps and all; ``written`` tells which happened.
+    """
+
+    def __init__(self, path: Path, *, skip_unchanged: bool = False) -> None:
+        self.path = path
+        self.skip_unchanged = skip_unchanged
+        self.temp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.part")
+        self.written = False
+
+    def __enter__(self) -> IO[bytes]:
+        self.handle = self.temp_path.open("xb")
+        return self.handle
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        self.handle.close()
+        if exc_type is None and not (self.skip_unchanged and same_file_content(self.temp_path, self.path)):
+            os.replace(self.temp_path, self.path)
+            self.written = True
+        else:
+            self.temp_path.unlink(missing_ok=True)
+
+
+def file_digest(path: Path) -> bytes:
+    hasher = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.digest()
+
+
+def same_file_content(new_path: Path, old_path: Path) -> bool:
+    try:
+        if new_path.stat().st_size != old_path.stat().st_size:
+            return False
+        return file_digest(new_path) == file_digest(old_path)
+    except FileNotFoundError:
+        return False
+
+
+def write_pdf(
+    path: Path,
+    writer: PdfWriter,
+    optimization: OutputOptimization | None = None,
+    *,
+    threads: int = 1,
+    skip_unchanged: bool = False,
+) -> bool:
+    output = AtomicFile(path, skip_unchanged=skip_unchanged)
+    with output as handle:
+        write_pdf_to(handle, writer, optimization, threads=threads)
+    return output.written
+
+
+def write_pdf_to(
+    handle: IO[bytes],
+    writer: PdfWriter,
+    optimization: OutputOptimization | None = None,
+    *,
+    threads: int = 1,
+) -> None:
+    if optimization is not None and optimization.enabled:
+        write_optimized_pdf(handle, writer, optimization, threads=threads)
+    else:
         writer.write(handle)
 
 
+def iter_references(obj: object) -> Iterator[IndirectObject]:
+    if isinstance(obj, IndirectObject):
+        yield obj
+    elif isinstance(obj, DictionaryObject):
+        for key, value in obj.items():
+            if not (len(key) > 2 and key[1] == "%" and key[-1] == "%"):
+                yield from iter_references(value)
+    elif isinstance(obj, ArrayObject):
+        for item in obj:
+            yield from iter_references(item)
+
+
+def reachable_objects(roots: Sequence[IndirectObject]) -> dict[int, Any]:
+    objects: dict[int, Any] = {}
+    pending = list(reversed(roots))
+    while pending:
+        reference = pending.pop()
+        if reference.idnum in objects:
+            continue
+        obj = reference.get_object()
+        objects[reference.idnum] = NullObject() if obj is None else obj
+        pending.extend(reversed(list(iter_references(obj))))
+    return objects
+
+
+def deduplicate_objects(objects: dict[int, Any]) -> dict[int, int]:
+    aliases: dict[int, int] = {}
+
+    def canonical(reference: IndirectObject) -> int:
+        idnum = reference.idnum
+        while idnum in aliases:
+            idnum = aliases[idnum]
+        return idnum
+
+    def digest(obj: object) -> bytes:
+        buffer = BytesIO()
+        write_pdf_object(buffer, obj, canonical)
+        return hashlib.sha256(buffer.getvalue()).digest()
+
+    # Pages and the page tree must stay distinct objects even when two blank
+    # pages serialize identically.
+    candidates = {
+        idnum: obj
+        for idnum, obj in objects.items()
+        if not (isinstance(obj, DictionaryObject) and obj.get("/Type") in ("/Page", "/Pages", "/Catalog"))
+    }
+    leaf_digests = {idnum: digest(obj) for idnum, obj in candidates.items() if next(iter_references(obj), None) is None}
+    # Merging two identical font files makes the descriptors that point at
+    # them identical too, so repeat until a pass finds nothing new.
+    while True:
+        first_by_digest: dict[bytes, int] = {}
+        merged = False
+        for idnum, obj in candidates.items():
+            if idnum in aliases:
+                continue
+            key = leaf_digests.get(idnum) or digest(obj)
+            original = first_by_digest.setdefault(key, idnum)
+            if original != idnum:
+                aliases[idnum] = original
+                merged = True
+        if not merged:
+            return aliases
+
+
+def recompressed_stream(stream: StreamObject, level: int) -> StreamObject | None:
+    filters = stream.get("/Filter")
+    if "/DecodeParms" in stream or stream.get("/Type") == "/Metadata":
+        return None
+    try:
+        if filters is None:
+            raw = stream_data(stream)
+        elif filters == "/FlateDecode" or (isinstance(filters, ArrayObject) and list(filters) == ["/FlateDecode"]):
+            raw = zlib.decompress(stream_data(stream))
+        else:
+            return None
+    except zlib.error:
+        return None
+    data = zlib.compress(raw, level)
+    if len(data) >= len(stream_data(stream)):
+        return None
+    replacement = StreamObject()
+    replacement.update(stream)
+    replacement[NameObject("/Filter")] = NameObject("/FlateDecode")
+    set_stream_data(replacement, data)
+    return replacement
+
+
+def write_optimized_pdf(
+    handle: IO[bytes],
+    writer: PdfWriter,
+    optimization: OutputOptimization,
+    *,
+    threads: int = 1,
+) -> None:
+    root = writer.root_object.indirect_reference
+    info = writer_info(writer)
+    roots = [root] if info is None else [root, info.indirect_reference]
+    objects = reachable_objects(roots)
+    aliases = deduplicate_objects(objects) if optimization.optimize else {}
+    numbers: dict[int, int] = {}
+    for idnum in objects:
+        if idnum not in aliases:
+            numbers[idnum] = len(numbers) + 1
+
+    def number_for(reference: IndirectObject) -> int:
+        idnum = reference.idnum
+        while idnum in aliases:
+            idnum = aliases[idnum]
+        return numbers[idnum]
+
+    level = zlib.Z_DEFAULT_COMPRESSION if optimization.compress_level is None else optimization.compress_level
+    replacements: dict[int, StreamObject] = {}
+    if optimization.compress_level is not None:
+        streams = [(idnum, objects[idnum]) for idnum in numbers if isinstance(objects[idnum], StreamObject)]
+        # zlib releases the GIL, so threads are enough to compress in parallel.
+        with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+            compressed = executor.map(lambda item: recompressed_stream(item[1], level), streams)
+            for (idnum, _), replacement in zip(streams, compressed):
+                if replacement is not None:
+                    replacements[idnum] = replacement
+
+    header = max(writer.pdf_header, "%PDF-1.5") if optimization.optimize else writer.pdf_header
+    handle.write(header.encode("ascii") + b"\n%\xe2\xe3\xcf\xd3\n")
+    # Cross-reference entries as (type, field 2, field 3): type 1 is an
+    # object at a byte offset, type 2 an object inside an object stream.
+    entries: dict[int, tuple[int, int, int]] = {0: (0, 0, 65535)}
+    packed: list[tuple[int, bytes]] = []
+    for idnum, number in numbers.items():
+        obj = replacements.get(idnum, objects[idnum])
+        if optimization.optimize and not isinstance(obj, StreamObject):
+            buffer = BytesIO()
+            write_pdf_object(buffer, obj, number_for)
+            packed.append((number, buffer.getvalue()))
+            continue
+        entries[number] = (1, handle.tell(), 0)
+        handle.write(f"{number} 0 obj\n".encode("ascii"))
+        write_pdf_object(handle, obj, number_for)
+        handle.write(b"\nendobj\n")
+
+    next_number = len(numbers) + 1
+    for start in range(0, len(packed), OBJECT_STREAM_SIZE):
+        chunk = packed[start : start + OBJECT_STREAM_SIZE]
+        body = BytesIO()
+        offsets: list[str] = []
+        for position, (number, data) in enumerate(chunk):
+            offsets.append(f"{number} {body.tell()}")
+            body.write(data + b"\n")
+            entries[number] = (2, next_number, position)
+        index = (" ".join(offsets) + "\n").encode("ascii")
+        data = zlib.compress(index + body.getvalue(), level)
+        entries[next_number] = (1, handle.tell(), 0)
+        handle.write(
+            f"{next_number} 0 obj\n<<\n/Type /ObjStm\n/N {len(chunk)}\n/First {len(index)}\n"
+            f"/Filter /FlateDecode\n/Length {len(data)}\n>>\nstream\n".encode("ascii")
+            + data
+            + b"\nendstream\nendobj\n"
+        )
+        next_number += 1
+
+    trailer = f"/Root {number_for(root)} 0 R\n"
+    if info is not None:
+        trailer += f"/Info {number_for(info.indirect_reference)} 0 R\n"
+    xref_location = handle.tell()
+    if optimization.optimize:
+        entries[next_number] = (1, xref_location, 0)
+        size = next_number + 1
+        width = max(1, (max(field for _, field, _ in entries.values()).bit_length() + 7) // 8)
+        rows = b"".join(
+            kind.to_bytes(1, "big") + field.to_bytes(width, "big") + extra.to_bytes(2, "big")
+            for kind, field, extra in (entries[number] for number in range(size))
+        )
+        data = zlib.compress(rows, level)
+        handle.write(
+            f"{next_number} 0 obj\n<<\n/Type /XRef\n/Size {size}\n/W [1 {width} 2]\n{trailer}"
+            f"/Filter /FlateDecode\n/Length {len(data)}\n>>\nstream\n".encode("ascii")
+            + data
+            + b"\nendstream\nendobj\n"
+        )
+    else:
+        handle.write(f"xref\n0 {next_number}\n".encode("ascii"))
+        handle.write(b"0000000000 65535 f \n")
+        for number in range(1, next_number):
+            handle.write(f"{entries[number][1]:010d} 00000 n \n".encode("ascii"))
+        handle.write(f"trailer\n<<\n/Size {next_number}\n{trailer}>>\n".encode("ascii"))
+    handle.write(f"startxref\n{xref_location}\n%%EOF\n".encode("ascii"))
+
+
+def write_pdf_object(handle: IO[bytes], obj: object, number_for: Callable[[IndirectObject], int]) -> None:
+    if isinstance(obj, IndirectObject):
+        handle.write(f"{number_for(obj)} 0 R".encode("ascii"))
+    elif isinstance(obj, DictionaryObject):
+        handle.write(b"<<\n")
+        for key, value in obj.items():
+            if len(key) > 2 and key[1] == "%" and key[-1] == "%":
+                continue
+            if isinstance(obj, StreamObject) and key == "/Length":
+                continue
+            key.write_to_stream(handle)
+            handle.write(b" ")
+            write_pdf_object(handle, value, number_for)
+            handle.write(b"\n")
+        if isinstance(obj, StreamObject):
+            data = stream_data(obj)
+            handle.write(f"/Length {len(data)}\n>>\nstream\n".encode("ascii"))
+            handle.write(data)
+            handle.write(b"\nendstream")
+        else:
+            handle.write(b">>")
+    elif isinstance(obj, ArrayObject):
+        handle.write(b"[")
+        for index, item in enumerate(obj):
+            if index:
+                handle.write(b" ")
+            write_pdf_object(handle, item, number_for)
+        handle.write(b"]")
+    else:
+        obj.write_to_stream(handle)
+
+
+class StreamingPdfWriter:
+    """
+    Builds one PDF file incrementally for memory-bounded single output mode.
+
+    Signatures are imposed into short-lived PdfWriter batches. append() copies
+    a batch's pages, and every object they reference, into the output file under
+    new object numbers, after which the batch can be discarded. close() writes
+    the page tree, catalog, document information, xref table and trailer.
+    """
+
+    CATALOG_NUMBER = 1
+    PAGES_NUMBER = 2
+    INFO_NUMBER = 3
+
+    def __init__(self, handle: IO[bytes], header: str, info: DictionaryObject) -> None:
+        self._handle = handle
+        self._info = info
+        self._offsets: dict[int, int] = {}
+        self._page_numbers: list[int] = []
+        self._next_number = self.INFO_NUMBER + 1
+        handle.write(header.encode("ascii") + b"\n%\xe2\xe3\xcf\xd3\n")
+
+    def append(self, writer: PdfWriter) -> None:
+        pages_node = writer.root_object["/Pages"]
+        numbers: dict[int, int] = {pages_node.indirect_reference.idnum: self.PAGES_NUMBER}
+        pending: list[IndirectObject] = []
+
+        def number_for(reference: IndirectObject) -> int:
+            number = numbers.get(reference.idnum)
+            if number is None:
+                number = numbers[reference.idnum] = self._next_number
+                self._next_number += 1
+                pending.append(reference)
+            return number
+
+        for page in writer.pages:
+            self._page_numbers.append(number_for(page.indirect_reference))
+
+        while pending:
+            reference = pending.pop()
+            self._offsets[numbers[reference.idnum]] = self._handle.tell()
+            self._handle.write(f"{numbers[reference.idnum]} 0 obj\n".encode("ascii"))
+            write_pdf_object(self._handle, reference.get_object(), number_for)
+            self._handle.write(b"\nendobj\n")
+
+    def close(self) -> None:
+        handle = self._handle
+        kids = " ".join(f"{number} 0 R" for number in self._page_numbers)
+        trailing_objects = (
+            (self.CATALOG_NUMBER, f"<<\n/Type /Catalog\n/Pages {self.PAGES_NUMBER} 0 R\n>>".encode("ascii")),
+            (
+                self.PAGES_NUMBER,
+                f"<<\n/Type /Pages\n/Count {len(self._page_numbers)}\n/Kids [{kids}]\n>>".encode("ascii"),
+            ),
+        )
+        for number, body in trailing_objects:
+            self._offsets[number] = handle.tell()
+            handle.write(f"{number} 0 obj\n".encode("ascii") + body + b"\nendobj\n")
+        self._offsets[self.INFO_NUMBER] = handle.tell()
+        handle.write(f"{self.INFO_NUMBER} 0 obj\n".encode("ascii"))
+        self._info.write_to_stream(handle)
+        handle.write(b"\nendobj\n")
+
+        xref_location = handle.tell()
+        handle.write(f"xref\n0 {self._next_number}\n".encode("ascii"))
+        handle.write(b"0000000000 65535 f \n")
+        for number in range(1, self._next_number):
+            handle.write(f"{self._offsets[number]:010d} 00000 n \n".encode("ascii"))
+        handle.write(
+            f"trailer\n<<\n/Size {self._next_number}\n/Root {self.CATALOG_NUMBER} 0 R\n"
+            f"/Info {self.INFO_NUMBER} 0 R\n>>\nstartxref\n{xref_location}\n%%EOF\n".encode("ascii")
+        )
 
-def slot_label(slot_number: int, plan: SignaturePlan, blank_placement: str) -> str:
-    if blank_placement == "front":
-        if slot_number <= plan.blank_pages:
-            return "blank"
-        content_slot = slot_number - plan.blank_pages
-        if content_slot <= plan.real_pages:
-            return str(plan.start_book_page + content_slot - 1)
-        return "blank"
 
-    if blank_placement == "back":
-        if slot_number <= plan.real_pages:
-            return str(plan.start_book_page + slot_number - 1)
-        return "blank"
+def estimated_writer_bytes(writer: PdfWriter) -> int:
+    # Stream payloads dominate; everything else is counted at a flat rate per object.
+    total = 0
+    for obj in writer_objects(writer):
+        total += 256
+        if isinstance(obj, StreamObject):
+            total += len(stream_data(obj))
+    return total
 
-    if blank_placement == "infront":
-        if plan.real_pages <= 0:
-            return "blank"
-        if slot_number <= max(plan.real_pages - 1, 0):
-            return str(plan.start_book_page + slot_number - 1)
-        if slot_number <= (plan.real_pages - 1) + plan.blank_pages:
-            return "blank"
-        if slot_number == plan.total_pages:
-            return str(plan.end_book_page)
-        return "blank"
 
-    raise BookletError(f"Unsupported blank placement: {blank_placement}")
+def peak_memory_bytes() -> int | None:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
 
 
+def write_single_pdf_streaming(
+    *,
+    out_path: Path,
+    sources: Sequence[SourceDocument],
+    book_pages: LazyBookPages,
+    tables: Sequence[ImpositionTable],
+    blank_width: float,
+    blank_height: float,
+    base_name: str,
+    layout_mode: str,
+    imposition_method: str,
+    max_memory: int,
+    profiler: RunProfiler | None = None,
+    mod_date: str | None = None,
+    skip_unchanged: bool = False,
+    warnings: list[str] | None = None,
+) -> bool:
+    metadata_writer = make_writer_with_metadata(
+        base_name=base_name,
+        sources=sources,
+        plan_label=f"all signatures ({layout_mode})",
+        layout_mode=layout_mode,
+        mod_date=mod_date,
+    )
+    info = DictionaryObject(
+        {NameObject(key): value for key, value in (metadata_writer.metadata or {}).items()}
+    )
+    header = max([metadata_writer.pdf_header] + [source.reader.pdf_header for source in sources])
+    # Leave most of the budget for the readers, Python itself and the batch's
+    # cloned objects, which take several times their serialised size in memory.
+    flush_threshold = max(max_memory // 4, 1)
+    largest_signature = (0, 0)  # estimated bytes, signature number
+
+    output = AtomicFile(out_path, skip_unchanged=skip_unchanged)
+    with output as handle:
+        streaming_writer = StreamingPdfWriter(handle, header=header, info=info)
+        batch = PdfWriter()
+        batch_bytes = 0
+        for table in tables:
+            plan = table.plan
+            with profile_stage(profiler, "impose", signature=plan.index, pages=plan.real_pages):
+                add_signature_to_writer(
+                    writer=batch,
+                    table=table,
+                    signature_pages=signature_book_pages(book_pages, plan),
+                    blank_width=blank_width,
+                    blank_height=blank_height,
+                    layout_mode=layout_mode,
+                    imposition_method=imposition_method,
+                )
+                book_pages.release()
+            signature_bytes = estimated_writer_bytes(batch) - batch_bytes
+            batch_bytes += signature_bytes
+            largest_signature = max(largest_signature, (signature_bytes, plan.index))
+            if table is tables[-1] or batch_bytes >= flush_threshold:
+                with profile_stage(profiler, "flush", signature=plan.index):
+                    streaming_writer.append(batch)
+                # pypdf objects point back at their writer, so the old
+                # batch is only freed by the cycle collector.
+                batch = PdfWriter()
+                batch_bytes = 0
+                gc.collect()
+        with profile_stage(profiler, "write_pdf"):
+            streaming_writer.close()
+
+    # Batches are only flushed between signatures, so the budget cannot hold
+    # when one signature is too big for it; the real peak says whether it held.
+    peak = peak_memory_bytes()
+    if warnings is not None and peak is not None and peak > max_memory:
+        warning = (
+            f"Peak memory use was {peak / 2**20:.1f} MiB, over the --max-memory budget of "
+            f"{max_memory / 2**20:.1f} MiB."
+        )
+        if largest_signature[0] >= flush_threshold:
+            warning += (
+                f" Signature {largest_signature[1]} alone is estimated at {largest_signature[0] / 2**20:.1f} MiB "
+                "of output, more than a quarter of the budget, and signatures are never split between batches."
+            )
+        warnings.append(warning)
+    return output.written
 
-def build_plan_text(
+
+
+def iter_plan_text(
     sources: Sequence[SourceDocument],
-    plans: Sequence[SignaturePlan],
+    tables: Sequence[ImpositionTable],
     output_mode: str,
     tail_mode: str,
     sheets_per_signature: int,
     layout_mode: str,
     final_blank_placement: str,
     warnings: Sequence[str],
-) -> str:
-    lines: list[str] = []
-    lines.append("Booklet signature plan")
-    lines.append("=" * 80)
-    lines.append(f"Created: {datetime.now().isoformat(timespec='seconds')}")
-    lines.append("")
-    lines.append("Inputs")
-    lines.append("-" * 80)
+    auto_signature: bool = False,
+) -> Iterator[str]:
+    yield "Booklet signature plan"
+    yield "=" * 80
+    yield f"Created: {datetime.now().isoformat(timespec='seconds')}"
+    yield ""
+    yield "Inputs"
+    yield "-" * 80
     for source in sources:
-        lines.append(f"- {source.path} ({source.page_count} pages)")
-    lines.append("")
-    lines.append("Settings")
-    lines.append("-" * 80)
-    lines.append(f"Output mode            : {output_mode}")
-    lines.append(f"Tail mode              : {tail_mode}")
-    lines.append(f"Final blank placement  : {final_blank_placement}")
-    lines.append(f"Layout mode            : {layout_mode}")
-    lines.append(f"Sheets per signature   : {sheets_per_signature}")
-    lines.append(f"Book pages per full sig: {sheets_per_signature * 4}")
-    lines.append(f"Signature count        : {len(plans)}")
-    lines.append(f"Total input book pages : {sum(source.page_count for source in sources)}")
-    if layout_mode == "reading-order":
-        total_output_pdf_pages = sum(plan.total_pages for plan in plans)
+        yield f"- {source.path} ({source.page_count} pages)"
+    yield ""
+    yield "Settings"
+    yield "-" * 80
+    yield f"Output mode            : {output_mode}"
+    if not auto_signature:
+        yield f"Tail mode              : {tail_mode}"
+    yield f"Final blank placement  : {final_blank_placement}"
+    yield f"Layout mode            : {layout_mode}"
+    if auto_signature:
+        plans = [table.plan for table in tables]
+        yield f"Sheets per signature   : auto ({describe_signature_sizes(plans)})"
+        sheets_per_signature = max(plan.sheets for plan in plans)
     else:
-        total_output_pdf_pages = sum(plan.total_pages // 2 for plan in plans)
-    lines.append(f"Total output PDF pages : {total_output_pdf_pages}")
-    lines.append("")
-    lines.append("Signatures")
-    lines.append("-" * 80)
-    for plan in plans:
-        blank_placement = get_blank_placement_for_plan(plan, len(plans), final_blank_placement)
+        yield f"Sheets per signature   : {sheets_per_signature}"
+    pages_per_sheet = tables[0].plan.pages_per_sheet if tables else 4
+    yield f"Book pages per full sig: {sheets_per_signature * pages_per_sheet}"
+    yield f"Signature count        : {len(tables)}"
+    yield f"Total input book pages : {sum(source.page_count for source in sources)}"
+    total_output_pdf_pages = sum(table.output_pages(layout_mode) for table in tables)
+    yield f"Total output PDF pages : {total_output_pdf_pages}"
+    yield ""
+    yield "Signatures"
+    yield "-" * 80
+    for table in tables:
+        plan = table.plan
         detail = (
             f"Signature {plan.index:02d}: book pages {plan.start_book_page}-{plan.end_book_page} "
             f"| real={plan.real_pages} | total={plan.total_pages} | sheets={plan.sheets}"
         )
         if plan.blank_pages:
-            detail += f" | blanks={plan.blank_pages} ({blank_placement})"
-        lines.append(detail)
-
-        if layout_mode == "imposed":
-            for sheet_index in range(plan.sheets):
-                left_front = plan.total_pages - (2 * sheet_index)
-                right_front = 1 + (2 * sheet_index)
-                left_back = 2 + (2 * sheet_index)
-                right_back = plan.total_pages - (2 * sheet_index + 1)
-                lines.append(
-                    f"  Sheet {sheet_index + 1:02d} front: "
-                    f"{slot_label(left_front, plan, blank_placement)} | {slot_label(right_front, plan, blank_placement)}"
-                )
-                lines.append(
-                    f"  Sheet {sheet_index + 1:02d} back : "
-                    f"{slot_label(left_back, plan, blank_placement)} | {slot_label(right_back, plan, blank_placement)}"
+            detail += f" | blanks={plan.blank_pages} ({table.blank_placement})"
+        yield detail
+
+        if layout_mode != "reading-order":
+            columns = table.scheme.columns
+            for side_index, pages in enumerate(table.sheet_sides()):
+                side = "front" if side_index % 2 == 0 else "back "
+                rows = (
+                    " | ".join(page_label(number) for number in pages[start : start + columns])
+                    for start in range(0, len(pages), columns)
                 )
+                yield f"  Sheet {side_index // 2 + 1:02d} {side}: {' / '.join(rows)}"
 
     if warnings:
-        lines.append("")
-        lines.append("Warnings")
-        lines.append("-" * 80)
+        yield ""
+        yield "Warnings"
+        yield "-" * 80
         for warning in warnings:
-            lines.append(f"- {warning}")
-    lines.append("")
-    lines.append("Note")
-    lines.append("-" * 80)
+            yield f"- {warning}"
+    yield ""
+    yield "Note"
+    yield "-" * 80
     if layout_mode == "reading-order":
-        lines.append(
+        yield (
             "These output PDFs are kept in normal reading order inside each signature. "
             "Use this mode when your PDF viewer or printer handles booklet printing."
         )
         if final_blank_placement == "front":
-            lines.append(
+            yield (
                 "When the final signature is incomplete, required blanks are placed before the final content so "
                 "the last source PDF page remains the last page of the signature."
             )
         elif final_blank_placement == "infront":
-            lines.append(
+            yield (
                 "When the final signature is incomplete, required blanks are placed immediately before only the "
                 "final real page of the final signature. This is useful when the last source PDF page is a back cover."
             )
         if output_mode == "single":
-            lines.append(
+            yield (
                 "If your printer's booklet mode treats the entire file as one booklet, print the single PDF by "
                 "signature-sized page ranges rather than all at once."
             )
     else:
-        lines.append(
-            "These output PDFs are already imposed as landscape sheet sides, two book pages per PDF page. "
-            "Print with plain duplex printing and do not enable booklet mode."
-        )
+        if layout_mode == "imposed":
+            yield (
+                "These output PDFs are already imposed as landscape sheet sides, two book pages per PDF page. "
+                "Print with plain duplex printing and do not enable booklet mode."
+            )
+        else:
+            scheme = tables[0].scheme if tables else fold_scheme(2)
+            yield (
+                f"These output PDFs are imposed press sheet sides, {scheme.pages_per_side} book pages per PDF page "
+                f"({scheme.rows} rows of {scheme.columns}), listed above row by row from the top. Each sheet folds "
+                f"into a {scheme.pages_per_sheet}-page section; the sections of a signature are folded separately "
+                "and nested. Print with plain duplex printing and do not enable booklet mode."
+            )
+            if scheme.rows > 1:
+                yield (
+                    "Pages in the top row, and every second row below it, are printed head-to-head (rotated 180 "
+                    "degrees) so they read upright once folded. Trim the head, foot and fore-edge folds open."
+                )
         if final_blank_placement == "front":
-            lines.append(
+            yield (
                 "When the final signature is incomplete, required blanks are placed at the front of the logical "
                 "signature before imposition so the final source PDF page remains the last page of the signature."
             )
         elif final_blank_placement == "infront":
-            lines.append(
+            yield (
                 "When the final signature is incomplete, required blanks are placed immediately before only the "
                 "final real page of the logical signature before imposition. This is useful when the last source PDF "
                 "page is a back cover."
             )
-        lines.append(
-            "Typical duplex setting is flip on the short edge, but confirm with a small test print because some "
-            "printers and drivers label duplex orientation differently."
-        )
-    return "\n".join(lines) + "\n"
+        if layout_mode == "imposed":
+            yield (
+                "Typical duplex setting is flip on the short edge, but confirm with a small test print because some "
+                "printers and drivers label duplex orientation differently."
+            )
+        else:
+            yield (
+                "Back sides are laid out for turning the sheet over side to side (left edge to right edge). Confirm "
+                "the duplex setting with a small test print because printers and drivers label it differently."
+            )
 
 
+def plan_settings(
+    tables: Sequence[ImpositionTable],
+    output_mode: str,
+    tail_mode: str,
+    sheets_per_signature: int,
+    layout_mode: str,
+    final_blank_placement: str,
+    auto_signature: bool,
+) -> dict[str, Any]:
+    settings: dict[str, Any] = {
+        "output_mode": output_mode,
+        "tail_mode": None if auto_signature else tail_mode,
+        "final_blank_placement": final_blank_placement,
+        "layout_mode": layout_mode,
+        "auto_signature": auto_signature,
+        "sheets_per_signature": None if auto_signature else sheets_per_signature,
+        "pages_per_sheet": tables[0].plan.pages_per_sheet if tables else 4,
+    }
+    if tables and layout_mode != "reading-order":
+        settings.update(describe_fold_scheme(tables[0].scheme))
+    return settings
+
+
+def describe_fold_scheme(scheme: FoldScheme) -> dict[str, Any]:
+    return {
+        "pages_per_side": scheme.pages_per_side,
+        "grid": {"rows": scheme.rows, "columns": scheme.columns},
+        "rotations": {
+            "front": list(scheme.rotations[: scheme.pages_per_side]),
+            "back": list(scheme.rotations[scheme.pages_per_side :]),
+        },
+    }
+
+
+def signature_sheets(table: ImpositionTable) -> list[dict[str, Any]]:
+    sides = [[number or None for number in side] for side in table.sheet_sides()]
+    return [
+        {"sheet": index + 1, "front": sides[2 * index], "back": sides[2 * index + 1]} for index in range(table.sheets)
+    ]
+
+
+def plan_signature(table: ImpositionTable, layout_mode: str) -> dict[str, Any]:
+    plan = table.plan
+    return {
+        "index": plan.index,
+        "book_pages": [plan.start_book_page, plan.end_book_page],
+        "real_pages": plan.real_pages,
+        "total_pages": plan.total_pages,
+        "blank_pages": plan.blank_pages,
+        "blank_placement": table.blank_placement,
+        "output_pdf_pages": table.output_pages(layout_mode),
+        "sheets": signature_sheets(table),
+    }
+
+
+def iter_plan_json(
+    sources: Sequence[SourceDocument],
+    tables: Sequence[ImpositionTable],
+    output_mode: str,
+    tail_mode: str,
+    sheets_per_signature: int,
+    layout_mode: str,
+    final_blank_placement: str,
+    warnings: Sequence[str],
+    auto_signature: bool = False,
+) -> Iterator[str]:
+    # Written one signature per line, so the whole document never has to be
+    # built in memory and line-oriented tools can still follow it.
+    settings = plan_settings(
+        tables, output_mode, tail_mode, sheets_per_signature, layout_mode, final_blank_placement, auto_signature
+    )
+    yield "{"
+    yield f'"created": {json.dumps(datetime.now().isoformat(timespec="seconds"))},'
+    inputs = [{"path": str(source.path), "pages": source.page_count} for source in sources]
+    yield f'"inputs": {json.dumps(inputs)},'
+    yield f'"settings": {json.dumps(settings)},'
+    totals = {
+        "signatures": len(tables),
+        "input_pages": sum(source.page_count for source in sources),
+        "output_pdf_pages": sum(table.output_pages(layout_mode) for table in tables),
+    }
+    yield f'"totals": {json.dumps(totals)},'
+    yield '"signatures": ['
+    for position, table in enumerate(tables):
+        signature = plan_signature(table, layout_mode)
+        yield json.dumps(signature) + ("," if position < len(tables) - 1 else "")
+    yield "],"
+    yield f'"warnings": {json.dumps(list(warnings))}'
+    yield "}"
+
+
+def iter_plan_csv(
+    sources: Sequence[SourceDocument],
+    tables: Sequence[ImpositionTable],
+    output_mode: str,
+    tail_mode: str,
+    sheets_per_signature: int,
+    layout_mode: str,
+    final_blank_placement: str,
+    warnings: Sequence[str],
+    auto_signature: bool = False,
+) -> Iterator[str]:
+    # One row per page slot of every sheet side; blank slots have no book page.
+    buffer = StringIO()
+    row_writer = csv.writer(buffer, lineterminator="")
+
+    def row(*values: object) -> str:
+        buffer.seek(0)
+        buffer.truncate()
+        row_writer.writerow(values)
+        return buffer.getvalue()
+
+    source_starts: list[int] = []
+    total = 0
+    for source in sources:
+        source_starts.append(total)
+        total += source.page_count
+
+    yield row("signature", "sheet", "side", "position", "book_page", "source", "source_page", "rotation")
+    for table in tables:
+        rotations = table.scheme.rotations if layout_mode != "reading-order" else None
+        for side_index, side in enumerate(table.sheet_sides()):
+            side_name = "front" if side_index % 2 == 0 else "back"
+            offset = (side_index % 2) * table.scheme.pages_per_side
+            for position, number in enumerate(side):
+                rotation = rotations[offset + position] if rotations is not None else 0
+                if not number:
+                    yield row(table.plan.index, side_index // 2 + 1, side_name, position + 1, "", "", "", rotation)
+                    continue
+                source_index = bisect_right(source_starts, number - 1) - 1
+                yield row(
+                    table.plan.index,
+                    side_index // 2 + 1,
+                    side_name,
+                    position + 1,
+                    number,
+                    sources[source_index].path.name,
+                    number - source_starts[source_index],
+                    rotation,
+                )
+
 
-def write_plan_file(path: Path, text: str, overwrite: bool) -> None:
+# --plan-format choices: file suffix and the function that writes the plan.
+PLAN_FORMATS: dict[str, tuple[str, Callable[..., Iterator[str]]]] = {
+    "text": (".txt", iter_plan_text),
+    "json": (".json", iter_plan_json),
+    "csv": (".csv", iter_plan_csv),
+}
+
+
+
+def write_plan_file(path: Path, lines: Iterable[str], overwrite: bool) -> None:
     check_output_path(path, overwrite)
-    path.write_text(text, encoding="utf-8")
+    with AtomicFile(path) as handle:
+        for line in lines:
+            handle.write(line.encode("utf-8"))
+            handle.write(b"\n")
+
+
+
+def write_imposition_export(
+    path: Path,
+    tables: Sequence[ImpositionTable],
+    *,
+    settings: dict[str, Any],
+    overwrite: bool,
+) -> None:
+    # The JSON plan's settings and signature records, each signature with its
+    # slot order added.
+    check_output_path(path, overwrite)
+    signatures = [
+        {
+            **plan_signature(table, settings["layout_mode"]),
+            "slots": [book_page_number or None for book_page_number in table.slots],
+        }
+        for table in tables
+    ]
+    export = {"settings": settings, "signatures": signatures}
+    with AtomicFile(path) as handle:
+        handle.write((json.dumps(export, indent=2) + "\n").encode("utf-8"))
 
 
 
 def print_console_summary(
-    plans: Sequence[SignaturePlan],
+    tables: Sequence[ImpositionTable],
     total_input_pages: int,
     layout_mode: str,
     final_blank_placement: str,
+    throughput: float | None = None,
 ) -> None:
     print()
     print(f"Total input pages : {total_input_pages}")
-    print(f"Signature count   : {len(plans)}")
+    print(f"Signature count   : {len(tables)}")
     print(f"Layout mode       : {layout_mode}")
     print(f"Final blank place : {final_blank_placement}")
+    if throughput is not None:
+        print(f"Throughput        : {throughput:.1f} pages/s")
     print()
-    for plan in plans:
-        blank_placement = get_blank_placement_for_plan(plan, len(plans), final_blank_placement)
-        if layout_mode == "reading-order":
-            output_pdf_pages = plan.total_pages
-        else:
-            output_pdf_pages = plan.total_pages // 2
+    for table in tables:
+        plan = table.plan
         line = (
             f"Signature {plan.index:02d}: pages {plan.start_book_page}-{plan.end_book_page}, "
             f"real={plan.real_pages}, total={plan.total_pages}, sheets={plan.sheets}, "
-            f"output_pdf_pages={output_pdf_pages}"
+            f"output_pdf_pages={table.output_pages(layout_mode)}"
         )
         if plan.blank_pages:
-            line += f", blanks={plan.blank_pages} ({blank_placement})"
+            line += f", blanks={plan.blank_pages} ({table.blank_placement})"
         print(line)
     print()
 
@@ -637,41 +2729,429 @@ def print_console_summary(
 def add_signature_to_writer(
     *,
     writer: PdfWriter,
+    table: ImpositionTable,
     signature_pages: Sequence[BookPage],
-    blanks_to_add: int,
     blank_width: float,
     blank_height: float,
     layout_mode: str,
-    blank_placement: str,
+    imposition_method: str = "merge",
+    press: PressSheets | None = None,
 ) -> None:
     if layout_mode == "reading-order":
         add_reading_order_signature_to_writer(
             writer,
+            table,
             signature_pages=signature_pages,
-            blanks_to_add=blanks_to_add,
             blank_width=blank_width,
             blank_height=blank_height,
-            blank_placement=blank_placement,
         )
-    elif layout_mode == "imposed":
+    elif layout_mode in ("imposed", "imposed-nup"):
         add_imposed_signature_to_writer(
             writer,
+            table,
             signature_pages=signature_pages,
-            blanks_to_add=blanks_to_add,
             blank_width=blank_width,
             blank_height=blank_height,
-            blank_placement=blank_placement,
+            imposition_method=imposition_method,
+            press=press,
         )
     else:  # pragma: no cover - argparse should prevent this
         raise BookletError(f"Unsupported layout mode: {layout_mode}")
 
 
 
+class PageDigester:
+    """
+    Content hashes of source pages, including every object they reference.
+
+    Digests of indirect objects are remembered per reader, so fonts and images
+    shared by many pages are only hashed once per run.
+    """
+
+    def __init__(self) -> None:
+        self._memo: dict[tuple[int, int, int], bytes] = {}
+
+    def page_digest(self, page: PageObject) -> str:
+        hasher = hashlib.sha256()
+        self._feed(page, hasher, set())
+        return hasher.hexdigest()
+
+    def _feed(self, obj: object, hasher: "hashlib._Hash", active: set[tuple[int, int, int]]) -> None:
+        if isinstance(obj, IndirectObject):
+            key = (id(obj.pdf), obj.idnum, obj.generation)
+            digest = self._memo.get(key)
+            if digest is None:
+                if key in active:
+                    hasher.update(b"<cycle>")
+                    return
+                active.add(key)
+                sub_hasher = hashlib.sha256()
+                self._feed(obj.get_object(), sub_hasher, active)
+                active.discard(key)
+                digest = sub_hasher.digest()
+                self._memo[key] = digest
+            hasher.update(b"R" + digest)
+        elif isinstance(obj, DictionaryObject):
+            hasher.update(b"<<")
+            for key in sorted(obj.keys()):
+                if key in ("/Parent", "/P"):
+                    continue  # back-references to the page tree
+                hasher.update(key.encode("utf-8"))
+                self._feed(obj.raw_get(key), hasher, active)
+            hasher.update(b">>")
+            if isinstance(obj, StreamObject):
+                # The stored (still encoded) bytes are enough to detect changes.
+                hasher.update(b"stream")
+                hasher.update(stream_data(obj))
+        elif isinstance(obj, ArrayObject):
+            hasher.update(b"[")
+            for item in obj:
+                self._feed(item, hasher, active)
+            hasher.update(b"]")
+        else:
+            hasher.update(f"{type(obj).__name__}:{obj!r};".encode("utf-8"))
+
+
+class SignatureCache:
+    """
+    Manifest of the inputs each per-signature PDF was built from (--incremental).
+
+    Entries map output file names to a key covering the signature's source page
+    hashes and layout settings. A file whose key is unchanged is left as it is.
+
+    As a ``checkpoint`` (--resume) the manifest is saved after every finished
+    signature and also records each file's size and modification time, so a
+    file that was removed or changed after it was written is built again. It
+    is only picked up again by a run over the same inputs (``book``), and
+    lists every file a run is about to write before writing it.
+    """
+
+    def __init__(self, path: Path, *, checkpoint: bool = False, book: str | None = None) -> None:
+        self.path = path
+        self.checkpoint = checkpoint
+        self.book = book
+        self.entries: dict[str, Any] = {}
+        self.updated: dict[str, Any] = {}
+        self.reused: list[Path] = []
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if (
+            isinstance(data, dict)
+            and data.get("version") == SIGNATURE_CACHE_VERSION
+            and data.get("book") == book
+        ):
+            self.entries = dict(data.get("signatures", {}))
+        # Whether this run continues the one that saved the checkpoint.
+        self.resumes = checkpoint and bool(self.entries)
+
+    def tracks(self, out_path: Path) -> bool:
+        # Only files an earlier run of this book wrote (or was about to
+        # write) may be replaced without --overwrite.
+        return out_path.name in self.entries
+
+    def reserve(self, out_paths: Sequence[Path]) -> None:
+        # A checkpoint lists each file before it is written, so a file that
+        # was finished after the last save still counts as this book's.
+        if not self.checkpoint:
+            return
+        for out_path in out_paths:
+            self.updated.setdefault(out_path.name, {"key": None, "file": None})
+        self.save()
+
+    def is_current(self, out_path: Path, key: str) -> bool:
+        entry = self.entries.get(out_path.name)
+        if not self.checkpoint:
+            return out_path.exists() and entry == key
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return False
+        stamp = file_stamp(out_path)
+        return stamp is not None and entry.get("file") == list(stamp)
+
+    def record(self, out_path: Path, key: str) -> None:
+        if not self.checkpoint:
+            self.updated[out_path.name] = key
+            return
+        stamp = file_stamp(out_path)
+        self.updated[out_path.name] = {"key": key, "file": list(stamp) if stamp is not None else None}
+        self.save()
+
+    def save(self) -> None:
+        data: dict[str, Any] = {"version": SIGNATURE_CACHE_VERSION, "signatures": dict(sorted(self.updated.items()))}
+        if self.book is not None:
+            data["book"] = self.book
+        with AtomicFile(self.path) as handle:
+            handle.write((json.dumps(data, indent=2) + "\n").encode("utf-8"))
+
+
+def book_fingerprint(sources: Sequence[SourceDocument]) -> str:
+    paths = "\n".join(str(source.path.resolve()) for source in sources)
+    return hashlib.sha256(paths.encode("utf-8")).hexdigest()
+
+
+def signature_cache_key(
+    job: SignatureJob,
+    *,
+    sources: Sequence[SourceDocument],
+    signature_pages: Sequence[BookPage],
+    digester: PageDigester,
+) -> str:
+    # sheets_per_signature and tail_mode are covered by the plan's page counts.
+    settings = asdict(job)
+    settings.pop("out_path")
+    settings.pop("mod_date")
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+    hasher.update(f"version={SIGNATURE_CACHE_VERSION};".encode("utf-8"))
+    hasher.update(", ".join(source.path.name for source in sources).encode("utf-8"))
+    for book_page in signature_pages:
+        hasher.update(digester.page_digest(book_page.page).encode("ascii"))
+    return hasher.hexdigest()
+
+
+
+def impose_signature(
+    job: SignatureJob,
+    *,
+    sources: Sequence[SourceDocument],
+    book_pages: LazyBookPages,
+    profiler: RunProfiler | None = None,
+) -> PdfWriter:
+    plan = job.plan
+    with profile_stage(profiler, "impose", signature=plan.index, pages=plan.real_pages):
+        writer = make_writer_with_metadata(
+            base_name=job.base_name,
+            sources=sources,
+            plan_label=f"signature {plan.index:02d} ({job.layout_mode})",
+            layout_mode=job.layout_mode,
+            mod_date=job.mod_date,
+        )
+        scheme = fold_scheme(job.pages_per_side)
+        press = press_sheets_for(
+            writer,
+            scheme,
+            blank_width=job.blank_width,
+            blank_height=job.blank_height,
+            copies=job.copies,
+            gang=job.gang,
+        )
+        add_signature_to_writer(
+            writer=writer,
+            table=ImpositionTable(
+                plan,
+                get_blank_placement_for_plan(plan, job.plan_count, job.final_blank_placement),
+                scheme,
+            ),
+            signature_pages=signature_book_pages(book_pages, plan),
+            blank_width=job.blank_width,
+            blank_height=job.blank_height,
+            layout_mode=job.layout_mode,
+            imposition_method=job.imposition_method,
+            press=press,
+        )
+        if press is not None:
+            press.close()
+    return writer
+
+
+def write_signature_pdf(
+    job: SignatureJob,
+    *,
+    sources: Sequence[SourceDocument],
+    book_pages: LazyBookPages,
+    profiler: RunProfiler | None = None,
+    threads: int = 1,
+    skip_unchanged: bool = False,
+) -> bool:
+    plan = job.plan
+    with profile_stage(profiler, "signature", signature=plan.index, pages=plan.real_pages):
+        writer = impose_signature(job, sources=sources, book_pages=book_pages, profiler=profiler)
+        with profile_stage(profiler, "write_pdf", signature=plan.index):
+            written = write_pdf(job.out_path, writer, job.optimization, threads=threads, skip_unchanged=skip_unchanged)
+        book_pages.release()
+    return written
+
+
+
+class WritePipeline:
+    """
+    Writes finished signatures to disk on a thread pool while the caller
+    imposes the next ones.
+
+    submit() blocks once ``depth`` writers are queued or being written, so
+    at most that many imposed signatures are held in memory. Results come
+    back in submission order: drain_ready() hands over the writes finished
+    so far while the caller keeps submitting, results() waits for the rest.
+    The first failed write is raised from submit() or results(), whichever
+    sees it first.
+    """
+
+    def __init__(self, threads: int, depth: int | None = None) -> None:
+        self._slots = threading.BoundedSemaphore(depth or threads)
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="pdf-writer")
+        self._pending: deque[Future[Any]] = deque()
+
+    def __enter__(self) -> WritePipeline:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+    def submit(self, write: Callable[[], Any]) -> None:
+        self._slots.acquire()
+        for future in self._pending:
+            if future.done() and future.exception() is not None:
+                self._slots.release()
+                future.result()
+        future = self._executor.submit(write)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending.append(future)
+
+    def drain_ready(self) -> Iterator[Any]:
+        # Failed or cancelled writes are left for submit() or results() to raise.
+        while self._pending and self._pending[0].done() and not self._pending[0].cancelled():
+            if self._pending[0].exception() is not None:
+                return
+            yield self._pending.popleft().result()
+
+    def results(self) -> Iterator[Any]:
+        while self._pending:
+            yield self._pending.popleft().result()
+
+
+@dataclass
+class WorkerTask:
+    input_paths: tuple[str, ...]
+    job: SignatureJob
+    profile: bool = False
+    use_mmap: bool = False
+    skip_unchanged: bool = False
+
+
+# Per-process state for --jobs workers. Tasks carry their own input paths so
+# one pool can serve several books (--manifest); each worker parses an input
+# once and reuses its readers for every signature it is handed.
+_worker_source_cache = SourceCache()
+_worker_book_pages: LazyBookPages | None = None
+_worker_profiler: RunProfiler | None = None
+
+
+def _worker_book_pages_for(input_paths: tuple[str, ...], use_mmap: bool = False) -> LazyBookPages:
+    global _worker_book_pages
+    # The source cache re-opens inputs that changed on disk (--watch), so
+    # comparing readers tells whether the cached page sequence is still valid.
+    sources = load_sources(input_paths, cache=_worker_source_cache, use_mmap=use_mmap)
+    current = [(source.path, source.reader) for source in sources]
+    if _worker_book_pages is None or [(s.path, s.reader) for s in _worker_book_pages.sources] != current:
+        _worker_book_pages, _, _, _ = build_book_pages(sources)
+    return _worker_book_pages
+
+
+def _run_signature_job(task: WorkerTask) -> tuple[Path, bool, list[dict[str, Any]]]:
+    global _worker_profiler
+    if task.profile and _worker_profiler is None:
+        _worker_profiler = RunProfiler()
+    profiler = _worker_profiler if task.profile else None
+    book_pages = _worker_book_pages_for(task.input_paths, task.use_mmap)
+    written = write_signature_pdf(
+        task.job,
+        sources=book_pages.sources,
+        book_pages=book_pages,
+        profiler=profiler,
+        skip_unchanged=task.skip_unchanged,
+    )
+    records: list[dict[str, Any]] = []
+    if profiler is not None:
+        records = list(profiler.records)
+        profiler.records.clear()
+    return task.job.out_path, written, records
+
+
+def layout_file_suffix(layout_mode: str, scheme: FoldScheme) -> str:
+    if layout_mode == "reading-order":
+        return "reading_order"
+    if layout_mode == "imposed":
+        return "imposed"
+    return f"imposed_{scheme.pages_per_side}up"
+
+
+def impose_book(
+    *,
+    sources: Sequence[SourceDocument],
+    book_pages: LazyBookPages,
+    tables: Sequence[ImpositionTable],
+    blank_width: float,
+    blank_height: float,
+    base_name: str,
+    layout_mode: str,
+    imposition_method: str = "merge",
+    profiler: RunProfiler | None = None,
+    mod_date: str | None = None,
+    copies: int = 1,
+    gang: bool = False,
+) -> PdfWriter:
+    writer = make_writer_with_metadata(
+        base_name=base_name,
+        sources=sources,
+        plan_label=f"all signatures ({layout_mode})",
+        layout_mode=layout_mode,
+        mod_date=mod_date,
+    )
+    press = press_sheets_for(
+        writer, tables[0].scheme, blank_width=blank_width, blank_height=blank_height, copies=copies, gang=gang
+    )
+    for table in tables:
+        plan = table.plan
+        with profile_stage(profiler, "impose", signature=plan.index, pages=plan.real_pages):
+            add_signature_to_writer(
+                writer=writer,
+                table=table,
+                signature_pages=signature_book_pages(book_pages, plan),
+                blank_width=blank_width,
+                blank_height=blank_height,
+                layout_mode=layout_mode,
+                imposition_method=imposition_method,
+                press=press,
+            )
+            book_pages.release()
+    if press is not None:
+        press.close()
+    return writer
+
+
+def check_output_options(
+    *,
+    output_mode: str,
+    layout_mode: str,
+    jobs: int = 1,
+    write_threads: int = 0,
+    max_memory: int | None = None,
+    optimization: OutputOptimization = OutputOptimization(),
+    cached: bool = False,
+    copies: int = 1,
+    gang: bool = False,
+) -> None:
+    if jobs < 1:
+        raise BookletError("--jobs must be at least 1.")
+    if write_threads < 0:
+        raise BookletError("--write-threads must not be negative.")
+    if max_memory is not None and output_mode != "single":
+        raise BookletError("--max-memory only applies to --output-mode single.")
+    if max_memory is not None and optimization.enabled:
+        raise BookletError("--optimize-output and --compress-level cannot be combined with --max-memory.")
+    if cached and output_mode != "per-signature":
+        raise BookletError("--incremental and --resume require --output-mode per-signature.")
+    check_press_options(layout_mode, output_mode, copies, gang)
+    if max_memory is not None and (copies > 1 or gang):
+        raise BookletError("--copies and --gang cannot be combined with --max-memory.")
+
+
 def generate_outputs(
     *,
     sources: Sequence[SourceDocument],
-    book_pages: Sequence[BookPage],
-    plans: Sequence[SignaturePlan],
+    book_pages: LazyBookPages,
+    tables: Sequence[ImpositionTable],
     blank_width: float,
     blank_height: float,
     output_folder: Path,
@@ -680,58 +3160,197 @@ def generate_outputs(
     layout_mode: str,
     final_blank_placement: str,
     overwrite: bool,
+    jobs: int = 1,
+    imposition_method: str = "merge",
+    cache: SignatureCache | None = None,
+    profiler: RunProfiler | None = None,
+    max_memory: int | None = None,
+    executor: ProcessPoolExecutor | None = None,
+    optimization: OutputOptimization = OutputOptimization(),
+    write_threads: int = 0,
+    use_mmap: bool = False,
+    unchanged: list[Path] | None = None,
+    copies: int = 1,
+    gang: bool = False,
+    warnings: list[str] | None = None,
 ) -> list[Path]:
+    # Outputs identical to the file already on disk are left alone and added
+    # to ``unchanged`` when it is given, instead of being rewritten. Problems
+    # only found while writing (--max-memory) are added to ``warnings``.
+    check_output_options(
+        output_mode=output_mode,
+        layout_mode=layout_mode,
+        jobs=jobs,
+        write_threads=write_threads,
+        max_memory=max_memory,
+        optimization=optimization,
+        cached=cache is not None,
+        copies=copies,
+        gang=gang,
+    )
     generated: list[Path] = []
+    layout_suffix = layout_file_suffix(layout_mode, tables[0].scheme)
+    skip_unchanged = unchanged is not None
+    mod_date = pdf_date(source_date(sources)) if skip_unchanged else None
 
-    layout_suffix = "reading_order" if layout_mode == "reading-order" else "imposed"
+    def record_output(out_path: Path, written: bool) -> None:
+        generated.append(out_path)
+        if not written and unchanged is not None:
+            unchanged.append(out_path)
 
     if output_mode == "per-signature":
-        for plan in plans:
-            label = f"signature {plan.index:02d} ({layout_mode})"
-            writer = make_writer_with_metadata(
-                base_name=base_name,
-                sources=sources,
-                plan_label=label,
-                layout_mode=layout_mode,
-            )
-            sig_pages = signature_book_pages(book_pages, plan)
-            blank_placement = get_blank_placement_for_plan(plan, len(plans), final_blank_placement)
-            add_signature_to_writer(
-                writer=writer,
-                signature_pages=sig_pages,
-                blanks_to_add=plan.blank_pages,
+        signature_jobs = [
+            SignatureJob(
+                plan=table.plan,
+                plan_count=len(tables),
+                out_path=output_folder / f"{base_name}_sig{table.plan.index:02d}_{layout_suffix}.pdf",
                 blank_width=blank_width,
                 blank_height=blank_height,
+                base_name=base_name,
                 layout_mode=layout_mode,
-                blank_placement=blank_placement,
+                final_blank_placement=final_blank_placement,
+                imposition_method=imposition_method,
+                optimization=optimization,
+                pages_per_side=table.scheme.pages_per_side,
+                mod_date=mod_date,
+                copies=copies,
+                gang=gang,
             )
-            out_path = output_folder / f"{base_name}_sig{plan.index:02d}_{layout_suffix}.pdf"
-            check_output_path(out_path, overwrite)
-            write_pdf(out_path, writer)
-            generated.append(out_path)
-    elif output_mode == "single":
-        writer = make_writer_with_metadata(
+            for table in tables
+        ]
+        cache_keys: dict[Path, str] = {}
+        if cache is not None:
+            digester = PageDigester()
+            stale_jobs: list[SignatureJob] = []
+            for job in signature_jobs:
+                with profile_stage(profiler, "cache_key", signature=job.plan.index):
+                    key = signature_cache_key(
+                        job,
+                        sources=sources,
+                        signature_pages=signature_book_pages(book_pages, job.plan),
+                        digester=digester,
+                    )
+                    book_pages.release()
+                if cache.is_current(job.out_path, key):
+                    cache.record(job.out_path, key)
+                    cache.reused.append(job.out_path)
+                else:
+                    cache_keys[job.out_path] = key
+                    stale_jobs.append(job)
+            signature_jobs = stale_jobs
+            for job in signature_jobs:
+                check_output_path(job.out_path, overwrite or cache.tracks(job.out_path))
+            cache.reserve([job.out_path for job in signature_jobs])
+
+        def allow_overwrite(path: Path) -> bool:
+            return overwrite or (cache is not None and cache.tracks(path))
+
+        def finish(out_path: Path, written: bool) -> None:
+            record_output(out_path, written)
+            if cache is not None:
+                cache.record(out_path, cache_keys[out_path])
+
+        if (jobs > 1 or executor is not None) and len(signature_jobs) > 1:
+            for job in signature_jobs:
+                check_output_path(job.out_path, allow_overwrite(job.out_path))
+            input_paths = tuple(str(source.path) for source in sources)
+            tasks = [
+                WorkerTask(input_paths, job, profiler is not None, use_mmap, skip_unchanged) for job in signature_jobs
+            ]
+            pool: ContextManager[ProcessPoolExecutor]
+            if executor is not None:
+                pool = nullcontext(executor)
+            else:
+                pool = ProcessPoolExecutor(max_workers=min(jobs, len(tasks)))
+            with pool as pool_executor:
+                for out_path, written, records in pool_executor.map(_run_signature_job, tasks):
+                    finish(out_path, written)
+                    if profiler is not None:
+                        profiler.records.extend(records)
+        elif write_threads > 0 and len(signature_jobs) > 1:
+            for job in signature_jobs:
+                check_output_path(job.out_path, allow_overwrite(job.out_path))
+
+            def write_job(job: SignatureJob, writer: PdfWriter) -> tuple[Path, bool]:
+                with profile_stage(profiler, "write_pdf", signature=job.plan.index):
+                    written = write_pdf(
+                        job.out_path, writer, job.optimization, threads=jobs, skip_unchanged=skip_unchanged
+                    )
+                return job.out_path, written
+
+            pipeline = WritePipeline(write_threads)
+            try:
+                with pipeline:
+                    for job in signature_jobs:
+                        writer = impose_signature(job, sources=sources, book_pages=book_pages, profiler=profiler)
+                        book_pages.release()
+                        pipeline.submit(lambda job=job, writer=writer: write_job(job, writer))
+                        del writer
+                        # Finished signatures are recorded (--incremental, --resume)
+                        # while later ones are still being imposed.
+                        for out_path, written in pipeline.drain_ready():
+                            finish(out_path, written)
+                    for out_path, written in pipeline.results():
+                        finish(out_path, written)
+            finally:
+                # After an error or Ctrl+C the pipeline has waited for the
+                # writes in progress; record those too so --resume skips them.
+                for out_path, written in pipeline.drain_ready():
+                    finish(out_path, written)
+        else:
+            for job in signature_jobs:
+                check_output_path(job.out_path, allow_overwrite(job.out_path))
+                written = write_signature_pdf(
+                    job,
+                    sources=sources,
+                    book_pages=book_pages,
+                    profiler=profiler,
+                    threads=jobs,
+                    skip_unchanged=skip_unchanged,
+                )
+                finish(job.out_path, written)
+        if cache is not None:
+            cache.save()
+    elif output_mode == "single" and max_memory is not None:
+        out_path = output_folder / f"{base_name}_all_signatures_{layout_suffix}.pdf"
+        check_output_path(out_path, overwrite)
+        written = write_single_pdf_streaming(
+            out_path=out_path,
+            sources=sources,
+            book_pages=book_pages,
+            tables=tables,
+            blank_width=blank_width,
+            blank_height=blank_height,
             base_name=base_name,
+            layout_mode=layout_mode,
+            imposition_method=imposition_method,
+            max_memory=max_memory,
+            profiler=profiler,
+            mod_date=mod_date,
+            skip_unchanged=skip_unchanged,
+            warnings=warnings,
+        )
+        record_output(out_path, written)
+    elif output_mode == "single":
+        writer = impose_book(
             sources=sources,
-            plan_label=f"all signatures ({layout_mode})",
+            book_pages=book_pages,
+            tables=tables,
+            blank_width=blank_width,
+            blank_height=blank_height,
+            base_name=base_name,
             layout_mode=layout_mode,
+            imposition_method=imposition_method,
+            profiler=profiler,
+            mod_date=mod_date,
+            copies=copies,
+            gang=gang,
         )
-        for plan in plans:
-            sig_pages = signature_book_pages(book_pages, plan)
-            blank_placement = get_blank_placement_for_plan(plan, len(plans), final_blank_placement)
-            add_signature_to_writer(
-                writer=writer,
-                signature_pages=sig_pages,
-                blanks_to_add=plan.blank_pages,
-                blank_width=blank_width,
-                blank_height=blank_height,
-                layout_mode=layout_mode,
-                blank_placement=blank_placement,
-            )
         out_path = output_folder / f"{base_name}_all_signatures_{layout_suffix}.pdf"
         check_output_path(out_path, overwrite)
-        write_pdf(out_path, writer)
-        generated.append(out_path)
+        with profile_stage(profiler, "write_pdf"):
+            written = write_pdf(out_path, writer, optimization, threads=jobs, skip_unchanged=skip_unchanged)
+        record_output(out_path, written)
     else:  # pragma: no cover - argparse should prevent this
         raise BookletError(f"Unsupported output mode: {output_mode}")
 
@@ -739,54 +3358,281 @@ def generate_outputs(
 
 
 
-def main(argv: Sequence[str]) -> int:
-    try:
-        args = parse_args(argv)
-        output_folder = Path(args.output_folder).expanduser().resolve()
-        output_folder.mkdir(parents=True, exist_ok=True)
+@dataclass
+class BookletBuild:
+    tables: list[ImpositionTable]
+    outputs: dict[str, BytesIO]  # file name -> PDF, empty when written to a sink
+    plan: str
+    warnings: list[str]
+
+
+class BookletEngine:
+    """
+    Builds booklets in-process, without argparse or an output folder.
+
+    Inputs may be paths, bytes or binary file-like objects, and outputs come
+    back as in-memory buffers or are written to streams opened by ``sink``.
+    Parsed inputs stay in a SourceCache between builds, so a service that
+    keeps one engine parses shared inputs once. Builds on one engine run one
+    at a time because they share the cached readers.
+    """
+
+    def __init__(self, max_cached_sources: int = 16) -> None:
+        self.source_cache = SourceCache(max_cached_sources)
+        self._lock = threading.Lock()
+
+    def load(self, inputs: Sequence[str | Path | bytes | IO[bytes]]) -> list[SourceDocument]:
+        problems: list[str] = []
+        sources: list[SourceDocument] = []
+        for number, item in enumerate(inputs, start=1):
+            if isinstance(item, (str, Path)):
+                try:
+                    path = ensure_pdf_path(str(item))
+                except BookletError as exc:
+                    problems.append(str(exc))
+                    continue
+                source, source_problems = inspect_source(lambda: self.source_cache.load(path))
+            else:
+                if isinstance(item, (bytes, bytearray, memoryview)):
+                    data, name = bytes(item), ""
+                else:
+                    data, name = item.read(), Path(str(getattr(item, "name", ""))).name
+                name = name or f"input{number:02d}.pdf"
+                source, source_problems = inspect_source(lambda: self.source_cache.load_bytes(data, name))
+            problems.extend(source_problems)
+            if source is not None:
+                sources.append(source)
+        if not inputs:
+            problems.append("There are no book pages to process.")
+        raise_input_problems(problems)
+        return sources
+
+    def build(
+        self,
+        inputs: Sequence[str | Path | bytes | IO[bytes]],
+        *,
+        base_name: str = "book",
+        output_mode: str = "per-signature",
+        layout_mode: str = "reading-order",
+        pages_per_side: int = 4,
+        sheets_per_signature: int = 4,
+        tail_mode: str = "short",
+        final_blank_placement: str = "back",
+        auto_signature: bool = False,
+        min_sheets_per_signature: int = 1,
+        max_sheets_per_signature: int | None = None,
+        imposition_method: str = "merge",
+        copies: int = 1,
+        gang: bool = False,
+        optimization: OutputOptimization = OutputOptimization(),
+        plan_format: str = "text",
+        sink: Callable[[str], ContextManager[IO[bytes]]] | None = None,
+    ) -> BookletBuild:
+        if output_mode not in ("per-signature", "single"):
+            raise BookletError(f"Unsupported output mode: {output_mode}")
+        if plan_format not in PLAN_FORMATS:
+            raise BookletError(f"Unsupported plan format: {plan_format}")
+        check_press_options(layout_mode, output_mode, copies, gang)
+        with self._lock:
+            sources = self.load(inputs)
+            book_pages, blank_width, blank_height, warnings = build_book_pages(sources)
+            tables = plan_book(
+                len(book_pages),
+                layout_mode=layout_mode,
+                sheets_per_signature=sheets_per_signature,
+                tail_mode=tail_mode,
+                final_blank_placement=final_blank_placement,
+                pages_per_side=pages_per_side,
+                auto_signature=auto_signature,
+                min_sheets_per_signature=min_sheets_per_signature,
+                max_sheets_per_signature=max_sheets_per_signature,
+            )
+            suffix = layout_file_suffix(layout_mode, tables[0].scheme)
+            outputs: dict[str, BytesIO] = {}
+
+            def emit(name: str, writer: PdfWriter) -> None:
+                if sink is not None:
+                    with sink(name) as handle:
+                        write_pdf_to(handle, writer, optimization)
+                    return
+                buffer = BytesIO()
+                write_pdf_to(buffer, writer, optimization)
+                buffer.seek(0)
+                outputs[name] = buffer
+
+            if output_mode == "single":
+                writer = impose_book(
+                    sources=sources,
+                    book_pages=book_pages,
+                    tables=tables,
+                    blank_width=blank_width,
+                    blank_height=blank_height,
+                    base_name=base_name,
+                    layout_mode=layout_mode,
+                    imposition_method=imposition_method,
+                    copies=copies,
+                    gang=gang,
+                )
+                emit(f"{base_name}_all_signatures_{suffix}.pdf", writer)
+            else:
+                for table in tables:
+                    name = f"{base_name}_sig{table.plan.index:02d}_{suffix}.pdf"
+                    job = SignatureJob(
+                        plan=table.plan,
+                        plan_count=len(tables),
+                        out_path=Path(name),
+                        blank_width=blank_width,
+                        blank_height=blank_height,
+                        base_name=base_name,
+                        layout_mode=layout_mode,
+                        final_blank_placement=final_blank_placement,
+                        imposition_method=imposition_method,
+                        optimization=optimization,
+                        pages_per_side=table.scheme.pages_per_side,
+                        copies=copies,
+                        gang=gang,
+                    )
+                    emit(name, impose_signature(job, sources=sources, book_pages=book_pages))
+                    book_pages.release()
 
-        sources = load_sources(args.inputs)
-        book_pages, blank_width, blank_height, warnings = build_book_pages(sources)
-        plans = build_signature_plan(
-            total_book_pages=len(book_pages),
-            sheets_per_signature=args.sheets_per_signature,
-            tail_mode=args.tail_mode,
-        )
+            _, iter_plan = PLAN_FORMATS[plan_format]
+            plan_lines = iter_plan(
+                sources=sources,
+                tables=tables,
+                output_mode=output_mode,
+                tail_mode=tail_mode,
+                sheets_per_signature=sheets_per_signature,
+                layout_mode=layout_mode,
+                final_blank_placement=final_blank_placement,
+                warnings=warnings,
+                auto_signature=auto_signature,
+            )
+            plan = "".join(f"{line}\n" for line in plan_lines)
+            return BookletBuild(tables=tables, outputs=outputs, plan=plan, warnings=list(warnings))
 
-        plan_text = build_plan_text(
-            sources=sources,
-            plans=plans,
-            output_mode=args.output_mode,
-            tail_mode=args.tail_mode,
-            sheets_per_signature=args.sheets_per_signature,
+
+def run_booklet(
+    args: argparse.Namespace,
+    *,
+    source_cache: SourceCache | None = None,
+    executor: ProcessPoolExecutor | None = None,
+) -> BookletRunResult:
+    started = time.perf_counter()
+    output_folder = Path(args.output_folder).expanduser().resolve()
+    output_folder.mkdir(parents=True, exist_ok=True)
+    profiler = RunProfiler() if args.profile else None
+
+    if args.dry_run:
+        # Planning only needs page counts and page sizes, which come from
+        # the page trees without loading any page content.
+        with profile_stage(profiler, "load_plan_sources"):
+            sources, blank_width, blank_height, warnings = load_plan_sources(args.inputs)
+        book_pages = None
+    else:
+        with profile_stage(profiler, "load_sources"):
+            sources = load_sources(args.inputs, cache=source_cache, use_mmap=args.mmap_inputs)
+        with profile_stage(profiler, "build_book_pages"):
+            book_pages, blank_width, blank_height, warnings = build_book_pages(sources)
+    total_input_pages = sum(source.page_count for source in sources)
+    with profile_stage(profiler, "build_signature_plan"):
+        tables = plan_book(
+            total_input_pages,
             layout_mode=args.layout_mode,
+            sheets_per_signature=args.sheets_per_signature,
+            tail_mode=args.tail_mode,
             final_blank_placement=args.final_blank_placement,
-            warnings=warnings,
+            pages_per_side=args.pages_per_side,
+            auto_signature=args.auto_signature,
+            min_sheets_per_signature=args.min_sheets_per_signature,
+            max_sheets_per_signature=args.max_sheets_per_signature,
         )
 
-        plan_path = output_folder / f"{args.base_name}_signature_plan.txt"
-        write_plan_file(plan_path, plan_text, overwrite=args.overwrite)
+    plan_suffix, iter_plan = PLAN_FORMATS[args.plan_format]
+    plan_path = output_folder / f"{args.base_name}_signature_plan{plan_suffix}"
+
+    plan_lines = iter_plan(
+        sources=sources,
+        tables=tables,
+        output_mode=args.output_mode,
+        tail_mode=args.tail_mode,
+        sheets_per_signature=args.sheets_per_signature,
+        layout_mode=args.layout_mode,
+        final_blank_placement=args.final_blank_placement,
+        warnings=warnings,
+        auto_signature=args.auto_signature,
+    )
+    cache = None
+    if args.resume:
+        # The checkpoint holds everything the --incremental cache does.
+        cache = SignatureCache(
+            output_folder / f"{args.base_name}_checkpoint.json", checkpoint=True, book=book_fingerprint(sources)
+        )
+    elif args.incremental:
+        cache = SignatureCache(output_folder / f"{args.base_name}_signature_cache.json")
+    # A resumed run replaces the reports of the run it continues.
+    replace_reports = args.overwrite or (cache is not None and cache.resumes)
+    with profile_stage(profiler, "write_plan_file"):
+        write_plan_file(plan_path, plan_lines, overwrite=replace_reports)
+        plan_paths = [plan_path]
+        if args.export_imposition:
+            export_path = output_folder / f"{args.base_name}_imposition.json"
+            settings = plan_settings(
+                tables,
+                args.output_mode,
+                args.tail_mode,
+                args.sheets_per_signature,
+                args.layout_mode,
+                args.final_blank_placement,
+                args.auto_signature,
+            )
+            write_imposition_export(export_path, tables, settings=settings, overwrite=replace_reports)
+            plan_paths.append(export_path)
+    profile_path = output_folder / f"{args.base_name}_profile.json"
+    if profiler is not None:
+        check_output_path(profile_path, replace_reports)
+    else:
+        # Without --profile there is no throughput figure yet, so the
+        # summary is printed before the (possibly long) generation step.
         print_console_summary(
-            plans,
-            total_input_pages=len(book_pages),
+            tables,
+            total_input_pages=total_input_pages,
             layout_mode=args.layout_mode,
             final_blank_placement=args.final_blank_placement,
         )
 
-        if warnings:
-            print("Warnings:")
-            for warning in warnings:
-                print(f"- {warning}")
-            print()
-
-        if args.dry_run:
-            print(f"Dry run complete. Plan file written to: {plan_path}")
-            return 0
+    if warnings:
+        print("Warnings:")
+        for warning in warnings:
+            print(f"- {warning}")
+        print()
+
+    if args.dry_run:
+        if profiler is not None:
+            print_console_summary(
+                tables,
+                total_input_pages=total_input_pages,
+                layout_mode=args.layout_mode,
+                final_blank_placement=args.final_blank_placement,
+            )
+            profiler.write_report(profile_path, options=vars(args), total_input_pages=total_input_pages)
+            print(f"Profile written to: {profile_path}")
+        print(f"Dry run complete. Plan file written to: {', '.join(str(path) for path in plan_paths)}")
+        return BookletRunResult(
+            base_name=args.base_name,
+            total_input_pages=total_input_pages,
+            signatures=len(tables),
+            generated=plan_paths,
+            seconds=time.perf_counter() - started,
+        )
+    assert book_pages is not None
 
+    unchanged: list[Path] | None = [] if args.skip_unchanged else None
+    late_warnings: list[str] = []
+    with profile_stage(profiler, "generate_outputs"):
         generated_paths = generate_outputs(
             sources=sources,
             book_pages=book_pages,
-            plans=plans,
+            tables=tables,
             blank_width=blank_width,
             blank_height=blank_height,
             output_folder=output_folder,
@@ -795,14 +3641,225 @@ def main(argv: Sequence[str]) -> int:
             layout_mode=args.layout_mode,
             final_blank_placement=args.final_blank_placement,
             overwrite=args.overwrite,
+            jobs=args.jobs,
+            imposition_method=args.imposition_method,
+            cache=cache,
+            profiler=profiler,
+            max_memory=args.max_memory,
+            executor=executor,
+            optimization=OutputOptimization(optimize=args.optimize_output, compress_level=args.compress_level),
+            write_threads=args.write_threads,
+            use_mmap=args.mmap_inputs,
+            unchanged=unchanged,
+            copies=args.copies,
+            gang=args.gang,
+            warnings=late_warnings,
+        )
+
+    if profiler is not None:
+        print_console_summary(
+            tables,
+            total_input_pages=total_input_pages,
+            layout_mode=args.layout_mode,
+            final_blank_placement=args.final_blank_placement,
+            throughput=pages_per_second(total_input_pages, profiler.stage_wall_seconds("generate_outputs")),
         )
 
-        print("Generated files:")
-        for path in generated_paths:
-            print(f"- {path}")
-        print(f"- {plan_path}")
-        return 0
+    if late_warnings:
+        print("Warnings:")
+        for warning in late_warnings:
+            print(f"- {warning}")
+        print()
+    if cache is not None and cache.reused:
+        print(f"Unchanged signatures kept from the previous run: {len(cache.reused)}")
+        print()
+    if unchanged:
+        print(f"Outputs identical to the existing files, left untouched: {len(unchanged)}")
+        print()
+
+    print("Generated files:")
+    for path in generated_paths:
+        print(f"- {path}")
+    for path in plan_paths:
+        print(f"- {path}")
+    if cache is not None:
+        print(f"- {cache.path}")
+    if profiler is not None:
+        profiler.write_report(profile_path, options=vars(args), total_input_pages=total_input_pages)
+        print(f"- {profile_path}")
+    return BookletRunResult(
+        base_name=args.base_name,
+        total_input_pages=total_input_pages,
+        signatures=len(tables),
+        generated=[*generated_paths, *plan_paths],
+        seconds=time.perf_counter() - started,
+    )
+
+
+MANIFEST_JOB_FIELDS = ("inputs", "output_folder")
 
+
+def load_manifest(path: Path) -> list[argparse.Namespace]:
+    if not path.exists():
+        raise BookletError(f"Manifest not found: {path}")
+    try:
+        if path.suffix.lower() == ".toml":
+            try:
+                import tomllib
+            except ModuleNotFoundError:  # pragma: no cover - Python < 3.11
+                try:
+                    import tomli as tomllib  # type: ignore[no-redef]
+                except ModuleNotFoundError:
+                    raise BookletError("TOML manifests need Python 3.11+ or the 'tomli' package.") from None
+            data = tomllib.loads(path.read_text(encoding="utf-8"))
+        else:
+            data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise BookletError(f"Could not read manifest '{path}': {exc}") from exc
+
+    if isinstance(data, list):
+        data = {"jobs": data}
+    if not isinstance(data, dict) or not isinstance(data.get("jobs"), list) or not data["jobs"]:
+        raise BookletError(f"Manifest needs a non-empty 'jobs' list: {path}")
+    defaults = data.get("defaults", {})
+    if not isinstance(defaults, dict):
+        raise BookletError(f"Manifest 'defaults' must be a table of options: {path}")
+
+    jobs: list[argparse.Namespace] = []
+    for number, entry in enumerate(data["jobs"], start=1):
+        if not isinstance(entry, dict):
+            raise BookletError(f"Manifest job {number} must be a table of options.")
+        options = {**defaults, **entry}
+        jobs.append(manifest_job_args(options, base_folder=path.parent, label=f"Manifest job {number}"))
+    return jobs
+
+
+def manifest_job_args(options: dict[str, Any], *, base_folder: Path, label: str) -> argparse.Namespace:
+    argv: list[str] = []
+    for key, value in options.items():
+        flag = "--" + key.replace("_", "-")
+        if key == "manifest":
+            raise BookletError(f"{label}: manifests cannot include other manifests.")
+        if key in MANIFEST_JOB_FIELDS:
+            values = value if isinstance(value, list) else [value]
+            value = [str(base_folder / Path(str(item)).expanduser()) for item in values]
+        if value is True:
+            argv.append(flag)
+        elif value is False or value is None:
+            continue
+        elif isinstance(value, list):
+            argv.extend([flag, *(str(item) for item in value)])
+        else:
+            argv.extend([flag, str(value)])
+    try:
+        return parse_args(argv)
+    except SystemExit:
+        # argparse has already printed what was wrong with the options.
+        raise BookletError(f"{label} has invalid options: {options}") from None
+
+
+def manifest_files(path: Path) -> list[Path]:
+    if path.is_dir():
+        return sorted(child for child in path.iterdir() if child.suffix.lower() in (".json", ".toml"))
+    return [path]
+
+
+def apply_command_line_switches(options: argparse.Namespace, args: argparse.Namespace) -> argparse.Namespace:
+    # Command-line switches apply to every job in a manifest.
+    options.overwrite = options.overwrite or args.overwrite
+    options.dry_run = options.dry_run or args.dry_run
+    options.profile = options.profile or args.profile
+    return options
+
+
+@contextmanager
+def shared_executor(jobs: int) -> Iterator[ProcessPoolExecutor | None]:
+    if jobs < 1:
+        raise BookletError("--jobs must be at least 1.")
+    if jobs == 1:
+        yield None
+        return
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        yield executor
+    finally:
+        executor.shutdown()
+
+
+def run_jobs(
+    job_args: Sequence[argparse.Namespace],
+    *,
+    source_cache: SourceCache,
+    executor: ProcessPoolExecutor | None,
+) -> list[JobOutcome]:
+    outcomes: list[JobOutcome] = []
+    for number, options in enumerate(job_args, start=1):
+        print(f"=== Job {number}/{len(job_args)}: {options.base_name} ===")
+        try:
+            result = run_booklet(options, source_cache=source_cache, executor=executor)
+        except BookletError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            outcomes.append(JobOutcome(number, options, None, str(exc)))
+        else:
+            outcomes.append(JobOutcome(number, options, result, "ok"))
+        print()
+    return outcomes
+
+
+def run_manifest(args: argparse.Namespace) -> int:
+    job_args: list[argparse.Namespace] = []
+    for manifest_path in manifest_files(Path(args.manifest).expanduser().resolve()):
+        job_args.extend(apply_command_line_switches(options, args) for options in load_manifest(manifest_path))
+    if not job_args:
+        raise BookletError(f"No .json or .toml manifests found in: {args.manifest}")
+
+    with shared_executor(args.jobs) as executor:
+        outcomes = run_jobs(job_args, source_cache=SourceCache(), executor=executor)
+
+    print_manifest_summary(outcomes)
+    return 2 if any(outcome.result is None for outcome in outcomes) else 0
+
+
+def print_manifest_summary(outcomes: Sequence[JobOutcome]) -> None:
+    print("Manifest summary")
+    print("=" * 16)
+    print(f"{'Job':>3}  {'Base name':<24} {'Pages':>7} {'Sigs':>5} {'Files':>5} {'Seconds':>8}  Status")
+    total_pages = total_signatures = total_files = 0
+    total_seconds = 0.0
+    for outcome in outcomes:
+        result = outcome.result
+        if result is None:
+            print(
+                f"{outcome.number:>3}  {outcome.options.base_name:<24} {'-':>7} {'-':>5} {'-':>5} {'-':>8}  "
+                f"failed: {outcome.status}"
+            )
+            continue
+        total_pages += result.total_input_pages
+        total_signatures += result.signatures
+        total_files += len(result.generated)
+        total_seconds += result.seconds
+        print(
+            f"{outcome.number:>3}  {result.base_name:<24} {result.total_input_pages:>7} {result.signatures:>5} "
+            f"{len(result.generated):>5} {result.seconds:>8.2f}  {outcome.status}"
+        )
+    failed = sum(1 for outcome in outcomes if outcome.result is None)
+    print(
+        f"{'':>3}  {'Total':<24} {total_pages:>7} {total_signatures:>5} {total_files:>5} {total_seconds:>8.2f}  "
+        f"{len(outcomes) - failed} ok, {failed} failed"
+    )
+
+
+def file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def run_cli(command: Callable[[], int]) -> int:
+    try:
+        return command()
     except BookletError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 2
@@ -811,5 +3868,27 @@ def main(argv: Sequence[str]) -> int:
         return 130
 
 
+def run_command(args: argparse.Namespace) -> int:
+    if args.manifest is not None:
+        return run_manifest(args)
+    run_booklet(args)
+    return 0
+
+
+def main(argv: Sequence[str]) -> int:
+    # The service and the watcher live in their own modules, which import
+    # this one, so they are only imported when asked for.
+    if argv and argv[0] == "serve":
+        import booklet_service
+
+        return booklet_service.main(argv[1:])
+    args = parse_args(argv)
+    if args.watch:
+        import booklet_watch
+
+        return booklet_watch.main(argv)
+    return run_cli(lambda: run_command(args))
+
+
 if __name__ == "__main__":
     raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Hot-folder watcher that rebuilds books with booklet_signatures_enhanced.py.
+
+Examples:
+    python booklet_signatures.py --manifest ./hot-folder --watch
+
+    or, the same, python booklet_watch.py --manifest ./hot-folder. Every
+    manifest in the folder is built once, then a book is rebuilt whenever
+    one of its inputs or its manifest changes. A single book given with
+    --inputs is watched the same way.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Sequence
+
+from booklet_signatures_enhanced import (
+    BookletError,
+    SourceCache,
+    apply_command_line_switches,
+    file_stamp,
+    load_manifest,
+    manifest_files,
+    parse_args,
+    print_manifest_summary,
+    run_cli,
+    run_jobs,
+    shared_executor,
+)
+
+
+class PollingWatcher:
+    """
+    Detects changes to a set of files by polling their modification times.
+
+    A change is only reported once the files have stopped changing for the
+    debounce period, so a chapter that is still being copied into the hot
+    folder does not trigger a rebuild of a half-written PDF.
+    """
+
+    def __init__(self, *, interval: float, debounce: float) -> None:
+        self.interval = interval
+        self.debounce = debounce
+        self.stamps: dict[Path, tuple[int, int] | None] = {}
+
+    def track(self, paths: set[Path]) -> None:
+        self.stamps = {path: stamp for path, stamp in self.stamps.items() if path in paths}
+        for path in paths - set(self.stamps):
+            self.stamps[path] = file_stamp(path)
+
+    def wait_for_changes(self, watched_paths: Callable[[], set[Path]]) -> set[Path]:
+        pending: dict[Path, tuple[int, int] | None] | None = None
+        pending_since = 0.0
+        while True:
+            current = {path: file_stamp(path) for path in watched_paths() | set(self.stamps)}
+            if any(current[path] != self.stamps.get(path) for path in current):
+                if current != pending:
+                    pending = current
+                    pending_since = time.monotonic()
+                elif time.monotonic() - pending_since >= self.debounce:
+                    changed = {path for path in current if current[path] != self.stamps.get(path)}
+                    self.stamps = {path: stamp for path, stamp in current.items() if stamp is not None}
+                    return changed
+            else:
+                pending = None
+            time.sleep(self.interval)
+
+
+def job_input_paths(options: argparse.Namespace) -> set[Path]:
+    return {Path(raw_path).expanduser().resolve() for raw_path in options.inputs}
+
+
+def run_watch(args: argparse.Namespace) -> int:
+    if args.watch_interval <= 0 or args.watch_debounce < 0:
+        raise BookletError("--watch-interval must be positive and --watch-debounce cannot be negative.")
+    manifest_root = Path(args.manifest).expanduser().resolve() if args.manifest is not None else None
+    watcher = PollingWatcher(interval=args.watch_interval, debounce=args.watch_debounce)
+    # Readers stay open between rebuilds; only inputs whose modification
+    # time or size changed are parsed again.
+    source_cache = SourceCache()
+    jobs: dict[Path | None, list[argparse.Namespace]] = {}
+
+    def prepare(options: argparse.Namespace) -> argparse.Namespace:
+        options = apply_command_line_switches(options, args)
+        if options.output_mode == "per-signature" and not options.dry_run:
+            # Rebuild only the signatures whose pages or settings changed.
+            options.incremental = True
+        return options
+
+    def reload(manifest_path: Path) -> list[argparse.Namespace]:
+        try:
+            jobs[manifest_path] = [prepare(options) for options in load_manifest(manifest_path)]
+        except BookletError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            jobs[manifest_path] = []
+        return jobs[manifest_path]
+
+    def watched_paths() -> set[Path]:
+        paths = set(manifest_files(manifest_root)) if manifest_root is not None else set()
+        for job_list in jobs.values():
+            for options in job_list:
+                paths |= job_input_paths(options)
+        return paths
+
+    if manifest_root is None:
+        jobs[None] = [prepare(args)]
+    else:
+        for manifest_path in manifest_files(manifest_root):
+            reload(manifest_path)
+    pending = [options for job_list in jobs.values() for options in job_list]
+
+    with shared_executor(args.jobs) as executor:
+        try:
+            while True:
+                paths = watched_paths()
+                watcher.track(paths)
+                source_cache.max_entries = max(source_cache.max_entries, len(paths))
+                if pending:
+                    outcomes = run_jobs(pending, source_cache=source_cache, executor=executor)
+                    for outcome in outcomes:
+                        if outcome.result is not None:
+                            # The outputs are ours now, so later rebuilds may replace them.
+                            outcome.options.overwrite = True
+                    print_manifest_summary(outcomes)
+                    print()
+                print(f"Watching {len(paths)} file(s) for changes. Press Ctrl+C to stop.")
+                changed = watcher.wait_for_changes(watched_paths)
+                print(f"Changed: {', '.join(sorted(path.name for path in changed))}")
+                print()
+
+                pending = []
+                if manifest_root is not None:
+                    current_manifests = set(manifest_files(manifest_root))
+                    for manifest_path in sorted(changed):
+                        if manifest_path in current_manifests:
+                            pending.extend(reload(manifest_path))
+                        elif manifest_path in jobs:
+                            print(f"Manifest removed, its jobs are no longer watched: {manifest_path}")
+                            del jobs[manifest_path]
+                for job_list in jobs.values():
+                    for options in job_list:
+                        if options not in pending and job_input_paths(options) & changed:
+                            pending.append(options)
+        except KeyboardInterrupt:
+            print("Stopped watching.")
+            return 0
+
+
+def main(argv: Sequence[str]) -> int:
+    return run_cli(lambda: run_watch(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
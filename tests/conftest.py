@@ -0,0 +1,74 @@
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import booklet_signatures_benchmark as benchmark  # noqa: E402
+import booklet_signatures_enhanced as booklet  # noqa: E402
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    # Small synthetic inputs from the benchmark corpus generator.
+    def make(name: str, pages: int, kind: str = "text") -> Path:
+        path = tmp_path / "inputs" / name
+        benchmark.generate_corpus_file(path, kind, pages, image_pixels=16)
+        return path
+
+    return make
+
+
+@pytest.fixture
+def single_output(tmp_path, make_pdf):
+    # Builds a text and image book into one PDF and returns its path.
+    inputs = [str(make_pdf("text.pdf", 24)), str(make_pdf("images.pdf", 10, kind="images"))]
+
+    def run(layout_mode: str, *options: str) -> Path:
+        output = tmp_path / f"{layout_mode}{''.join(options)}"
+        argv = [
+            "--inputs", *inputs,
+            "--output-folder", str(output),
+            "--layout-mode", layout_mode,
+            "--sheets-per-signature", "2",
+            "--output-mode", "single",
+            *options,
+        ]
+        assert booklet.main(argv) == 0
+        [path] = output.glob("*.pdf")
+        return path
+
+    return run
+
+
+def mask_mod_date(data: bytes) -> bytes:
+    # /ModDate is the time of the run, so it is masked before comparing.
+    return re.sub(rb"/ModDate \([^)]*\)", b"/ModDate ()", data)
+
+
+@pytest.fixture
+def masked():
+    return mask_mod_date
+
+
+@pytest.fixture
+def pdf_bytes():
+    # The masked bytes of every PDF in a folder, by file name.
+    def read(folder: Path) -> dict[str, bytes]:
+        return {path.name: mask_mod_date(path.read_bytes()) for path in sorted(folder.glob("*.pdf"))}
+
+    return read
+
+
+@pytest.fixture
+def page_summary():
+    # The page labels and /MediaBox of every page of a generated PDF.
+    def summary(path: Path) -> list:
+        return [
+            (re.findall(r"\w+ page \d+", page.extract_text()), [float(value) for value in page.mediabox])
+            for page in booklet.PdfReader(str(path)).pages
+        ]
+
+    return summary
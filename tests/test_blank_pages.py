@@ -0,0 +1,62 @@
+import pytest
+
+import booklet_signatures_enhanced as booklet
+
+
+@pytest.fixture
+def blank_pages_added(monkeypatch):
+    # The sizes of the pages added with add_blank_page(), which needs no
+    # scratch page to merge book pages onto and clone.
+    added = []
+    add_blank_page = booklet.PdfWriter.add_blank_page
+
+    def recording_add_blank_page(writer, width=None, height=None):
+        added.append((width, height))
+        return add_blank_page(writer, width, height)
+
+    monkeypatch.setattr(booklet.PdfWriter, "add_blank_page", recording_add_blank_page)
+    return added
+
+
+def test_blank_sheet_sides_skip_the_scratch_page(tmp_path, make_pdf, blank_pages_added):
+    # Two pages in a two-sheet signature: the whole second sheet is blank.
+    source = make_pdf("book.pdf", 2)
+    blank_pages_added.clear()  # the corpus generator adds blank pages too
+    output = tmp_path / "out"
+    argv = [
+        "--inputs", str(source),
+        "--output-folder", str(output),
+        "--layout-mode", "imposed",
+        "--sheets-per-signature", "2",
+        "--tail-mode", "pad",
+    ]
+    assert booklet.main(argv) == 0
+
+    [signature] = output.glob("*.pdf")
+    pages = booklet.PdfReader(str(signature)).pages
+    assert len(pages) == 4
+    width, height = (float(value) for value in pages[0].mediabox[2:])
+    assert blank_pages_added == [(pytest.approx(width), pytest.approx(height))] * 2
+    assert [("/Contents" in page, [float(value) for value in page.mediabox]) for page in pages[2:]] == [
+        (False, [float(value) for value in pages[0].mediabox])
+    ] * 2
+
+
+def test_blank_reading_order_slots_are_blank_pages(tmp_path, make_pdf, blank_pages_added):
+    source = make_pdf("book.pdf", 3)
+    blank_pages_added.clear()
+    output = tmp_path / "out"
+    argv = [
+        "--inputs", str(source),
+        "--output-folder", str(output),
+        "--sheets-per-signature", "1",
+        "--tail-mode", "pad",
+        "--final-blank-placement", "back",
+    ]
+    assert booklet.main(argv) == 0
+
+    [signature] = output.glob("*.pdf")
+    pages = booklet.PdfReader(str(signature)).pages
+    assert len(pages) == 4 and len(blank_pages_added) == 1
+    assert "/Contents" not in pages[3]
+    assert pages[3].mediabox == pages[0].mediabox
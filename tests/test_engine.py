@@ -0,0 +1,31 @@
+import pytest
+
+import booklet_signatures_enhanced as booklet
+
+
+@pytest.mark.parametrize("as_stream", [False, True])
+def test_engine_builds_what_the_command_line_builds(tmp_path, make_pdf, masked, as_stream):
+    source = make_pdf("book.pdf", 12)
+    output = tmp_path / "out"
+    argv = ["--inputs", str(source), "--output-folder", str(output), "--layout-mode", "imposed"]
+    assert booklet.main(argv + ["--sheets-per-signature", "2"]) == 0
+
+    # A stream is named after its file, so /Source matches the path run.
+    with source.open("rb") as stream:
+        build = booklet.BookletEngine().build(
+            [stream if as_stream else source], layout_mode="imposed", sheets_per_signature=2
+        )
+    expected = {path.name: masked(path.read_bytes()) for path in output.glob("*.pdf")}
+    assert {name: masked(buffer.getvalue()) for name, buffer in build.outputs.items()} == expected
+    assert "book.pdf (12 pages)" in build.plan
+    assert [table.plan.index for table in build.tables] == [1, 2]
+
+
+def test_engine_reports_every_bad_input(tmp_path, make_pdf):
+    engine = booklet.BookletEngine()
+    with pytest.raises(booklet.BookletError) as raised:
+        engine.build([tmp_path / "missing.pdf", b"not a pdf", make_pdf("book.pdf", 4)])
+    message = str(raised.value)
+    assert message.startswith("2 problems found in the inputs:")
+    assert "missing.pdf" in message
+    assert "input02.pdf" in message
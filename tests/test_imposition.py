@@ -0,0 +1,119 @@
+import re
+
+import pytest
+
+import booklet_signatures_enhanced as booklet
+
+# Classic hand-imposition layouts, front side then back side, each in
+# row-major order as printed, with the rotation of every cell.
+FOLD_SCHEMES = {
+    2: ([4, 1, 2, 3], [0, 0, 0, 0]),
+    4: ([5, 4, 8, 1, 3, 6, 2, 7], [180, 180, 0, 0, 180, 180, 0, 0]),
+    8: (
+        [5, 12, 9, 8, 4, 13, 16, 1, 7, 10, 11, 6, 2, 15, 14, 3],
+        [180] * 4 + [0] * 4 + [180] * 4 + [0] * 4,
+    ),
+    16: (
+        [
+            5, 28, 29, 4, 12, 21, 20, 13, 9, 24, 17, 16, 8, 25, 32, 1,
+            3, 30, 27, 6, 14, 19, 22, 11, 15, 18, 23, 10, 2, 31, 26, 7,
+        ],
+        ([180] * 4 + [0] * 4) * 4,
+    ),
+}
+
+
+@pytest.mark.parametrize("pages_per_side", sorted(FOLD_SCHEMES))
+def test_fold_scheme_slots_and_rotations(pages_per_side):
+    scheme = booklet.fold_scheme(pages_per_side)
+    pages, rotations = FOLD_SCHEMES[pages_per_side]
+
+    assert scheme.rows * scheme.columns == pages_per_side
+    assert list(scheme.pages) == pages
+    assert list(scheme.rotations) == rotations
+
+
+@pytest.mark.parametrize("pages_per_side", sorted(FOLD_SCHEMES))
+def test_fold_scheme_backs_every_page_with_its_own_leaf(pages_per_side):
+    # The sheet turns over side to side, so the back of a front cell is the
+    # mirrored cell on the same row. Both faces belong to one leaf
+    # (pages 2n + 1 and 2n + 2) and are printed the same way up.
+    scheme = booklet.fold_scheme(pages_per_side)
+    assert sorted(scheme.pages) == list(range(1, scheme.pages_per_sheet + 1))
+    for index in range(pages_per_side):
+        row, column = divmod(index, scheme.columns)
+        back = pages_per_side + row * scheme.columns + scheme.columns - 1 - column
+        front_page, back_page = scheme.pages[index], scheme.pages[back]
+        assert sorted((front_page, back_page)) in ([n, n + 1] for n in range(1, scheme.pages_per_sheet, 2))
+        assert scheme.rotations[index] == scheme.rotations[back]
+
+
+def test_quarto_signature_nests_its_sheets():
+    tables = booklet.plan_book(
+        32,
+        layout_mode="imposed-nup",
+        sheets_per_signature=4,
+        tail_mode="pad",
+        final_blank_placement="back",
+        pages_per_side=4,
+    )
+    assert len(tables) == 1
+    sides = list(tables[0].sheet_sides())
+    # The outermost sheet carries the first and last pages.
+    assert sides[0] == (29, 4, 32, 1)
+    assert sides[1] == (3, 30, 2, 31)
+    assert sides[-2:] == [(17, 16, 20, 13), (15, 18, 14, 19)]
+    assert sorted(page for side in sides for page in side) == list(range(1, 33))
+
+
+def test_two_up_signature_pads_with_blanks_at_the_back():
+    tables = booklet.plan_book(
+        6,
+        layout_mode="imposed",
+        sheets_per_signature=2,
+        tail_mode="pad",
+        final_blank_placement="back",
+    )
+    assert list(tables[0].sheet_sides()) == [(0, 1), (2, 0), (6, 3), (4, 5)]
+    assert tables[0].output_pages("imposed") == 4
+
+
+def test_imposed_nup_output_prints_each_side_on_one_page(tmp_path, make_pdf):
+    source = make_pdf("book.pdf", 32)
+    output = tmp_path / "out"
+    argv = [
+        "--inputs", str(source),
+        "--output-folder", str(output),
+        "--layout-mode", "imposed-nup",
+        "--pages-per-side", "4",
+        "--sheets-per-signature", "4",
+    ]
+    assert booklet.main(argv) == 0
+
+    [signature] = sorted(output.glob("*.pdf"))
+    reader = booklet.PdfReader(str(signature))
+    assert len(reader.pages) == 8
+    first = booklet.PdfReader(str(source)).pages[0].mediabox
+    assert float(reader.pages[0].mediabox.width) == pytest.approx(2 * float(first.width))
+    assert float(reader.pages[0].mediabox.height) == pytest.approx(2 * float(first.height))
+    for page, side in zip(reader.pages[:2], [(29, 4, 32, 1), (3, 30, 2, 31)]):
+        labels = {int(label) for label in re.findall(r"text page (\d+)", page.extract_text())}
+        assert labels == set(side)
+
+
+def test_xobject_imposition_matches_merge(single_output, page_summary):
+    merged = single_output("imposed")
+    xobject = single_output("imposed", "--imposition-method", "xobject")
+    summary = page_summary(xobject)
+    assert summary == page_summary(merged)
+
+    pages = booklet.PdfReader(str(xobject)).pages
+    # Two sheets per signature: four sheet sides.
+    for first in range(0, len(pages), 4):
+        forms = []
+        for page in pages[first:first + 4]:
+            xobjects = page["/Resources"]["/XObject"].get_object()
+            assert xobjects and re.findall(r"/P\d+ Do", page.get_contents().get_data().decode("ascii"))
+            forms += [form.idnum for form in xobjects.values()]
+        # Every source page is drawn from its own Form XObject, once.
+        assert len(forms) == len(set(forms)) == sum(len(labels) for labels, _ in summary[first:first + 4])
@@ -0,0 +1,30 @@
+import booklet_signatures_enhanced as booklet
+
+
+def test_incremental_rebuilds_only_signatures_whose_pages_changed(tmp_path, make_pdf, pdf_bytes, capsys):
+    first = make_pdf("a.pdf", 8)
+    second = make_pdf("b.pdf", 8)
+    output = tmp_path / "out"
+    argv = ["--inputs", str(first), str(second), "--output-folder", str(output), "--sheets-per-signature", "1"]
+
+    assert booklet.main(argv + ["--incremental"]) == 0
+    stamps = {path.name: path.stat().st_mtime_ns for path in output.glob("*.pdf")}
+    assert len(stamps) == 4
+
+    # --overwrite only lets the plan file be replaced; the cache decides
+    # which signature files are rebuilt.
+    assert booklet.main(argv + ["--incremental", "--overwrite"]) == 0
+    assert "Unchanged signatures kept from the previous run: 4" in capsys.readouterr().out
+    assert {path.name: path.stat().st_mtime_ns for path in output.glob("*.pdf")} == stamps
+
+    # New content for the second half of the book only.
+    second.unlink()
+    make_pdf("b.pdf", 8, kind="vector")
+    assert booklet.main(argv + ["--incremental", "--overwrite"]) == 0
+    assert "Unchanged signatures kept from the previous run: 2" in capsys.readouterr().out
+    changed = sorted(path.name for path in output.glob("*.pdf") if path.stat().st_mtime_ns != stamps[path.name])
+    assert changed == ["book_sig03_reading_order.pdf", "book_sig04_reading_order.pdf"]
+
+    fresh = tmp_path / "fresh"
+    assert booklet.main(argv[:3] + ["--output-folder", str(fresh), "--sheets-per-signature", "1"]) == 0
+    assert pdf_bytes(output) == pdf_bytes(fresh)
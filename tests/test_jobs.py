@@ -0,0 +1,44 @@
+import pytest
+
+import booklet_signatures_enhanced as booklet
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ["--layout-mode", "reading-order"],
+        ["--layout-mode", "imposed"],
+        ["--layout-mode", "imposed", "--imposition-method", "xobject"],
+        ["--layout-mode", "imposed-nup", "--pages-per-side", "8"],
+    ],
+)
+def test_jobs_output_matches_serial_output(tmp_path, make_pdf, pdf_bytes, options):
+    inputs = [str(make_pdf("text.pdf", 20)), str(make_pdf("mixed.pdf", 13, kind="mixed-sizes"))]
+    outputs = {}
+    for jobs in ("1", "3"):
+        folder = tmp_path / f"jobs{jobs}"
+        argv = ["--inputs", *inputs, "--output-folder", str(folder), "--sheets-per-signature", "1", "--jobs", jobs]
+        assert booklet.main(argv + options) == 0
+        outputs[jobs] = pdf_bytes(folder)
+
+    assert len(outputs["1"]) >= 3
+    assert outputs["3"] == outputs["1"]
+
+
+@pytest.mark.parametrize(
+    "options, message",
+    [
+        (["--jobs", "0"], "--jobs must be at least 1."),
+        (["--write-threads", "-1"], "--write-threads must not be negative."),
+        (["--max-memory", "64M"], "--max-memory only applies to --output-mode single."),
+        (["--output-mode", "single", "--incremental"], "--incremental and --resume require --output-mode"),
+        (["--output-mode", "single", "--max-memory", "1M", "--optimize-output"], "combined with --max-memory"),
+    ],
+)
+def test_bad_option_combinations_fail_before_writing_anything(tmp_path, make_pdf, capsys, options, message):
+    output = tmp_path / "out"
+    with pytest.raises(SystemExit) as raised:
+        booklet.main(["--inputs", str(make_pdf("book.pdf", 8)), "--output-folder", str(output), *options])
+    assert raised.value.code == 2
+    assert message in capsys.readouterr().err
+    assert not output.exists()
@@ -0,0 +1,52 @@
+import json
+
+import booklet_signatures_enhanced as booklet
+
+
+def test_manifest_jobs_share_parsed_inputs(tmp_path, make_pdf, pdf_bytes, monkeypatch, capsys):
+    shared = make_pdf("shared.pdf", 12)
+    appendix = make_pdf("appendix.pdf", 4)
+    manifest = tmp_path / "books.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "defaults": {"output_folder": "out", "sheets_per_signature": 1},
+                "jobs": [
+                    {"inputs": [str(shared)], "base_name": "first"},
+                    {"inputs": [str(shared), str(appendix)], "base_name": "second"},
+                    {"inputs": [str(tmp_path / "missing.pdf")], "base_name": "broken"},
+                    {"inputs": [str(appendix), str(shared)], "base_name": "third", "layout_mode": "imposed"},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    opened = []
+    open_source = booklet.open_source
+
+    def counting_open_source(path, **options):
+        opened.append(path.name)
+        return open_source(path, **options)
+
+    monkeypatch.setattr(booklet, "open_source", counting_open_source)
+
+    # The broken job fails on its own; the others still run.
+    assert booklet.main(["--manifest", str(manifest)]) == 2
+    output = capsys.readouterr().out
+    assert "3 ok, 1 failed" in output
+    # Each input was parsed once for all the jobs that use it.
+    assert sorted(opened) == ["appendix.pdf", "shared.pdf"]
+
+    # The shared readers give the same files as separate runs.
+    built = pdf_bytes(tmp_path / "out")
+    assert len(built) > 6
+    for name, inputs, options in [
+        ("first", [shared], []),
+        ("second", [shared, appendix], []),
+        ("third", [appendix, shared], ["--layout-mode", "imposed"]),
+    ]:
+        folder = tmp_path / name
+        argv = ["--inputs", *map(str, inputs), "--output-folder", str(folder), "--base-name", name]
+        assert booklet.main([*argv, "--sheets-per-signature", "1", *options]) == 0
+        files = pdf_bytes(folder)
+        assert files and all(built[file_name] == data for file_name, data in files.items())
@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.mark.parametrize("layout_mode", ["reading-order", "imposed"])
+def test_max_memory_output_has_the_same_pages(single_output, page_summary, layout_mode):
+    # A tiny budget flushes every signature as its own batch.
+    assert page_summary(single_output(layout_mode, "--max-memory", "1K")) == page_summary(single_output(layout_mode))
+
+
+@pytest.mark.parametrize("budget, warned", [("1K", True), ("64G", False)])
+def test_max_memory_warns_when_the_peak_goes_over_the_budget(single_output, capsys, budget, warned):
+    single_output("imposed", "--max-memory", budget)
+    output = capsys.readouterr().out
+    assert ("over the --max-memory budget" in output) == warned
+    if warned:
+        # One signature is far bigger than a 1K budget on its own.
+        assert "alone is estimated at" in output
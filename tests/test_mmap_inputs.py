@@ -0,0 +1,41 @@
+import pytest
+
+import booklet_signatures_enhanced as booklet
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ["--layout-mode", "reading-order"],
+        ["--layout-mode", "imposed", "--output-mode", "single"],
+        ["--layout-mode", "imposed", "--imposition-method", "xobject"],
+    ],
+)
+def test_mmap_inputs_give_identical_output(tmp_path, make_pdf, pdf_bytes, options):
+    inputs = [str(make_pdf("text.pdf", 12)), str(make_pdf("images.pdf", 6, kind="images"))]
+    outputs = []
+    for mmap_option in ([], ["--mmap-inputs"]):
+        folder = tmp_path / ("mmap" if mmap_option else "read")
+        argv = ["--inputs", *inputs, "--output-folder", str(folder), "--sheets-per-signature", "1"]
+        assert booklet.main(argv + options + mmap_option) == 0
+        outputs.append(pdf_bytes(folder))
+
+    assert outputs[0] and outputs[1] == outputs[0]
+
+
+def test_source_cache_closes_the_map_of_a_dropped_source(make_pdf):
+    first, second, third = (make_pdf(f"{name}.pdf", 2) for name in ("first", "second", "third"))
+    cache = booklet.SourceCache(max_entries=1)
+    source = cache.load(first, use_mmap=True)
+    stream = source.reader.stream
+    assert isinstance(stream, booklet.mmap.mmap)
+
+    # Dropped from the cache while a book still reads from it: kept open.
+    cache.load(second, use_mmap=True)
+    assert not stream.closed
+    assert len(source.reader.pages) == 2
+
+    del source
+    cache.load(third, use_mmap=True)
+    assert stream.closed
+    assert len(cache) == 1
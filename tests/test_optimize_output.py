@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.mark.parametrize("layout_mode", ["reading-order", "imposed"])
+def test_optimized_output_has_the_same_pages_in_fewer_bytes(single_output, page_summary, layout_mode):
+    plain = single_output(layout_mode)
+    optimized = single_output(layout_mode, "--optimize-output")
+
+    assert page_summary(optimized) == page_summary(plain)
+    assert optimized.stat().st_size < plain.stat().st_size
+    assert b"/ObjStm" in optimized.read_bytes()
@@ -0,0 +1,63 @@
+import pytest
+
+import booklet_signatures_enhanced as booklet
+
+A5 = (419.53, 595.28)
+
+# Where a viewer shows the top-left corner of the page for each /Rotate:
+# (max x, max y) means the top-right corner of the placed page.
+TOP_LEFT_CORNER = {0: (min, max), 90: (max, max), 180: (max, min), 270: (min, min)}
+
+
+@pytest.mark.parametrize("rotate", [0, 90, 180, 270])
+@pytest.mark.parametrize(
+    "box",
+    [
+        (0, 0, *A5),
+        (0, 0, 595.28, 841.89),
+        (0, 0, 841.89, 595.28),
+        (30, 40, 30 + A5[0], 40 + A5[1]),
+        (-50, 0, 150, 300),
+    ],
+)
+def test_fit_transformation_turns_shrinks_and_centres_the_page(box, rotate):
+    cell_width, cell_height = A5
+    fit = booklet.fit_transformation(box, rotate, cell_width, cell_height)
+    left, bottom, right, top = box
+    if fit is None:
+        assert rotate == 0 and box == (0, 0, *A5)
+        return
+
+    corners = {(x, y): fit.apply_on((x, y)) for x in (left, right) for y in (bottom, top)}
+    xs = [x for x, _ in corners.values()]
+    ys = [y for _, y in corners.values()]
+    width, height = max(xs) - min(xs), max(ys) - min(ys)
+    upright_width, upright_height = (right - left, top - bottom) if rotate in (0, 180) else (top - bottom, right - left)
+
+    # Centred in the cell, inside it, never enlarged and not distorted.
+    assert (min(xs) + max(xs)) / 2 == pytest.approx(cell_width / 2)
+    assert (min(ys) + max(ys)) / 2 == pytest.approx(cell_height / 2)
+    assert width <= cell_width + 1e-6 and height <= cell_height + 1e-6
+    scale = width / upright_width
+    assert height / upright_height == pytest.approx(scale)
+    assert scale == pytest.approx(min(1.0, cell_width / upright_width, cell_height / upright_height))
+    # Turned clockwise, the way a viewer shows /Rotate.
+    pick_x, pick_y = TOP_LEFT_CORNER[rotate]
+    assert corners[(left, top)] == pytest.approx((pick_x(xs), pick_y(ys)))
+
+
+def test_pages_of_one_size_share_one_fit(make_pdf):
+    reader = booklet.PdfReader(str(make_pdf("mixed.pdf", 8, kind="mixed-sizes")))
+    pages = list(reader.pages)
+    pages[5].rotation = 90
+    geometry = booklet.PageGeometry(pages)
+    fits = geometry.fit_transformations(*A5)
+
+    # Pages 4 and 8 are A5 and are placed as they are.
+    assert fits[3] is None and fits[7] is None
+    # A4, Letter, landscape A5 and the turned Letter page 6 each get one
+    # transformation, shared by every page of that size.
+    assert fits[0] is fits[4] and fits[2] is fits[6]
+    assert len({id(fit) for fit in fits if fit is not None}) == 4
+    assert fits[5] is not fits[1]
+    assert fits[5].ctm == booklet.fit_transformation(tuple(geometry.trim[20:24]), 90, *A5).ctm
@@ -0,0 +1,68 @@
+from io import BytesIO
+
+import pytest
+from pypdf.generic import ArrayObject, NameObject
+
+import booklet_signatures_enhanced as booklet
+
+
+@pytest.mark.parametrize("dry_run", [True, False])
+def test_mismatched_pages_are_reported_before_generation(tmp_path, make_pdf, capsys, dry_run):
+    first = make_pdf("first.pdf", 4)
+    mixed = make_pdf("mixed.pdf", 8, kind="mixed-sizes")
+    argv = ["--inputs", str(first), str(mixed), "--output-folder", str(tmp_path / "out")]
+    if dry_run:
+        argv.append("--dry-run")
+
+    assert booklet.main(argv) == 0
+    output = capsys.readouterr().out
+    # Every mixed.pdf page that is not A5 is listed, before the files are.
+    mismatched = [f"mixed.pdf page {number} is" for number in (1, 2, 3, 5, 6, 7)]
+    warnings = output[: output.find("Generated files:")] if not dry_run else output
+    assert all(page in warnings for page in mismatched)
+    assert "mixed.pdf page 4 is" not in output
+    plan = (tmp_path / "out" / "book_signature_plan.txt").read_text(encoding="utf-8")
+    assert all(page in plan for page in mismatched)
+
+
+def test_scan_media_sizes_matches_pypdf(make_pdf):
+    reader = booklet.PdfReader(str(make_pdf("mixed.pdf", 8, kind="mixed-sizes")))
+    sizes = booklet.scan_media_sizes(reader, len(reader.pages))
+    expected = [float(value) for page in reader.pages for value in (page.mediabox.width, page.mediabox.height)]
+    assert list(sizes) == expected
+
+
+def inherit_media_boxes(writer):
+    # Pages 3, 6, ... take their /MediaBox from the root /Pages node.
+    root = writer.root_object["/Pages"].get_object()
+    root[NameObject("/MediaBox")] = ArrayObject(writer.pages[0]["/MediaBox"])
+    for page in writer.pages[2::3]:
+        del page["/MediaBox"]
+
+
+def indirect_media_boxes(writer):
+    for page in writer.pages[::2]:
+        page[NameObject("/MediaBox")] = booklet.add_indirect_object(writer, ArrayObject(page["/MediaBox"]))
+
+
+@pytest.mark.parametrize("change", [None, inherit_media_boxes, indirect_media_boxes])
+@pytest.mark.parametrize("object_streams", [False, True])
+def test_scan_media_sizes_fallbacks_match_pypdf(make_pdf, change, object_streams):
+    writer = booklet.PdfWriter(clone_from=str(make_pdf("mixed.pdf", 8, kind="mixed-sizes")))
+    if change is not None:
+        change(writer)
+    buffer = BytesIO()
+    if object_streams:
+        # Optimized output keeps the page dictionaries in object streams.
+        booklet.write_optimized_pdf(buffer, writer, booklet.OutputOptimization(optimize=True))
+    else:
+        writer.write(buffer)
+    reader = booklet.PdfReader(buffer)
+
+    # Scanned first: reader.pages copies inherited boxes into the pages.
+    sizes = booklet.scan_media_sizes(reader, booklet.page_tree_count(reader))
+    if object_streams:
+        assert booklet.read_raw_object(reader, reader.pages[0].indirect_reference) is None
+    expected = [float(value) for page in reader.pages for value in (page.mediabox.width, page.mediabox.height)]
+    assert list(sizes) == expected
+    assert len(set(zip(expected[::2], expected[1::2]))) > 1
@@ -0,0 +1,49 @@
+import re
+from io import BytesIO
+
+import pytest
+from pypdf.generic import ArrayObject, DictionaryObject, NameObject, NumberObject
+
+import booklet_signatures_enhanced as booklet
+
+
+def pages_node(writer, kids, count):
+    node = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Pages"),
+            NameObject("/Kids"): ArrayObject(kids),
+            NameObject("/Count"): NumberObject(count),
+        }
+    )
+    node_ref = booklet.add_indirect_object(writer, node)
+    for kid in kids:
+        kid.get_object()[NameObject("/Parent")] = node_ref
+    return node_ref
+
+
+@pytest.fixture
+def nested_reader(make_pdf):
+    # Root kids: a node with pages 1 and 2, page 3, then an empty node. The
+    # root /Count equals its number of kids although only one is a leaf.
+    writer = booklet.PdfWriter(clone_from=str(make_pdf("book.pdf", 3)))
+    first, second, third = (page.indirect_reference for page in writer.pages)
+    root = writer.root_object["/Pages"].get_object()
+    kids = [pages_node(writer, [first, second], 2), third, pages_node(writer, [], 0)]
+    root[NameObject("/Kids")] = ArrayObject(kids)
+    root[NameObject("/Count")] = NumberObject(3)
+    for kid in kids:
+        kid.get_object()[NameObject("/Parent")] = root.indirect_reference
+    buffer = BytesIO()
+    writer.write(buffer)
+    return booklet.PdfReader(buffer)
+
+
+def labels(pages):
+    return [re.findall(r"text page \d+", page.extract_text()) for page in pages]
+
+
+@pytest.mark.parametrize("first, last", [(0, 3), (1, 2), (1, 3), (2, 3), (0, 1)])
+def test_read_source_pages_walks_a_nested_tree_with_an_empty_node(nested_reader, first, last):
+    pages = booklet.read_source_pages(nested_reader, first, last)
+    assert labels(pages) == [[f"text page {number}"] for number in range(first + 1, last + 1)]
+    assert labels(pages) == labels(nested_reader.pages[first:last])
@@ -0,0 +1,83 @@
+import csv
+import json
+
+import booklet_signatures_enhanced as booklet
+
+
+def write_plan(tmp_path, inputs, plan_format):
+    output = tmp_path / plan_format
+    argv = [
+        "--inputs", *map(str, inputs),
+        "--output-folder", str(output),
+        "--layout-mode", "imposed",
+        "--sheets-per-signature", "2",
+        "--plan-format", plan_format,
+        "--dry-run",
+    ]
+    assert booklet.main(argv) == 0
+    return output / f"book_signature_plan.{plan_format}"
+
+
+def test_json_and_csv_plans_match_the_imposition_tables(tmp_path, make_pdf):
+    inputs = [make_pdf("a.pdf", 6), make_pdf("mixed.pdf", 7, kind="mixed-sizes")]
+    tables = booklet.plan_book(
+        13, layout_mode="imposed", sheets_per_signature=2, tail_mode="short", final_blank_placement="back"
+    )
+    sides = [side for table in tables for side in table.sheet_sides()]
+
+    plan = json.loads(write_plan(tmp_path, inputs, "json").read_text(encoding="utf-8"))
+    assert [(entry["path"], entry["pages"]) for entry in plan["inputs"]] == [(str(inputs[0]), 6), (str(inputs[1]), 7)]
+    sheets = [sheet for signature in plan["signatures"] for sheet in signature["sheets"]]
+    # Blanks are null in JSON and empty in CSV.
+    assert [tuple(page or 0 for page in sheet[side]) for sheet in sheets for side in ("front", "back")] == sides
+    assert any("mixed.pdf page 1 is" in warning for warning in plan["warnings"])
+
+    with write_plan(tmp_path, inputs, "csv").open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [int(row["book_page"] or 0) for row in rows] == [page for side in sides for page in side]
+    for row in rows:
+        book_page = int(row["book_page"] or 0)
+        if not book_page:
+            assert not row["source"]
+        elif book_page <= 6:
+            assert (row["source"], int(row["source_page"])) == ("a.pdf", book_page)
+        else:
+            assert (row["source"], int(row["source_page"])) == ("mixed.pdf", book_page - 6)
+
+
+def test_imposition_export_extends_the_json_plan(tmp_path, make_pdf):
+    output = tmp_path / "out"
+    argv = [
+        "--inputs", str(make_pdf("book.pdf", 21)),
+        "--output-folder", str(output),
+        "--layout-mode", "imposed-nup",
+        "--pages-per-side", "4",
+        "--sheets-per-signature", "2",
+        "--tail-mode", "pad",
+        "--plan-format", "json",
+        "--export-imposition",
+        "--dry-run",
+    ]
+    assert booklet.main(argv) == 0
+    plan = json.loads((output / "book_signature_plan.json").read_text(encoding="utf-8"))
+    export = json.loads((output / "book_imposition.json").read_text(encoding="utf-8"))
+    tables = booklet.plan_book(
+        21,
+        layout_mode="imposed-nup",
+        sheets_per_signature=2,
+        tail_mode="pad",
+        final_blank_placement="back",
+        pages_per_side=4,
+    )
+
+    assert export["settings"] == plan["settings"]
+    assert export["settings"]["grid"] == {"rows": 2, "columns": 2}
+    assert len(export["signatures"]) == len(tables) == 2
+    for record, entry, table in zip(export["signatures"], plan["signatures"], tables):
+        slots = record.pop("slots")
+        assert record == entry
+        assert slots == [page or None for page in table.slots.tolist()]
+        # Every sheet side holds the pages of the slots its cells print.
+        for sheet, first in zip(record["sheets"], range(0, len(table.sides), 8)):
+            assert sheet["front"] + sheet["back"] == [slots[slot] for slot in table.sides[first:first + 8]]
+    assert export["signatures"][-1]["blank_pages"] == 11
@@ -0,0 +1,55 @@
+import pytest
+from pypdf.generic import ArrayObject, FloatObject, NameObject
+
+import booklet_signatures_enhanced as booklet
+
+
+@pytest.fixture
+def bad_inputs(tmp_path, make_pdf):
+    good = make_pdf("good.pdf", 4)
+
+    notes = tmp_path / "inputs" / "notes.txt"
+    notes.write_text("not a pdf", encoding="utf-8")
+    broken = tmp_path / "inputs" / "broken.pdf"
+    broken.write_bytes(b"%PDF-1.7\nthis is not a PDF body\n")
+
+    writer = booklet.PdfWriter(clone_from=str(good))
+    writer.encrypt("secret")
+    encrypted = tmp_path / "inputs" / "encrypted.pdf"
+    writer.write(encrypted)
+
+    writer = booklet.PdfWriter(clone_from=str(good))
+    for page in writer.pages[1:3]:
+        page[NameObject("/MediaBox")] = ArrayObject(FloatObject(0) for _ in range(4))
+    empty_boxes = tmp_path / "inputs" / "empty-boxes.pdf"
+    writer.write(empty_boxes)
+
+    missing = tmp_path / "inputs" / "missing.pdf"
+    return [good, missing, notes, broken, good, encrypted, empty_boxes]
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_preflight_reports_every_bad_input_in_one_run(tmp_path, bad_inputs, capsys, dry_run):
+    output = tmp_path / "out"
+    argv = ["--inputs", *map(str, bad_inputs), "--output-folder", str(output)]
+    if dry_run:
+        argv.append("--dry-run")
+
+    assert booklet.main(argv) == 2
+    error = capsys.readouterr().err
+    assert error.startswith("Error: 5 problems found in the inputs:")
+    problems = [line for line in error.splitlines() if line.startswith("- ")]
+    assert len(problems) == 5
+    # In input order; the good input listed twice is not a problem.
+    for problem, expected in zip(
+        problems,
+        [
+            "Input file not found:",
+            "Input file is not a PDF:",
+            "broken.pdf",
+            "Input PDF is encrypted and needs a password:",
+            "empty-boxes.pdf page 2 has an empty /MediaBox (0 x 0 pt), and so do 1 more of its pages.",
+        ],
+    ):
+        assert expected in problem
+    assert not any(output.glob("*"))
@@ -0,0 +1,87 @@
+import re
+
+import pytest
+
+import booklet_signatures_enhanced as booklet
+
+
+def side_labels(page):
+    return sorted(int(label) for label in re.findall(r"text page (\d+)", page.extract_text()))
+
+
+@pytest.fixture
+def imposed_book(tmp_path, make_pdf):
+    # 16 pages in four one-sheet signatures, printed into a single PDF.
+    source = make_pdf("book.pdf", 16)
+
+    def run(*options):
+        output = tmp_path / ("".join(options).replace("-", "") or "plain")
+        argv = [
+            "--inputs", str(source),
+            "--output-folder", str(output),
+            "--layout-mode", "imposed",
+            "--sheets-per-signature", "1",
+            "--output-mode", "single",
+            *options,
+        ]
+        assert booklet.main(argv) == 0
+        return booklet.PdfReader(str(output / "book_all_signatures_imposed.pdf"))
+
+    return run
+
+
+def test_copies_repeat_each_signature_and_share_its_sheet_sides(imposed_book):
+    plain = imposed_book()
+    copies = imposed_book("--copies", "3")
+
+    assert len(copies.pages) == 3 * len(plain.pages) == 24
+    expected = [side_labels(page) for page in plain.pages]
+    # Signature by signature: both sides of its sheet, three times over.
+    assert [side_labels(page) for page in copies.pages] == [
+        expected[index + side] for index in range(0, 8, 2) for _ in range(3) for side in (0, 1)
+    ]
+    # Every copy draws the same Form XObjects.
+    forms = [list(page["/Resources"]["/XObject"].get_object().values()) for page in copies.pages[:6]]
+    assert forms[0] and forms[0::2] == [forms[0]] * 3
+    assert forms[1] and forms[1::2] == [forms[1]] * 3
+
+
+def test_gang_puts_two_signatures_on_every_press_sheet(imposed_book):
+    plain = imposed_book()
+    gang = imposed_book("--gang")
+
+    assert len(gang.pages) == len(plain.pages) // 2
+    assert float(gang.pages[0].mediabox.height) == pytest.approx(2 * float(plain.pages[0].mediabox.height))
+    expected = [side_labels(page) for page in plain.pages]
+    # Sheet sides of signatures 1 and 2 share a press sheet, then 3 and 4.
+    assert [side_labels(page) for page in gang.pages] == [
+        sorted(expected[first + side] + expected[first + 2 + side]) for first in (0, 4) for side in (0, 1)
+    ]
+
+
+def test_copies_need_an_imposed_layout(make_pdf, tmp_path, capsys):
+    argv = ["--inputs", str(make_pdf("book.pdf", 4)), "--output-folder", str(tmp_path / "out"), "--copies", "2"]
+    with pytest.raises(SystemExit) as raised:
+        booklet.main(argv)
+    assert raised.value.code == 2
+    assert "--copies and --gang need --layout-mode imposed or imposed-nup." in capsys.readouterr().err
+
+
+def test_gang_needs_a_second_signature_on_the_press_sheet(make_pdf, tmp_path, capsys):
+    argv = [
+        "--inputs", str(make_pdf("book.pdf", 16)),
+        "--output-folder", str(tmp_path / "out"),
+        "--layout-mode", "imposed",
+        "--gang",
+    ]
+    with pytest.raises(SystemExit) as raised:
+        booklet.main(argv)
+    assert raised.value.code == 2
+    assert "--gang needs --output-mode single or --copies 2 or more." in capsys.readouterr().err
+    assert not (tmp_path / "out").exists()
+
+    # Two copies of each signature fill every press sheet.
+    assert booklet.main([*argv, "--copies", "2"]) == 0
+    for signature in sorted((tmp_path / "out").glob("*.pdf")):
+        pages = booklet.PdfReader(str(signature)).pages
+        assert all(len(page["/Resources"]["/XObject"].get_object()) == 2 for page in pages)
@@ -0,0 +1,27 @@
+import json
+import tracemalloc
+
+import booklet_signatures_enhanced as booklet
+
+
+def test_profile_report_stops_the_tracing_it_started(tmp_path, make_pdf):
+    source = make_pdf("book.pdf", 8)
+    output = tmp_path / "out"
+    assert not tracemalloc.is_tracing()
+
+    assert booklet.main(["--inputs", str(source), "--output-folder", str(output), "--profile"]) == 0
+    assert not tracemalloc.is_tracing()
+    report = json.loads((output / "book_profile.json").read_text(encoding="utf-8"))
+    assert "generate_outputs" in [stage["stage"] for stage in report["stages"]]
+
+
+def test_profile_report_leaves_outside_tracing_running(tmp_path):
+    tracemalloc.start()
+    try:
+        profiler = booklet.RunProfiler()
+        with profiler.stage("load_sources"):
+            pass
+        profiler.write_report(tmp_path / "profile.json", options={}, total_input_pages=0)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
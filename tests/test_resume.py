@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+import booklet_signatures_enhanced as booklet
+
+
+@pytest.fixture
+def imposed(monkeypatch):
+    # Signature numbers imposed in this process, optionally stopping the run
+    # with a KeyboardInterrupt once ``stop_after`` signatures are done.
+    calls = {"indexes": [], "stop_after": None}
+    impose_signature = booklet.impose_signature
+
+    def recording_impose_signature(job, **kwargs):
+        if len(calls["indexes"]) == calls["stop_after"]:
+            raise KeyboardInterrupt
+        calls["indexes"].append(job.plan.index)
+        return impose_signature(job, **kwargs)
+
+    monkeypatch.setattr(booklet, "impose_signature", recording_impose_signature)
+    return calls
+
+
+@pytest.mark.parametrize("write_threads", ["0", "2"])
+def test_resume_skips_signatures_finished_before_an_interrupt(tmp_path, make_pdf, pdf_bytes, imposed, write_threads):
+    source = make_pdf("book.pdf", 40)
+    output = tmp_path / "out"
+    argv = [
+        "--inputs", str(source),
+        "--output-folder", str(output),
+        "--sheets-per-signature", "1",
+        "--write-threads", write_threads,
+        "--resume",
+    ]
+
+    imposed["stop_after"] = 4
+    assert booklet.main(argv) == 130
+    # Writes still queued when the run stopped are cancelled; every
+    # signature that reached the disk is recorded as finished, and the rest
+    # are listed as still to be written.
+    checkpoint = json.loads((output / "book_checkpoint.json").read_text(encoding="utf-8"))
+    written = sorted(path.name for path in output.glob("book_sig*.pdf"))
+    finished = sorted(name for name, entry in checkpoint["signatures"].items() if entry["file"] is not None)
+    assert finished == written
+    assert 2 <= len(written) <= 4
+    assert len(checkpoint["signatures"]) == 10
+
+    imposed["indexes"].clear()
+    imposed["stop_after"] = None
+    assert booklet.main(argv) == 0
+    assert imposed["indexes"] == list(range(len(written) + 1, 11))
+
+    fresh = tmp_path / "fresh"
+    assert booklet.main([*argv[:2], "--output-folder", str(fresh), *argv[4:]]) == 0
+    assert pdf_bytes(output) == pdf_bytes(fresh)
+
+
+def test_resume_rebuilds_signatures_changed_on_disk(tmp_path, make_pdf, imposed):
+    source = make_pdf("book.pdf", 16)
+    output = tmp_path / "out"
+    argv = ["--inputs", str(source), "--output-folder", str(output), "--sheets-per-signature", "1", "--resume"]
+    assert booklet.main(argv) == 0
+
+    (output / "book_sig02_reading_order.pdf").write_bytes(b"truncated")
+    (output / "book_sig03_reading_order.pdf").unlink()
+    imposed["indexes"].clear()
+    assert booklet.main(argv) == 0
+    assert imposed["indexes"] == [2, 3]
+
+
+def test_resume_does_not_replace_another_books_files(tmp_path, make_pdf, pdf_bytes, capsys):
+    output = tmp_path / "out"
+    first = ["--inputs", str(make_pdf("book.pdf", 40)), "--output-folder", str(output)]
+    assert booklet.main(first) == 0
+    before = pdf_bytes(output)
+    plan = (output / "book_signature_plan.txt").read_bytes()
+
+    other = ["--inputs", str(make_pdf("other.pdf", 8)), "--output-folder", str(output), "--resume"]
+    assert booklet.main(other) == 2
+    assert "Output file already exists" in capsys.readouterr().err
+    assert pdf_bytes(output) == before
+    assert (output / "book_signature_plan.txt").read_bytes() == plan
+
+    # Nor does a checkpoint left by another book.
+    assert booklet.main([*first, "--resume", "--overwrite"]) == 0
+    assert booklet.main(other) == 2
+    assert pdf_bytes(output) == before
@@ -0,0 +1,132 @@
+import io
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import booklet_service
+import booklet_signatures_enhanced as booklet
+
+SCRIPT = Path(booklet.__file__).resolve()
+
+
+def test_serve_builds_a_zip_and_frees_its_port_on_sigterm(make_pdf):
+    source = make_pdf("book.pdf", 12)
+    process = subprocess.Popen(
+        [sys.executable, str(SCRIPT), "serve", "--port", "0", "--workers", "1"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        banner = process.stdout.readline()
+        url = banner.split()[2]
+        client = booklet_service.BookletServiceClient(url, timeout=60)
+        archive = zipfile.ZipFile(io.BytesIO(client.impose([source], layout_mode="imposed", sheets_per_signature=1)))
+        assert archive.namelist() == [
+            "book_sig01_imposed.pdf",
+            "book_sig02_imposed.pdf",
+            "book_sig03_imposed.pdf",
+            "book_signature_plan.txt",
+        ]
+        assert client.metrics()["requests_completed"] == 1
+
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=30) == 0
+    finally:
+        process.kill()
+        process.wait()
+
+    # No worker outlives the server holding the listening socket, so a new
+    # server (which sets SO_REUSEADDR too) can listen on the port again.
+    port = int(url.rsplit(":", 1)[1])
+    with socket.socket() as probe:
+        probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        probe.bind(("127.0.0.1", port))
+        probe.listen()
+
+
+def test_service_build_options_checks_every_option():
+    options = booklet_service.service_build_options({"layout_mode": "imposed", "gang": "off", "auto_signature": "1"})
+    assert (options["layout_mode"], options["gang"], options["auto_signature"]) == ("imposed", False, True)
+    with pytest.raises(booklet.BookletError, match="Unknown options: colour"):
+        booklet_service.service_build_options({"colour": "red"})
+    with pytest.raises(booklet.BookletError, match="Invalid options"):
+        booklet_service.service_build_options({"layout_mode": "sideways"})
+
+
+def test_parse_uploads_splits_files_from_options():
+    body = (
+        b"--b\r\nContent-Disposition: form-data; name=\"layout_mode\"\r\n\r\nimposed\r\n"
+        b"--b\r\nContent-Disposition: form-data; name=\"inputs\"; filename=\"../a.pdf\"\r\n"
+        b"Content-Type: application/pdf\r\n\r\n%PDF-a\r\n"
+        b"--b--\r\n"
+    )
+    options = {}
+    assert booklet_service.parse_uploads("multipart/form-data; boundary=b", body, options) == [("a.pdf", b"%PDF-a")]
+    assert options == {"layout_mode": "imposed"}
+
+    options = {"name": "one.pdf"}
+    assert booklet_service.parse_uploads("application/pdf", b"%PDF-b", options) == [("one.pdf", b"%PDF-b")]
+    with pytest.raises(booklet.BookletError, match="multipart/form-data"):
+        booklet_service.parse_uploads("text/plain", b"", {})
+
+
+@pytest.fixture
+def service():
+    # One worker and no queue, so a single admitted request fills it.
+    service = booklet_service.BookletService(workers=1, queue_depth=0, max_request_size=100_000)
+    server = booklet_service.BookletHTTPServer(("127.0.0.1", 0), service)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield service, f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+def raw_request(url, request):
+    host, port = url.rsplit("/", 1)[1].split(":")
+    with socket.create_connection((host, int(port)), timeout=30) as connection:
+        connection.sendall(request)
+        return connection.makefile("rb").read().decode("utf-8")
+
+
+def test_service_answers_bad_requests_without_building(service, make_pdf):
+    service, url = service
+    client = booklet_service.BookletServiceClient(url, timeout=30)
+
+    # Refused from the headers alone, before the body is sent.
+    response = raw_request(url, b"POST /impose HTTP/1.1\r\nHost: x\r\nContent-Length: 999999999\r\n\r\n")
+    assert response.startswith("HTTP/1.1 413")
+
+    with pytest.raises(booklet.BookletError, match="Service answered 400: The request contains no PDF files."):
+        client.impose([], layout_mode="imposed")
+    with pytest.raises(booklet.BookletError, match="Service answered 400: Unknown options: colour"):
+        client.impose([make_pdf("book.pdf", 2)], colour="red")
+
+    # While the only slot is taken, requests are turned away.
+    assert service.try_admit()
+    response = raw_request(url, b"POST /impose HTTP/1.1\r\nHost: x\r\nContent-Length: 0\r\n\r\n")
+    assert response.startswith("HTTP/1.1 429") and "Retry-After: 1" in response
+    service.withdraw()
+
+    metrics = client.metrics()
+    assert (metrics["requests_accepted"], metrics["requests_rejected"], metrics["requests_failed"]) == (3, 1, 3)
+    assert metrics["running"] == metrics["queue_length"] == 0
+
+
+def test_service_reports_build_errors_as_422(service, tmp_path):
+    _, url = service
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    client = booklet_service.BookletServiceClient(url, timeout=60)
+    with pytest.raises(booklet.BookletError, match="Service answered 422: .*broken.pdf"):
+        client.impose([broken])
+    assert client.metrics()["requests_failed"] == 1
@@ -0,0 +1,72 @@
+import itertools
+import math
+
+import pytest
+
+import booklet_signatures_enhanced as booklet
+
+
+def best_sizes(total_book_pages, min_sheets, max_sheets, pages_per_sheet):
+    # Brute force: the fewest sheets any mix of min..max sheet signatures can
+    # hold the book in, then the fewest signatures giving that many sheets.
+    needed = math.ceil(total_book_pages / pages_per_sheet)
+    for total_sheets in itertools.count(needed):
+        for count in range(1, total_sheets + 1):
+            if count * min_sheets <= total_sheets <= count * max_sheets:
+                return total_sheets, count
+
+
+@pytest.mark.parametrize("pages_per_sheet", [4, 8, 16])
+@pytest.mark.parametrize("min_sheets, max_sheets", [(1, 1), (1, 4), (3, 5), (4, 6), (5, 5), (6, 8)])
+def test_solve_signature_sizes_needs_the_fewest_sheets_and_signatures(min_sheets, max_sheets, pages_per_sheet):
+    for total_book_pages in range(1, 200):
+        sizes = booklet.solve_signature_sizes(total_book_pages, min_sheets, max_sheets, pages_per_sheet)
+
+        assert all(min_sheets <= size <= max_sheets for size in sizes)
+        assert (sum(sizes), len(sizes)) == best_sizes(total_book_pages, min_sheets, max_sheets, pages_per_sheet)
+        # Split as evenly as possible, larger signatures first.
+        assert max(sizes) - min(sizes) <= 1
+        assert sizes == sorted(sizes, reverse=True)
+
+
+@pytest.mark.parametrize(
+    "total_book_pages, min_sheets, max_sheets, expected",
+    [
+        (100, 3, 5, [5, 5, 5, 5, 5]),
+        (90, 4, 6, [6, 6, 6, 5]),
+        (10, 4, 6, [4]),
+        (68, 4, 4, [4, 4, 4, 4, 4]),
+    ],
+)
+def test_solve_signature_sizes_examples(total_book_pages, min_sheets, max_sheets, expected):
+    assert booklet.solve_signature_sizes(total_book_pages, min_sheets, max_sheets) == expected
+
+
+@pytest.mark.parametrize(
+    "min_sheets, max_sheets, total_book_pages, message",
+    [
+        (0, 4, 10, "--min-sheets-per-signature"),
+        (4, 3, 10, "--max-sheets-per-signature"),
+        (1, 4, 0, "no book pages"),
+    ],
+)
+def test_solve_signature_sizes_rejects_bad_limits(min_sheets, max_sheets, total_book_pages, message):
+    with pytest.raises(booklet.BookletError, match=message):
+        booklet.solve_signature_sizes(total_book_pages, min_sheets, max_sheets)
+
+
+def test_auto_signature_plan_places_the_blanks_in_the_last_signature():
+    tables = booklet.plan_book(
+        90,
+        layout_mode="imposed",
+        sheets_per_signature=4,
+        tail_mode="pad",
+        final_blank_placement="back",
+        auto_signature=True,
+        min_sheets_per_signature=4,
+        max_sheets_per_signature=6,
+    )
+    assert [table.plan.sheets for table in tables] == [6, 6, 6, 5]
+    assert [table.plan.blank_pages for table in tables] == [0, 0, 0, 2]
+    assert tables[-1].slots[-2:].tolist() == [0, 0]
+    assert [table.plan.start_book_page for table in tables] == [1, 25, 49, 73]
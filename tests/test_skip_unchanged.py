@@ -0,0 +1,22 @@
+import booklet_signatures_enhanced as booklet
+
+
+def test_skip_unchanged_leaves_identical_outputs_alone(tmp_path, make_pdf, capsys):
+    source = make_pdf("book.pdf", 16)
+    output = tmp_path / "out"
+    argv = [
+        "--inputs", str(source),
+        "--output-folder", str(output),
+        "--sheets-per-signature", "2",
+        "--overwrite",
+        "--skip-unchanged",
+    ]
+    assert booklet.main(argv) == 0
+    first_run = {path.name: (path.stat().st_mtime_ns, path.read_bytes()) for path in output.glob("*.pdf")}
+    assert len(first_run) == 2
+
+    assert booklet.main(argv) == 0
+    assert "Outputs identical to the existing files, left untouched: 2" in capsys.readouterr().out
+    assert {path.name: (path.stat().st_mtime_ns, path.read_bytes()) for path in output.glob("*.pdf")} == first_run
+    # No temporary files from the atomic writes are left behind.
+    assert sorted(path.name for path in output.iterdir()) == sorted([*first_run, "book_signature_plan.txt"])
@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import pytest
+
+import booklet_watch
+
+
+class StopPolling(Exception):
+    pass
+
+
+class FakeClock:
+    # Stands in for the time module: each sleep() advances the clock and
+    # applies the file changes scheduled for the new time.
+    def __init__(self, stamps, changes, stop_at=60.0):
+        self.now = 0.0
+        self.stamps = stamps
+        self.changes = sorted(changes, key=lambda change: change[0])
+        self.stop_at = stop_at
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        while self.changes and self.changes[0][0] <= self.now:
+            _, path, stamp = self.changes.pop(0)
+            self.stamps[path] = stamp
+        if self.now >= self.stop_at:
+            raise StopPolling
+
+
+@pytest.fixture
+def fake_files(monkeypatch):
+    stamps = {}
+
+    def install(changes, stop_at=60.0):
+        clock = FakeClock(stamps, changes, stop_at)
+        monkeypatch.setattr(booklet_watch, "time", clock)
+        return clock
+
+    monkeypatch.setattr(booklet_watch, "file_stamp", lambda path: stamps.get(path))
+    return stamps, install
+
+
+def test_watcher_reports_a_change_once_the_file_stops_changing(fake_files):
+    stamps, install = fake_files
+    chapter, other = Path("chapter.pdf"), Path("other.pdf")
+    stamps.update({chapter: (1, 100), other: (1, 50)})
+    watcher = booklet_watch.PollingWatcher(interval=1.0, debounce=3.0)
+    watcher.track({chapter, other})
+    # The chapter is still being copied at 2 and 3 seconds.
+    clock = install([(2, chapter, (2, 200)), (3, chapter, (3, 300))])
+
+    assert watcher.wait_for_changes(lambda: {chapter, other}) == {chapter}
+    assert clock.now == 6.0
+    assert watcher.stamps == {chapter: (3, 300), other: (1, 50)}
+
+
+def test_watcher_picks_up_new_and_deleted_files(fake_files):
+    stamps, install = fake_files
+    chapter, added = Path("chapter.pdf"), Path("added.pdf")
+    stamps[chapter] = (1, 100)
+    watcher = booklet_watch.PollingWatcher(interval=1.0, debounce=0.0)
+    watcher.track({chapter})
+    install([(1, added, (1, 10))])
+    assert watcher.wait_for_changes(lambda: {chapter, added}) == {added}
+
+    install([(1, chapter, None)])
+    assert watcher.wait_for_changes(lambda: {added}) == {chapter}
+    assert watcher.stamps == {added: (1, 10)}
+
+
+def test_watcher_ignores_a_change_undone_within_the_debounce(fake_files):
+    stamps, install = fake_files
+    chapter = Path("chapter.pdf")
+    stamps[chapter] = (1, 100)
+    watcher = booklet_watch.PollingWatcher(interval=1.0, debounce=3.0)
+    watcher.track({chapter})
+    install([(1, chapter, (2, 200)), (2, chapter, (1, 100))], stop_at=20.0)
+
+    with pytest.raises(StopPolling):
+        watcher.wait_for_changes(lambda: {chapter})
+    assert watcher.stamps == {chapter: (1, 100)}
@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+import booklet_signatures_enhanced as booklet
+
+
+def failing(message, started=None):
+    def write():
+        if started is not None:
+            started.set()
+        raise OSError(message)
+
+    return write
+
+
+def test_write_pipeline_keeps_submission_order_and_raises_the_first_failure():
+    release = threading.Event()
+
+    def slow(value):
+        release.wait(5)
+        return value
+
+    with pytest.raises(OSError, match="disk full"):
+        with booklet.WritePipeline(2, depth=4) as pipeline:
+            pipeline.submit(lambda: slow(1))
+            pipeline.submit(lambda: 2)
+            pipeline.submit(failing("disk full"))
+            # Nothing is handed over before the first write is done.
+            assert list(pipeline.drain_ready()) == []
+            release.set()
+            results = pipeline.results()
+            assert next(results) == 1
+            assert next(results) == 2
+            next(results)
+
+
+def test_write_pipeline_submit_raises_an_earlier_failure():
+    started = threading.Event()
+    with pytest.raises(OSError, match="disk full"):
+        with booklet.WritePipeline(1) as pipeline:
+            pipeline.submit(failing("disk full", started))
+            started.wait(5)
+            # Only one slot: this waits for the failed write, then raises it.
+            pipeline.submit(lambda: None)
+
+
+def test_write_thread_failure_stops_the_run(tmp_path, make_pdf, monkeypatch):
+    write_pdf_to = booklet.write_pdf_to
+    calls = []
+
+    def write_pdf_to_failing_once(handle, writer, *args, **kwargs):
+        calls.append(handle)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        write_pdf_to(handle, writer, *args, **kwargs)
+
+    monkeypatch.setattr(booklet, "write_pdf_to", write_pdf_to_failing_once)
+    output = tmp_path / "out"
+    argv = [
+        "--inputs", str(make_pdf("book.pdf", 40)),
+        "--output-folder", str(output),
+        "--sheets-per-signature", "1",
+        "--write-threads", "2",
+    ]
+    with pytest.raises(OSError, match="disk full"):
+        booklet.main(argv)
+
+    # Every write started before the failure finished or was cleaned up.
+    files = sorted(path.name for path in output.iterdir() if path.suffix in (".pdf", ".part"))
+    assert files and all(name.endswith(".pdf") and not name.startswith(".") for name in files)
+    assert len(files) < 10